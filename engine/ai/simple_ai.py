@@ -1,13 +1,29 @@
-import time
 from math import hypot
 import pygame
 
+from engine.timing.clock import now_ms
+from engine.rules.court_model import default_court
+
 try:
     from engine.utils.screen import screen_to_world
 except Exception:
     screen_to_world = None
 
 
+class _SimKeys:
+    """Vista tipo pygame.key.get_pressed() sobre el dict de decisión (sin swing = sostener)."""
+    __slots__ = ("keys", "blocked")
+
+    def __init__(self):
+        self.keys = {}
+        self.blocked = None
+
+    def __getitem__(self, key):
+        if key == self.blocked:
+            return False
+        return self.keys.get(key, False)
+
+
 class SimpleTennisAI:
     def __init__(
         self,
@@ -15,14 +31,31 @@ class SimpleTennisAI:
         ball,
         side: str = "top",
         react_ms: int = 40, #Cuanto más bajo, más rápido
+        use_prediction: bool = False,
     ):
         self.player = player
         self.ball = ball
         self.side = side
         self.react_ms = react_ms
-        self._next_tick = time.time() + self.react_ms / 1000.0
+        self.use_prediction = use_prediction  # anticipar el pique (x) con Ball.predict()
+        self._next_tick = self._now() + self.react_ms / 1000.0
         self.has_hit_this_turn = False
         self.last_ball_side = None
+        self._last_keys = {}  # última decisión (se sostiene entre reacciones)
+        # Vista reutilizada entre ticks (sin alocar clases/objetos por llamada)
+        self._view = _SimKeys()
+
+        # Teclas según el jugador controlado (P2: WASD + F, P1: flechas + Espacio)
+        if getattr(player, "is_player2", True):
+            self.k_up, self.k_down, self.k_left, self.k_right = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+            self.k_swing = pygame.K_f
+        else:
+            self.k_up, self.k_down, self.k_left, self.k_right = pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT
+            self.k_swing = pygame.K_SPACE
+
+    def _now(self) -> float:
+        """Segundos de tiempo de simulación (reloj del juego del jugador)."""
+        return now_ms(getattr(self.player, "game", None)) / 1000.0
 
     def _read_ball_world(self):
         if self.ball is None:
@@ -42,32 +75,50 @@ class SimpleTennisAI:
             return float(self.player.world_x), float(self.player.world_y)
         return 0, 0
 
+    def _predicted_landing(self, now_s: float, net_y: float):
+        """
+        Próximo pique de la pelota en el lado propio (coords de la IA), o None.
+        La IA ve el mundo desplazado: x_ia = x_pelota + ANCHO // 2, y_ia = y_pelota (a nivel del piso).
+        """
+        predict = getattr(self.ball, "predict", None)
+        if not self.use_prediction or predict is None:
+            return None
+        traj = predict()
+        if traj is None:
+            return None
+        b = traj.next_bounce(now_s * 1000.0)
+        if b is None or not b.inside:
+            return None
+        if (self.side == "top") != (b.y < net_y):
+            return None
+        return b.x + 400, b.y
+
     def get_simulated_keys(self):
-        now = time.time()
+        now = self._now()
         if now < self._next_tick:
-            class FakeKeys:
-                def __getitem__(self, key): return False
-            return FakeKeys()
+            # Entre reacciones se sostiene el movimiento decidido (sin repetir el golpe),
+            # así la IA se mueve igual a cualquier ritmo de simulación.
+            view = self._view
+            view.keys = self._last_keys
+            view.blocked = self.k_swing
+            return view
         self._next_tick = now + self.react_ms / 1000.0
 
-        keys = {
-            pygame.K_w: False,
-            pygame.K_s: False,
-            pygame.K_a: False,
-            pygame.K_d: False,
-            pygame.K_f: False,
-            pygame.K_RSHIFT: False,
-            pygame.K_RCTRL: False,
-        }
+        k_up, k_down, k_left, k_right = self.k_up, self.k_down, self.k_left, self.k_right
+        keys = self._last_keys
+        keys.clear()
+        keys[k_up] = keys[k_down] = keys[k_left] = keys[k_right] = False
+        keys[self.k_swing] = keys[pygame.K_RSHIFT] = keys[pygame.K_RCTRL] = False
 
         bx, by = self._read_ball_world()
         px, py = self._read_player_world()
 
-        # Mitad de la cancha
-        net_y = 100
+        # Mitad de la cancha (engine.rules.court_model)
+        court = default_court()
+        net_y = court.net_y
 
         # Detectar de qué lado está la pelota
-        current_side = "top" if by < net_y else "bottom"
+        current_side = court.side(by)
 
         # Si la pelota cambió de lado → resetear el permiso de golpe
         if self.last_ball_side and current_side != self.last_ball_side:
@@ -81,43 +132,49 @@ class SimpleTennisAI:
 
             #print("JUGADOR IA ", self.player.world_x, self.player.world_y)
         else:
-            home_x, home_y = 30, 400   # posición de espera del jugador 1
+            home_x, home_y = 520, 350  # posición de espera del jugador 1
 
         # ✅ Si la pelota está en su lado → perseguirla
         if (self.side == "top" and by < net_y) or (self.side == "bottom" and by > net_y):
             if abs(bx - px) > 5:
                 if bx > px:
-                    keys[pygame.K_d] = True
+                    keys[k_right] = True
                 else:
-                    keys[pygame.K_a] = True
+                    keys[k_left] = True
 
+            # "arriba" = y de mundo decreciente (igual para ambos lados)
             if abs(by - py) > 5:
-                if (self.side == "bottom" and by > py) or (self.side == "top" and by < py):
-                    keys[pygame.K_w] = True
+                if by < py:
+                    keys[k_up] = True
                 else:
-                    keys[pygame.K_s] = True
+                    keys[k_down] = True
 
             dist = hypot(bx - px, by - py)
             if dist < 25 and not self.has_hit_this_turn:
-                keys[pygame.K_f] = True
+                keys[self.k_swing] = True
                 self.has_hit_this_turn = True
 
         else:
+            # 🔮 Si el tiro viene a este lado, alinearse con el pique previsto
+            landing = self._predicted_landing(now, net_y)
+            if landing is not None:
+                home_x = landing[0]
+
             # 🧠 Pelota en el otro lado → volver a "home"
             if abs(home_x - px) > 5:
                 if home_x > px:
-                    keys[pygame.K_d] = True
+                    keys[k_right] = True
                 else:
-                    keys[pygame.K_a] = True
+                    keys[k_left] = True
 
             if abs(home_y - py) > 5:
                 if home_y < py:
-                    keys[pygame.K_w] = True
+                    keys[k_up] = True
                 else:
-                    keys[pygame.K_s] = True
+                    keys[k_down] = True
 
         # animaciones básicas
-        moving = any([keys[pygame.K_w], keys[pygame.K_s], keys[pygame.K_a], keys[pygame.K_d]])
+        moving = keys[k_up] or keys[k_down] or keys[k_left] or keys[k_right]
         if hasattr(self.player, "current_animation"):
             if moving:
                 anim = "walk-down-P2" if getattr(self.player, "is_player2", False) else "walk-up"
@@ -129,8 +186,7 @@ class SimpleTennisAI:
                 self.player.anim_timer = 0
 
         # 🎮 Devolver objeto tipo pygame.key.get_pressed()
-        class FakeKeys:
-            def __getitem__(self, key):
-                return keys.get(key, False)
-
-        return FakeKeys()
+        view = self._view
+        view.keys = keys
+        view.blocked = None
+        return view
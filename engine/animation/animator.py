@@ -2,15 +2,18 @@
 # - update(anim_name) -> bool  (True = avanzar al siguiente frame)
 # - set_fps(anim_name, fps)    (ajusta fps por anim)
 #
-# Usa pygame.time.get_ticks() y una tabla interna de fps/último tick por anim.
+# Usa un reloj en ms (time_source; default pygame.time.get_ticks()) y una tabla
+# interna de fps/último tick por anim. Con el reloj de simulación la animación se
+# congela en pausa y escala con slow-motion / fast-forward.
 
-from typing import Dict
+from typing import Callable, Dict, Optional
 import pygame
 
 
 class Animator:
-    def __init__(self, default_fps: int = 10):
+    def __init__(self, default_fps: int = 10, time_source: Optional[Callable[[], float]] = None):
         self.default_fps: int = max(1, int(default_fps))
+        self.time_source: Callable[[], float] = time_source or pygame.time.get_ticks
         self._fps: Dict[str, int] = {}          # fps por anim
         self._last_tick: Dict[str, int] = {}    # último tick por anim
         self._accum: Dict[str, float] = {}      # no necesario, pero queda listo por si querés dt real
@@ -27,7 +30,7 @@ class Animator:
         Devuelve True cuando corresponde avanzar 1 frame de la anim 'anim_name'.
         Política: al primer llamado inicializa el last_tick y NO avanza (evita saltos).
         """
-        now = pygame.time.get_ticks()
+        now = self.time_source()
         fps = self._get_fps(anim_name)
         frame_ms = 1000 // max(1, fps)
 
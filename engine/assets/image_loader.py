@@ -5,4 +5,7 @@ def load_image(path: str, convert_alpha: bool = True):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Asset no encontrado: {path}")
     img = pygame.image.load(path)
+    # Sin modo de video (runner headless) no se puede convertir: se usa la imagen cruda
+    if pygame.display.get_surface() is None:
+        return img
     return img.convert_alpha() if convert_alpha else img.convert()
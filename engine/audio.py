@@ -1,5 +1,9 @@
 import pygame
-import random
+
+from engine.utils import rng
+
+# Variantes de SFX: stream aparte para no correr los números de la jugabilidad
+_RNG = rng.stream("audio")
 
 class AudioManager:
     """
@@ -18,7 +22,7 @@ class AudioManager:
         • mute_all() / unmute_all() / toggle_mute_all() / is_all_muted()
     """
 
-    def __init__(self, num_channels=16):
+    def __init__(self, num_channels=16, timers=None):
         try:
             pygame.mixer.pre_init(44100, -16, 2, 512)
             pygame.mixer.init()
@@ -34,8 +38,11 @@ class AudioManager:
         self.variants = {}
         # name -> cooldown ms
         self.cooldowns = {}
-        # name -> last_ticks
+        # name -> last_ticks (sin scheduler)
         self.last_played = {}
+        # Con scheduler (Game.ui_timers): sonidos en cooldown; un timer los libera
+        self.timers = timers
+        self._cooling = set()
 
         self.music_path = None
         self._duck_prev = None
@@ -170,18 +177,26 @@ class AudioManager:
         if vs:
             vs = [n for n in vs if n in self.sounds]
             if vs:
-                return random.choice(vs)
+                return _RNG.choice(vs)
         return name
 
     def _can_play(self, name):
         cd = self.cooldowns.get(name)
         if not cd:
             return True
+        if self.timers is not None:
+            return name not in self._cooling
         now = pygame.time.get_ticks()
         last = self.last_played.get(name, -10**9)
         return (now - last) >= cd
 
     def _mark_played(self, name):
+        if self.timers is not None:
+            cd = self.cooldowns.get(name)
+            if cd and name not in self._cooling:
+                self._cooling.add(name)
+                self.timers.schedule(cd, self._cooling.discard, name)
+            return
         self.last_played[name] = pygame.time.get_ticks()
 
     def _effective_vol(self, group, base_volume):
@@ -45,14 +45,17 @@ class Background(GameObject):
                     self.frame_index = 0
 
     def draw(self, surface):
+        self.draw_frame(surface, self.current_animation, self.frame_index)
+
+    def draw_frame(self, surface, anim, frame_index):
+        """Dibuja un frame concreto (solo lee assets; apto para el hilo de render)."""
         if not self.sprite_sheet or not self.animations:
             return
 
-        frames = self.animations.get(self.current_animation, [])
+        frames = self.animations.get(anim, [])
         if not frames:
             return
 
-        self.frame_index %= len(frames)
-        fx, fy, fw, fh = frames[self.frame_index]
+        fx, fy, fw, fh = frames[frame_index % len(frames)]
         frame_surf = self.sprite_sheet.subsurface(pygame.Rect(fx, fy, fw, fh))
         surface.blit(frame_surf, (0, 0))
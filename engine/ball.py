@@ -1,5 +1,5 @@
 import math
-import random
+import os
 from typing import Tuple
 
 import pygame
@@ -10,70 +10,148 @@ except ImportError:
     ANCHO, ALTO = 800, 600
     def screen_to_world(x, y): return x, y
 
-SPIN_GRAVITY_SCALE, SPIN_DRIFT_SCALE, SPIN_DECAY = 0.12, 0.06, 0.96
+from engine.timing.clock import now_ms
+from engine.timing.fixed_step import SIM_REF_HZ, ref_ticks, lerp
+from engine.physics.swept import bounce, slab_toi
+from engine.physics.integrator import flight_params, step
+from engine.rules.court_model import default_court
+from engine.rules.line_calls import solve_contact
+from engine.ecs.store import BALL, TRANSFORM, HITBOX, bind, store_of
+from engine.utils import iso, rng
+
+# Zonas y velocidades al azar del lanzador / los golpes (stream con semilla)
+_RNG = rng.stream("ball")
+
+try:
+    from engine.config.physics import TOSS_GRAVEDAD
+except Exception:
+    TOSS_GRAVEDAD = -0.6
+try:
+    from engine.config.court import SERVE_RULES
+except Exception:
+    SERVE_RULES = False
+SERVE_RULES = os.environ.get("VJ2D_SERVE_RULES", "1" if SERVE_RULES else "0") == "1"
+
 GRAVEDAD = -0.5
 COEF_REBOTE = 0.7
 FACTOR_ISO_X = 0.5
 FACTOR_ISO_Y = 0.3
 
+# Cancha (engine.rules.court_model): los piques se fallan con COURT.call; los límites
+# del rectángulo de juego quedan como FIELD_* para los caminos vectorizados
+COURT = default_court()
+FIELD_LEFT, FIELD_TOP, FIELD_RIGHT, FIELD_BOTTOM = COURT.bounds
+VZ_REPOSO = 0.8        # por debajo de esto el rebote se apaga (la pelota rueda)
 
-# ----------------- HELPERS -----------------
-def world_to_iso(x: float, y: float, z: float = 0.0) -> Tuple[float, float]:
-    iso_x = x - y
-    iso_y = (x + y) * 0.5 - z
-    return iso_x, iso_y
+# Respuesta al tocar la red
+NET_BALL_Y = COURT.net_y   # y de mundo donde se reubica la pelota tras tocar la red
+NET_CLEAR = 5.0
+NET_DAMP_VZ = 0.2
+
+# Vuelo (gravedad + arrastre + Magnus) y toss del saque: mismo integrador, sin spin en el toss
+FLIGHT = flight_params(GRAVEDAD)
+TOSS_FLIGHT = FLIGHT._replace(gravity=TOSS_GRAVEDAD, magnus=0.0, drift=0.0)
+
+
+# Proyección de la pelota (engine.utils.iso): iso + anclaje (ANCHO/2, ALTO/3), con z
+CAMERA = iso.BALL
+
+# Sombras pre-renderizadas por (radio, alpha)
+_SHADOW_CACHE = {}
 
 
 # ============================================================
 #                         BALL CLASS
 # ============================================================
 class Ball(pygame.sprite.Sprite):
+    # Columnas de game.entities (engine.ecs.store) que llena entity_row() en cada sync
+    ENTITY_FIELDS = ("x", "y", "z", "px", "py", "pz", "radius")
+
     def __init__(self, x: int, y: int, game, vx: float, vy: float):
         super().__init__()
         self.game = game
+        # La entidad dura lo que dura la Ball (también mientras espera en el BallPool)
+        bind(self, store_of(game), BALL, TRANSFORM | HITBOX)
 
+        # Visual (se conserva entre usos cuando la pelota sale de un BallPool)
+        self.radio = 7
+        self.image = pygame.Surface((self.radio * 2, self.radio * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.image, (255, 255, 255), (self.radio, self.radio), self.radio)
+        self.rect = self.image.get_rect()
+        self._net_cd_ms = 100
+        self._screen = None   # (x, y, z, (sx, sy)) de la última proyección (CAMERA.cached)
+
+        self.reset(x, y, vx, vy)
+
+    def reset(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0, z: float = 80.0):
+        """Estado de pelota nueva (posición, velocidades, saque, piques), sin alocar nada."""
         # Posición
         self.x = x
         self.y = y
-        self.z = 80
+        self.z = z
 
         # Velocidades
         self.vx = vx
         self.vy = vy
         self.vz = 0.0
-
-        # Visual
-        self.radio = 7
         self.spin = 0.0
-        self.image = pygame.Surface((self.radio * 2, self.radio * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255, 255, 255), (self.radio, self.radio), self.radio)
-        self.rect = self.image.get_rect()
+
+        # Posición del tick anterior (interpolación de render)
+        self.snap_prev()
 
         # Estado
-        self._net_cd_ms = 100
-        self._last_net_hit = -10**9
+        if getattr(self, "_net_cd_timer", None) is not None:
+            self.game.timers.cancel(self._net_cd_timer)   # timer de una vida anterior (pool)
+        self._net_cd_timer = None
+        self._net_cooling = False   # lo apaga un timer de game.timers tras _net_cd_ms
         self.is_serving = False
         self.serve_stage = None
         self.server = None
         self.bounce_count = 0
         self.waiting_hit = False
         self.out_of_bounds = False
+        self._serve_call = None     # (mitad del sacador, "deuce"/"ad") hasta el primer pique del saque
+        self._touched_net = False
 
         self._squash_timer = 0
         self._squash_duration = 5
 
+        # Predicción del tiro actual (engine.physics.trajectory), se invalida al golpear
+        self._prediction = None
+
     # ============================================================
     #                 SCREEN POSITION PROPERTIES
     # ============================================================
+    # screen_x / screen_y / rect comparten una proyección por movimiento (CAMERA.cached)
     @property
     def screen_x(self) -> float:
-        iso_x, _ = world_to_iso(self.x, self.y, self.z)
-        return iso_x + ANCHO // 2
+        return CAMERA.cached(self, self.x, self.y, self.z)[0]
 
     @property
     def screen_y(self) -> float:
-        _, iso_y = world_to_iso(self.x, self.y, self.z)
-        return iso_y + ALTO // 3
+        return CAMERA.cached(self, self.x, self.y, self.z)[1]
+
+    @property
+    def prev_screen(self) -> Tuple[float, float]:
+        """Centro en pantalla al inicio del tick (para tests barridos en pantalla)."""
+        return CAMERA.project(self.prev_x, self.prev_y, self.prev_z)
+
+    @property
+    def world_x(self) -> float:
+        """x del punto en el piso bajo la pelota, en el mundo de los jugadores."""
+        return self.x + ANCHO // 2
+
+    @property
+    def world_y(self) -> float:
+        return self.y
+
+    def snap_prev(self):
+        """Guarda la posición actual como 'tick anterior' (llamar antes de cada tick)."""
+        self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
+
+    def entity_row(self) -> tuple:
+        """Valores de ENTITY_FIELDS, en ese orden (engine.ecs.store.sync)."""
+        return self.x, self.y, self.z, self.prev_x, self.prev_y, self.prev_z, self.radio
 
     # Paneo estéreo
     def _calc_pan(self) -> float:
@@ -92,6 +170,8 @@ class Ball(pygame.sprite.Sprite):
 
     def _play_pan(self, name: str):
         try:
+            if not self.game.audio.enabled:
+                return
             pan = self._calc_pan()
             self.game.audio.play_sound_panned(name, pan)
         except Exception:
@@ -106,6 +186,7 @@ class Ball(pygame.sprite.Sprite):
 
     def apply_shot_spin(self, spin_value: float):
         self.spin = float(spin_value)
+        self._prediction = None
 
     def _trigger_squash(self):
         self._squash_timer = self._squash_duration
@@ -116,6 +197,7 @@ class Ball(pygame.sprite.Sprite):
 
     def on_racket_hit(self):
         self._play_pan("hit_racket")
+        self._prediction = None
 
         AMORTIGUACION = 0.65
         self.vy *= -1
@@ -135,6 +217,7 @@ class Ball(pygame.sprite.Sprite):
             self._play_pan("net_touch")
 
         DEAD = 0.25
+        self._prediction = None
         self.vx *= -DEAD
         self.vy *= -DEAD
         self._trigger_squash()
@@ -176,23 +259,24 @@ class Ball(pygame.sprite.Sprite):
         Movimiento realista hacia zona aleatoria del cuadro.
         """
         zones = [
-            (random.uniform(-40, 60), random.uniform(50, 150)),
-            (random.uniform(60, 180), random.uniform(50, 150)),
-            (random.uniform(-40, 60), random.uniform(-150, -50)),
-            (random.uniform(60, 180), random.uniform(-150, -50)),
+            (_RNG.uniform(-40, 60), _RNG.uniform(50, 150)),
+            (_RNG.uniform(60, 180), _RNG.uniform(50, 150)),
+            (_RNG.uniform(-40, 60), _RNG.uniform(-150, -50)),
+            (_RNG.uniform(60, 180), _RNG.uniform(-150, -50)),
         ]
 
-        target_x, target_y = random.choice(zones)
+        target_x, target_y = _RNG.choice(zones)
 
         dx = target_x - self.x
         dy = target_y - self.y
         dist = (dx ** 2 + dy ** 2) ** 0.5 or 1.0
 
-        speed = random.uniform(4.5, 6.0)
+        speed = _RNG.uniform(4.5, 6.0)
 
         self.vx = dx / dist * speed
         self.vy = dy / dist * speed
-        self.vz = random.uniform(5.0, 7.5)
+        self.vz = _RNG.uniform(5.0, 7.5)
+        self._prediction = None
 
         print(f"[DEBUG] launch_toward_random_zone → "
               f"({target_x:.1f}, {target_y:.1f})  "
@@ -212,6 +296,8 @@ class Ball(pygame.sprite.Sprite):
         self.y = world_y
         self.z = 0
         self.vx = self.vy = self.vz = 0
+        self._prediction = None
+        self.snap_prev()
 
     def start_toss(self, server_id: str, start_x: float, start_y: float):
         self.server_id = server_id
@@ -224,10 +310,11 @@ class Ball(pygame.sprite.Sprite):
         self.serve_stage = "toss"
         self.waiting_hit = True
         self.out_of_bounds = False
+        self._prediction = None
+        self.snap_prev()
 
-    def update_toss(self):
-        self.z += self.vz
-        self.vz -= 0.6
+    def update_toss(self, k: float = 1.0):
+        _, _, self.z, _, _, self.vz, _ = step(self.x, self.y, self.z, 0.0, 0.0, self.vz, 0.0, k, TOSS_FLIGHT)
 
         if self.vz <= 0 and self.serve_stage == "toss":
             self.serve_stage = "falling"
@@ -243,147 +330,301 @@ class Ball(pygame.sprite.Sprite):
     # ============================================================
     #                           UPDATE LOOP
     # ============================================================
-    def update(self):
+    def update(self, dt_ms=None):
+        """
+        Avanza un tick de simulación de dt_ms (None = un tick de referencia).
+        Las velocidades están en unidades por tick de referencia (SIM_REF_HZ).
+        """
+        k = ref_ticks(dt_ms)
 
         # --- Saque / Toss ---
         if getattr(self, "serve_stage", None) in ("toss", "falling"):
-            self.update_toss()
-            iso_x, iso_y = world_to_iso(self.x, self.y, self.z)
-            self.rect.center = (iso_x + ANCHO // 2, iso_y + ALTO // 3)
+            self.update_toss(k)
+            self.rect.center = CAMERA.cached(self, self.x, self.y, self.z)
             return
 
         if self.serve_stage == "ready":
-            iso_x, iso_y = world_to_iso(self.x, self.y, self.z)
-            self.rect.center = (iso_x + ANCHO // 2, iso_y + ALTO // 3)
+            self.rect.center = CAMERA.cached(self, self.x, self.y, self.z)
             return
 
         if self.serve_stage == "fault":
             return
 
-        # --- Movimiento general ---
-        self.x += self.vx
-        self.y += self.vy
-        self.z += self.vz
-        self.vz -= 0.5
+        # --- Vuelo (engine.physics.integrator); la red toma el tick como segmento recto ---
+        # (x0..vz0 = inicio del tick, x..vz = final: el segmento de los tests barridos)
+        x0, y0, z0, vx0, vy0, vz0 = self.x, self.y, self.z, self.vx, self.vy, self.vz
+        x, y, z, vx, vy, vz, self.spin = step(x0, y0, z0, vx0, vy0, vz0, self.spin, k, FLIGHT)
+        self.x, self.y, self.z, self.vx, self.vy, self.vz = x, y, z, vx, vy, vz
+
+        # --- Contactos barridos: el primero dentro del tick gana ---
+        # El pique sale de la curva del tick (engine.rules.line_calls), no de la cuerda
+        contact = None
+        if z <= 0.0:
+            contact = solve_contact((x0, y0, z0, vx0, vy0, vz0), (x, y, z, vx, vy, vz), k)
+        t_ground = contact.t if contact is not None else None
+        t_net = None
+        net = self.game.field.net if hasattr(self.game, "field") else None
+        if net is not None and not self._net_cooling:
+            t_net = slab_toi((x0, y0, z0), (x, y, z), net.y, self.radio, net.height)
 
-        # --- Rebote en cancha ---
-        if self.z <= 0:
-            self.z = 0
-            self.vz = -self.vz * 0.7
+        # --- Colisión con red ---
+        if t_net is not None and (t_ground is None or t_net < t_ground):
+            self.x, self.y, self.z = lerp(x0, x, t_net), lerp(y0, y, t_net), lerp(z0, z, t_net)
+            self._net_cooling = True
+            self._touched_net = True
+            self._prediction = None
+            self._net_cd_timer = self.game.timers.schedule(self._net_cd_ms, self._end_net_cooldown)
+
+            if abs(self.z) < 12 and "net_tape" in self.game.audio.sounds:
+                self._play_pan("net_tape")
+            elif "net_body" in self.game.audio.sounds:
+                self._play_pan("net_body")
+            elif "net_touch" in self.game.audio.sounds:
+                self._play_pan("net_touch")
+
+            # La red absorbe según dónde pegó (más en el centro, menos junto a postes / cinta)
+            impact = getattr(net, "impact", None)
+            stiff = impact(self.x, self.z, self.vy) if impact is not None else 1.0
+            self.vx = 0.0
+            self.vy = 0.0
+            self.vz *= NET_DAMP_VZ * stiff
+
+            if self.y > NET_BALL_Y:
+                self.y = NET_BALL_Y + self.radio + NET_CLEAR
+            else:
+                self.y = NET_BALL_Y - (self.radio + NET_CLEAR)
 
-            FIELD_LEFT = -50
-            FIELD_RIGHT = 250
-            FIELD_TOP = -150
-            FIELD_BOTTOM = 350
+        # --- Rebote en cancha (en el instante exacto del contacto) ---
+        elif t_ground is not None:
+            self.z, self.vz = bounce(contact.vz, t_ground, k, COEF_REBOTE)
 
-            dentro = FIELD_LEFT <= self.x <= FIELD_RIGHT and FIELD_TOP <= self.y <= FIELD_BOTTOM
+            dt = float(dt_ms) if dt_ms is not None else 1000.0 / SIM_REF_HZ
+            call = self._call_bounce(contact, (x0, y0, z0), now_ms(self.game) - (1.0 - t_ground) * dt)
+            if call.verdict == "let":
+                self.out_of_bounds = True
+                replay = getattr(self.game, "replay_point", None)
+                if replay is not None:
+                    replay()
+                return
+            dentro = call.verdict == "in"
             last = getattr(self.game, "last_hitter", None)
 
+            # El punto se marca antes de avisar al juego (como el let): point_for puede
+            # reciclar esta misma pelota para el rally siguiente
             if dentro:
                 self.bounce_count += 1
                 self._on_bounce_court()
 
                 if self.bounce_count >= 2:
+                    self.out_of_bounds = True
                     if last == "P1": self.game.point_for("P2")
                     elif last == "P2": self.game.point_for("P1")
                     else: self.game.point_for("P2")
-                    self.out_of_bounds = True
                     return
 
             else:
-                self.on_out()
                 self.out_of_bounds = True
+                self.on_out()
                 return
 
-            if abs(self.vz) < 0.8:
+            if abs(self.vz) < VZ_REPOSO:
+                self.z = 0
                 self.vz = 0
 
         # --- Out más allá de los límites ---
-        if self.z == 0 and not self.out_of_bounds:
-            if self.x < -50 or self.x > 250 or self.y < -150 or self.y > 350:
-                self.out_of_bounds = True
-                self.on_out()
-
-        # --- Colisión con red ---
-        if hasattr(self.game, "field") and self.z > 0:
-            net = self.game.field.net
-            now = pygame.time.get_ticks()
-
-            if now >= self._last_net_hit + self._net_cd_ms:
-                if net.ball_hits_net((self.x, self.y, self.z), self.radio):
-                    self._last_net_hit = now
+        if self.z == 0 and not self.out_of_bounds and not COURT.inside(self.x, self.y):
+            self.out_of_bounds = True
+            self.on_out()
+            return
 
-                    if abs(self.z) < 12 and "net_tape" in self.game.audio.sounds:
-                        self._play_pan("net_tape")
-                    elif "net_body" in self.game.audio.sounds:
-                        self._play_pan("net_body")
-                    elif "net_touch" in self.game.audio.sounds:
-                        self._play_pan("net_touch")
+        # --- Actualizar rect ---
+        self.rect.center = CAMERA.cached(self, self.x, self.y, self.z)
 
-                    self.vx = 0.0
-                    self.vy = 0.0
-                    self.vz *= 0.2
+    def _call_bounce(self, contact, p0, t_ms: float):
+        """
+        Fallo del pique en el punto de contacto: saque con SERVE_RULES, si no rally.
+        Con game.line_calls (LineJudge) queda registrado con su margen. Marca el overlay de debug.
+        """
+        x, y = contact.x, contact.y
+        hitter, box = self._serve_call or (None, None)
+        self._serve_call = None
+        judge = getattr(self.game, "line_calls", None)
+        if judge is not None:
+            call = judge.call(contact, p0, t_ms, hitter=hitter, serve_box=box, touched_net=self._touched_net)
+        else:
+            call = COURT.call(x, y, hitter=hitter, serve_box=box, touched_net=self._touched_net)
 
-                    net_y_pos = 105.0
-                    CLEAR = 5.0
+        overlays = getattr(self.game, "debug_overlays", None)
+        if overlays is not None and getattr(self.game, "show_bounce_debug", False):
+            sx, sy = CAMERA.project(x, y)
+            overlays.add_bounce(int(sx), int(sy), call.verdict != "out", label=call.label)
+        return call
 
-                    if self.y > net_y_pos:
-                        self.y = net_y_pos + self.radio + CLEAR
-                    else:
-                        self.y = net_y_pos - (self.radio + CLEAR)
+    def _end_net_cooldown(self):
+        self._net_cooling = False
+        self._net_cd_timer = None
 
-        # --- Actualizar rect ---
-        iso_x, iso_y = world_to_iso(self.x, self.y, self.z)
-        self.rect.center = (iso_x + ANCHO // 2, iso_y + ALTO // 3)
+    # ============================================================
+    #                        PREDICCIÓN
+    # ============================================================
+    def predict(self):
+        """
+        Trayectoria del tiro actual (piques, cruce de la red, posición futura).
+        Se calcula una vez por tiro y queda cacheada hasta el próximo golpe / toque de red.
+        None mientras no hay rally en juego (saque en preparación / toss / falta).
+        """
+        if self.serve_stage in ("ready", "toss", "falling", "fault") or self.out_of_bounds:
+            return None
+        if self._prediction is None:
+            from engine.physics.trajectory import Trajectory
+            sim = getattr(self.game, "sim", None)
+            field = getattr(self.game, "field", None)
+            self._prediction = Trajectory(
+                self.x, self.y, self.z, self.vx, self.vy, self.vz,
+                spin=self.spin, bounce_count=self.bounce_count,
+                dt_ms=getattr(sim, "step_ms", None), t0_ms=now_ms(self.game),
+                net=None if (field is None or self._net_cooling) else field.net,
+                radio=self.radio,
+            )
+        return self._prediction
 
     # ============================================================
     #                           DRAW
     # ============================================================
-    def draw(self, screen):
-        sombra_x, sombra_y = world_to_iso(self.x, self.y, 0)
-        sombra_x += ANCHO // 2
-        sombra_y += ALTO // 3
-
-        sombra_radio = max(1, self.radio - int(self.z * 0.05))
-        sombra_color = (50, 50, 50, max(0, 150 - int(self.z * 1.5)))
-
-        sombra_surf = pygame.Surface((sombra_radio * 2, sombra_radio * 2), pygame.SRCALPHA)
-        pygame.draw.circle(sombra_surf, sombra_color, (sombra_radio, sombra_radio), sombra_radio)
+    def draw(self, screen, alpha: float = 1.0):
+        """
+        alpha: fracción entre el tick anterior (0) y el actual (1) para interpolar.
+        """
+        self.draw_state(screen,
+                        lerp(self.prev_x, self.x, alpha),
+                        lerp(self.prev_y, self.y, alpha),
+                        lerp(self.prev_z, self.z, alpha),
+                        self.radio)
+
+    @staticmethod
+    def draw_state(screen, x: float, y: float, z: float, radio: int, shadow: bool = True):
+        """Dibuja sombra + pelota para una posición de mundo (usado también por snapshots)."""
+        if shadow:
+            Ball._draw_shadow(screen, x, y, z, radio)
+
+        px, py = CAMERA.project(x, y, z)
+        pygame.draw.circle(screen, (255, 255, 0), (int(px), int(py)), radio)
+
+    @staticmethod
+    def _draw_shadow(screen, x: float, y: float, z: float, radio: int):
+        sombra_x, sombra_y = CAMERA.project(x, y)
+
+        sombra_radio = max(1, radio - int(z * 0.05))
+        sombra_alpha = max(0, 150 - int(z * 1.5))
+
+        # Sombras cacheadas por (radio, alpha): valores acotados, sin Surfaces nuevas por frame
+        key = (sombra_radio, sombra_alpha)
+        sombra_surf = _SHADOW_CACHE.get(key)
+        if sombra_surf is None:
+            sombra_surf = pygame.Surface((sombra_radio * 2, sombra_radio * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sombra_surf, (50, 50, 50, sombra_alpha),
+                               (sombra_radio, sombra_radio), sombra_radio)
+            _SHADOW_CACHE[key] = sombra_surf
         screen.blit(sombra_surf, (int(sombra_x - sombra_radio), int(sombra_y - sombra_radio)))
 
-        px, py = self.screen_x, self.screen_y
-        pygame.draw.circle(screen, (255, 255, 0), (int(px), int(py)), self.radio)
-
     # ============================================================
     #                       PLAYER HIT
     # ============================================================
-    def hit_by_player(self, player_pos, zone="center", is_player2=False):
+    def hit_by_player(self, player_pos, zone="center", is_player2=False, target=None, clearance=None,
+                      spin=0.0):
+        """
+        Golpe hacia zone (punto al azar dentro del rectángulo de Field.zones) o hacia
+        target=(x, y) explícito. Las velocidades salen de la tabla de puntería
+        (engine.physics.targeting) para que el primer pique caiga en ese punto,
+        pasando la red con clearance de margen (None = SHOT_NET_CLEARANCE).
+        spin: efecto del golpe (Player.SHOT_SPIN); reemplaza el que traía la pelota.
+        Los efectos del jugador (targeting.SHOT_SPINS) se apuntan con la tabla; otro spin simula el vuelo.
+        """
         self._play_pan("hit_racket")
 
+        self._serve_call = None
         if getattr(self, "serve_stage", None) in ("toss", "falling"):
             self.waiting_hit = False
             self.serve_stage = "served"
             self.start_rally()
+            if SERVE_RULES:
+                self._serve_call = self._serve_target()
 
         self.bounce_count = 0
+        self._touched_net = False
+        self.apply_shot_spin(spin)
         field = self.game.field
 
-        if zone not in field.zones:
+        if target is not None:
+            target_x, target_y = target
+        elif zone not in field.zones:
             target_x, target_y = 0, 0
         else:
             zx, zy, zw, zh = field.zones[zone]
-            target_x = zx + random.uniform(0.2, 0.8) * zw
-            target_y = zy + random.uniform(0.2, 0.8) * zh
+            target_x = zx + _RNG.uniform(0.2, 0.8) * zw
+            target_y = zy + _RNG.uniform(0.2, 0.8) * zh
 
-        dx = target_x - self.x
-        dy = target_y - self.y
-        dist = math.sqrt(dx**2 + dy**2)
-        if dist == 0:
-            dist = 1e-5
+        from engine.physics.targeting import shot_table_for
+        sim = getattr(self.game, "sim", None)
+        table = shot_table_for(field, getattr(sim, "step_ms", None))
+        self.vx, self.vy, self.vz = table.aim(self.x, self.y, self.z, target_x, target_y,
+                                              zone=None if target is not None else zone,
+                                              clearance=clearance, spin=self.spin)
+        self._prediction = None
+
+    def _serve_target(self):
+        """(mitad del sacador, cuadro) del saque actual: deuce con suma de puntos par, si no ad."""
+        half = "top" if getattr(self, "server_id", "P1") == "P2" else "bottom"
+        score = getattr(self.game, "score", None)
+        played = getattr(score, "p1_points", 0) + getattr(score, "p2_points", 0)
+        return half, "deuce" if played % 2 == 0 else "ad"
 
-        base = random.uniform(8, 11)
-        boost = 1.5 if base < 9 else 1.0
 
-        self.vx = (dx / dist) * base * boost
-        self.vy = (dy / dist) * base * boost
-        self.vz = random.uniform(6, 8)
+# ============================================================
+#                         BALL POOL
+# ============================================================
+class BallPool:
+    """
+    Reserva de pelotas reciclables: acquire() reusa una Ball liberada (con su
+    Surface) y la deja como nueva con Ball.reset(); release() la saca de sus
+    grupos y la devuelve. En sesiones largas (drills) no se aloca por pelota.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self._free = []
+        self.created = 0     # Ball construidas en total (diagnóstico)
+        self.in_use = 0
+
+    def acquire(self, x: float, y: float, vx: float = 0.0, vy: float = 0.0, z: float = 80.0) -> Ball:
+        if self._free:
+            ball = self._free.pop()
+            ball.reset(x, y, vx, vy, z)
+        else:
+            ball = Ball(x, y, self.game, vx, vy)
+            ball.z = z
+            ball.snap_prev()
+            self.created += 1
+        ball._pooled = False
+        self.in_use += 1
+        return ball
+
+    def release(self, ball: Ball) -> None:
+        if getattr(ball, "_pooled", True):
+            return  # ya devuelta (o no es de este pool)
+        ball.kill()
+        ball._pooled = True
+        self.in_use -= 1
+        self._free.append(ball)
+
+    def release_all(self, group) -> None:
+        """Devuelve todas las pelotas del grupo (y las que no son del pool solo salen del grupo)."""
+        for ball in group.sprites():
+            if getattr(ball, "_pooled", None) is False:
+                self.release(ball)
+            else:
+                ball.kill()
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
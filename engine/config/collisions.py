@@ -20,3 +20,13 @@ RACKET_Y_OFFSET = 10    # arriba del cuerpo (negativo = hacia arriba)
 # Debug color (solo si el juego activa _debug_bounds)
 COLOR_BODY   = (50, 220, 60)    # verde
 COLOR_RACKET = (240, 200, 40)   # amarillo
+
+# Modo preciso (máscaras pixel-perfect de la raqueta; también VJ2D_PRECISE_HITS=1)
+PRECISE_RACKET_HITS = False
+RACKET_MASK_COLOR = (143, 86, 59)   # marrón del marco en player-sheet-completo.png
+RACKET_MASK_TOL = 24                # tolerancia por canal
+RACKET_MASK_GROW = 2                # px de dilatación (cierra el marco antes de rellenar)
+MASK_ANIM_PREFIXES = ("stroke-", "Saque-")
+
+# Spatial hash del mundo de colisiones (engine/physics/collision.py), en unidades de cancha
+HASH_CELL = 64.0
@@ -0,0 +1,33 @@
+"""
+Geometría de la cancha en unidades de mundo (las de Ball) para engine/rules/court_model.py.
+x = ancho (pasillos a los costados), y = largo (fondos arriba / abajo, red al medio).
+Proporciones de una cancha reglamentaria (23.77 m × 10.97 m) estiradas a los
+límites históricos del juego (FIELD_LEFT..FIELD_BOTTOM de engine/ball.py).
+"""
+
+COURT_DOUBLES = (-50.0, -150.0, 250.0, 350.0)  # x0, y0, x1, y1: laterales de dobles y fondos
+COURT_ALLEY = 37.5            # ancho del pasillo de dobles (1.37 m de 10.97 m)
+COURT_SERVICE_DEPTH = 134.6   # red -> línea de saque (6.40 m de 11.885 m)
+COURT_LINE_WIDTH = 2.0        # grosor de las líneas: la pelota que toca la línea es buena
+
+# Líneas que valen en el rally: "doubles" (histórico: toda la cancha) | "singles"
+# También VJ2D_COURT_LINES.
+COURT_LINES = "doubles"
+
+# Saque: exigir el cuadro de saque correcto y repetir los let (también VJ2D_SERVE_RULES=1)
+SERVE_RULES = False
+
+# Zonas de puntería (Field.zones, CourtModel.target_zones): margen dentro de las líneas
+# que valen y distancia mínima a la red (más que el radio de la pelota)
+ZONE_INSET = 5.0
+ZONE_NET_GAP = 15.0
+
+# Grilla rasterizada de regiones (las celdas que tocan una línea usan el test exacto)
+COURT_CELL = 10.0
+COURT_GRID_MARGIN = 150.0     # la grilla cubre la cancha + este margen (fuera: test exacto)
+
+# Registro de fallos (engine/rules/line_calls.py) y revisión con F4
+CALL_LOG_SIZE = 256           # últimos piques fallados que se guardan (ring buffer)
+CHALLENGE_MS = 3500           # duración de la revisión en pantalla
+CHALLENGE_ZOOM = 6.0          # aumento del recuadro sobre el pique
+CLOSE_CALL = 1.0              # |margen| por debajo de esto cuenta como fallo ajustado
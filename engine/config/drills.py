@@ -0,0 +1,15 @@
+"""
+Parámetros del modo práctica (máquina lanzapelotas, engine/drills/ball_machine.py).
+"""
+
+# Pelotas por segundo de simulación (también VJ2D_DRILL_RATE)
+DRILL_RATE_HZ = 1.5
+
+# Máximo de pelotas en vuelo a la vez (también VJ2D_DRILL_MAX); la máquina espera si se llena
+DRILL_MAX_BALLS = 200
+
+# Boca de la máquina (mundo de la pelota): fondo del lado de arriba, a media altura
+DRILL_ORIGIN = (100.0, -140.0, 30.0)
+
+# Zonas de Field.zones hacia donde tira (lado del jugador 1)
+DRILL_ZONES = ("deep_back_left", "back_left", "back_right", "deep_back_right")
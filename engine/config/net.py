@@ -0,0 +1,28 @@
+"""
+Red deformable (engine/physics/net_cloth.py) y su dibujo.
+Unidades de mundo de la pelota; rigidez en 1/tick² de referencia (SIM_REF_HZ).
+"""
+
+NET_CLOTH = True              # red masa-resorte (también VJ2D_NET_CLOTH=0/1); sin NumPy: textura fija
+
+# Grilla de nodos (columnas a lo largo de la red, filas en altura) y topes de costo
+NET_COLS = 24
+NET_ROWS = 6
+NET_MAX_NODES = 256           # columnas × filas se recortan a esto
+NET_MAX_SUBSTEPS = 4          # subpasos de Verlet por tick; si el dt pide más, la red se ablanda
+
+# Resortes
+NET_STIFFNESS = 0.6           # entre nodos vecinos
+NET_TAPE_STIFFNESS = 3.0      # multiplicador de la cinta (fila de arriba, horizontal)
+NET_DAMPING = 0.15            # fracción de velocidad que se pierde por tick de referencia
+NET_MAX_DEFLECTION = 20.0     # tope del desplazamiento de un nodo
+
+# Impacto de la pelota
+NET_IMPULSE_GAIN = 1.5        # vy de la pelota -> velocidad de los nodos tocados
+NET_SLACK = 0.6               # cuánto más absorbe el centro de la red que los postes / la cinta
+NET_SLEEP_EPS = 0.05          # movimiento máximo por debajo del cual la red se duerme
+
+# Dibujo: postes (x de mundo) y alto visible, calibrados sobre assets/texturas/red.png
+NET_POSTS_X = (-87.0, 289.0)
+NET_DRAW_HEIGHT = 67.0
+NET_DRAW_OFFSET = (0, -20)    # px de pantalla entre la proyección de la pelota y la textura
@@ -1,5 +1,5 @@
 """
-Constantes físicas para spin de la pelota.
+Constantes físicas de la pelota (spin, aire, integrador) y de la puntería.
 Ajustá a gusto para tu “sensación” de tenis.
 """
 
@@ -14,3 +14,17 @@ SPIN_DRIFT_SCALE   = 0.06   # leve deriva lateral (efecto Magnus lateral)
 
 # Decaimiento del spin por frame (0..1): más chico = dura más
 SPIN_DECAY = 0.96
+
+# Integrador del vuelo (engine/physics/integrator.py)
+INTEGRATOR = "rk2"          # "rk2" | "semi_implicit" (env VJ2D_INTEGRATOR)
+AIR_DRAG = 0.0              # arrastre cuadrático: a = -AIR_DRAG·|v|·v (env VJ2D_AIR_DRAG, p.ej. 0.0004)
+                            # 0 = parábola pura: la puntería y Trajectory quedan en forma cerrada / lookup
+MAGNUS_REF_SPEED = 10.0     # |v_h| a la que SPIN_GRAVITY_SCALE / SPIN_DRIFT_SCALE rinden tal cual
+TOSS_GRAVEDAD = -0.6        # gravedad del lanzamiento del saque (histórica, algo más fuerte que GRAVEDAD)
+
+# Puntería de golpes (engine/physics/targeting.py)
+SHOT_NET_CLEARANCE = 6.0    # margen mínimo sobre Net.height al cruzar la red (unidades de mundo)
+SHOT_MAX_SPEED = 13.5       # velocidad horizontal máxima por tick de referencia (tope del golpe histórico)
+SHOT_MAX_FLIGHT_MS = 3000.0 # globo más largo que se intenta para pasar la red
+SHOT_GRID_STEP = 50.0       # paso de la grilla de orígenes de la tabla precalculada
+SHOT_REFINE_ITERS = 4       # correcciones por arrastre / spin (simulando el vuelo) en cada golpe
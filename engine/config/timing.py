@@ -0,0 +1,27 @@
+"""
+Parámetros de temporización del bucle principal.
+Las velocidades del juego (pelota, jugadores, gravedad) están expresadas
+"por tick de referencia": el ritmo para el que se afinaron originalmente.
+"""
+
+# Ritmo para el que están afinadas las constantes físicas (unidades por tick)
+SIM_REF_HZ = 15
+
+# Ritmo de simulación fijo (física, jugadores e IA), independiente del render
+SIM_HZ = 120
+
+# FPS objetivo de render (la posición se interpola entre los dos últimos ticks)
+RENDER_FPS = 60
+
+# Máximo de ticks de simulación por frame renderizado (evita el "spiral of death")
+MAX_SIM_STEPS = 8
+
+# Modo idle (menú, opciones, pausa, victoria, game over): espera bloqueante de eventos
+IDLE_WAIT_MS = 250      # timeout de pygame.event.wait con la ventana visible
+HIDDEN_WAIT_MS = 1000   # timeout con la ventana minimizada / sin foco
+
+# Governor de calidad: percentil del tiempo de trabajo por frame vs presupuesto
+GOVERNOR_PERCENTILE = 0.95   # percentil móvil comparado contra el presupuesto
+GOVERNOR_WINDOW = 90         # frames en la ventana móvil
+GOVERNOR_HEADROOM = 0.60     # subir calidad si p95 < presupuesto * HEADROOM
+GOVERNOR_HOLD_MS = 1500      # espera mínima entre transiciones (evita oscilar)
@@ -0,0 +1,208 @@
+"""
+Hash por tick del estado canónico del mundo y detector de desincronización.
+Diseño:
+- canonical(game)            -> {campo: valores} (reloj, pelotas, jugadores, marcador, RNG)
+- field_crcs(game)           -> crc32 de cada campo (lo que se hashea por tick)
+- WorldHasher(path=None)     -> update(game) una vez por tick: hash encadenado y log opcional
+- DesyncDetector(path)       -> compara cada tick contra una grabación (log de WorldHasher)
+- compare(path_a, path_b)    -> primera Divergence entre dos logs, o None
+- python -m engine.debug.desync a.log b.log
+
+Cada campo se reduce a un crc32 de sus bytes (struct de los float exactos, texto
+para los estados) y el hash del tick es blake2b(hash anterior + crcs de los campos): se calcula de forma
+incremental, encadenado, así que una diferencia en cualquier tick cambia todos los
+hashes siguientes y con el primero distinto alcanza para ubicarla. El log guarda
+además el crc de cada campo, de modo que el detector dice QUÉ campo se desvió.
+
+Formato del log (texto, una línea por tick):
+    # vj2d-hash 1 seed=<semilla> fields=time,ball,p1,p2,score,rng
+    <tick> <hash hex> <crc campo 1> <crc campo 2> ...
+
+Solo entra estado de simulación: nada de render, audio ni reloj de pared. Las
+posiciones de los streams de engine.utils.rng entran como "rng" (sin el de audio).
+"""
+
+import argparse
+import hashlib
+import struct
+import sys
+import zlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from engine.utils import rng
+
+FIELDS = ("time", "ball", "p1", "p2", "score", "rng")
+HASHED_STREAMS = ("ball", "player", "drill")
+_HEADER = "# vj2d-hash 1"
+_BALL = struct.Struct("<7d2i")
+_PLAYER = struct.Struct("<2di")
+_SCORE = struct.Struct("<2i")
+
+
+class Divergence(NamedTuple):
+    tick: int
+    fields: Tuple[str, ...]     # campos distintos en ese tick ("?" si los logs no los traen)
+    expected: str               # hash de la grabación / del log A
+    got: str                    # hash de la corrida / del log B
+
+
+def _player(p) -> tuple:
+    if p is None:
+        return ()
+    return (p.world_x, p.world_y, p.swing_state, p.serve_stage, p.pending_direction,
+            p.current_animation, p.frame_index)
+
+
+def canonical(game) -> Dict[str, tuple]:
+    """Estado que tiene que coincidir tick a tick entre dos corridas con la misma semilla."""
+    balls = tuple((b.x, b.y, b.z, b.vx, b.vy, b.vz, b.spin, b.bounce_count,
+                   getattr(b, "serve_stage", None), b.out_of_bounds) for b in game.balls)
+    score = getattr(game, "score", None)
+    points = (score.p1_points, score.p2_points, score.game_winner) if score else ()
+    return {
+        "time": (game.sim.ticks,),
+        "ball": balls,
+        "p1": _player(getattr(game, "jugador1", None)),
+        "p2": _player(getattr(game, "jugador2", None)),
+        "score": points + (getattr(game, "last_hitter", None), getattr(game, "current_server", None)),
+        "rng": rng.positions(HASHED_STREAMS),
+    }
+
+
+def _text(*values) -> bytes:
+    return "|".join("-" if v is None else str(v) for v in values).encode("utf-8")
+
+
+def _player_bytes(p) -> bytes:
+    if p is None:
+        return b""
+    return _PLAYER.pack(p.world_x, p.world_y, p.frame_index) + _text(
+        p.swing_state, p.serve_stage, p.pending_direction, p.current_animation)
+
+
+def field_crcs(game) -> Tuple[int, ...]:
+    """crc32 de cada campo de canonical(game), empaquetado en binario (lo barato del tick)."""
+    crc = zlib.crc32
+    ball = 0
+    for b in game.balls:
+        ball = crc(_BALL.pack(b.x, b.y, b.z, b.vx, b.vy, b.vz, b.spin, b.bounce_count, b.out_of_bounds), ball)
+        ball = crc(_text(getattr(b, "serve_stage", None)), ball)
+    score = getattr(game, "score", None)
+    points = _SCORE.pack(score.p1_points, score.p2_points) + _text(score.game_winner) if score else b""
+    return (
+        crc(_SCORE.pack(game.sim.ticks, 0)),
+        ball,
+        crc(_player_bytes(getattr(game, "jugador1", None))),
+        crc(_player_bytes(getattr(game, "jugador2", None))),
+        crc(points + _text(getattr(game, "last_hitter", None), getattr(game, "current_server", None))),
+        crc(struct.pack(f"<{len(HASHED_STREAMS)}q", *rng.positions(HASHED_STREAMS))),
+    )
+
+
+class WorldHasher:
+    def __init__(self, path: Optional[str] = None):
+        self.hash = b"\0" * 8
+        self.ticks = 0
+        self.crcs: Tuple[int, ...] = ()
+        self._out = None
+        if path:
+            self._out = open(path, "w", encoding="utf-8")
+            self._out.write(f"{_HEADER} seed={rng.master_seed()} fields={','.join(FIELDS)}\n")
+
+    def update(self, game) -> str:
+        """Hash del tick actual (encadenado con el anterior). Lo escribe al log si hay."""
+        self.crcs = field_crcs(game)
+        payload = self.hash + b"".join(c.to_bytes(4, "little") for c in self.crcs)
+        self.hash = hashlib.blake2b(payload, digest_size=8).digest()
+        self.ticks += 1
+        hx = self.hash.hex()
+        if self._out is not None:
+            self._out.write(f"{game.sim.ticks} {hx} {' '.join(f'{c:08x}' for c in self.crcs)}\n")
+        return hx
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+# ---------------------------
+# Logs y comparación
+# ---------------------------
+def read_log(path: str) -> Iterator[Tuple[int, str, Tuple[str, ...]]]:
+    """(tick, hash, crcs por campo) de cada línea de un log de WorldHasher."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            parts = line.split()
+            yield int(parts[0]), parts[1], tuple(parts[2:])
+
+
+def _diff_fields(a: Tuple[str, ...], b: Tuple[str, ...]) -> Tuple[str, ...]:
+    if len(a) != len(FIELDS) or len(b) != len(FIELDS):
+        return ("?",)
+    return tuple(f for f, x, y in zip(FIELDS, a, b) if x != y)
+
+
+def compare(path_a: str, path_b: str) -> Optional[Divergence]:
+    """Primer tick en que los logs difieren (o en que uno se termina antes)."""
+    ia, ib = read_log(path_a), read_log(path_b)
+    for a, b in zip(ia, ib):
+        if a[0] != b[0] or a[1] != b[1]:
+            return Divergence(a[0], _diff_fields(a[2], b[2]) or ("time",), a[1], b[1])
+    rest_a, rest_b = next(ia, None), next(ib, None)
+    if rest_a is not None or rest_b is not None:
+        tick = (rest_a or rest_b)[0]
+        return Divergence(tick, ("length",), rest_a[1] if rest_a else "-", rest_b[1] if rest_b else "-")
+    return None
+
+
+class DesyncDetector:
+    """Corrida en vivo contra una grabación: check() en cada tick, tras WorldHasher.update()."""
+
+    def __init__(self, path: str):
+        self._ref = read_log(path)
+        self.divergence: Optional[Divergence] = None
+        self.checked = 0
+
+    def check(self, tick: int, hasher: WorldHasher) -> Optional[Divergence]:
+        if self.divergence is not None:
+            return self.divergence
+        ref = next(self._ref, None)
+        got = hasher.hash.hex()
+        if ref is None:
+            return None   # la grabación se terminó: no hay contra qué comparar
+        self.checked += 1
+        crcs = tuple(f"{c:08x}" for c in hasher.crcs)
+        if ref[0] != tick or ref[1] != got:
+            self.divergence = Divergence(tick, _diff_fields(ref[2], crcs) or ("time",), ref[1], got)
+        return self.divergence
+
+
+def describe(div: Divergence, state: Optional[Dict[str, tuple]] = None) -> str:
+    lines = [f"[Desync] primera diferencia en el tick {div.tick}: {', '.join(div.fields)} "
+             f"(esperado {div.expected}, obtenido {div.got})"]
+    if state is not None:
+        for f in div.fields:
+            if f in state:
+                lines.append(f"[Desync]   {f} = {state[f]!r}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara dos logs de hash por tick (--hash-log del headless).")
+    parser.add_argument("a")
+    parser.add_argument("b")
+    args = parser.parse_args(argv)
+
+    div = compare(args.a, args.b)
+    if div is None:
+        print(f"[Desync] sin diferencias ({sum(1 for _ in read_log(args.a))} ticks)")
+        return 0
+    print(describe(div))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
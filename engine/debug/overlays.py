@@ -1,17 +1,35 @@
 """
 Overlays de depuración para eventos temporales (p.ej., piques IN/OUT).
 Diseño:
-- DebugOverlays.add_bounce(x, y, inside)  -> registra un marcador temporal
-- DebugOverlays.update(dt_ms)             -> decrementa vida
+- DebugOverlays.add_bounce(x, y, inside, label) -> registra un marcador temporal
+  (label: fallo de engine.rules.court_model, p.ej. "long" / "deuce service box")
+- DebugOverlays.update(dt_ms)             -> decrementa vida (sin scheduler)
 - DebugOverlays.draw(surface)             -> dibuja marcadores vigentes
+- DebugOverlays.snapshot()                -> copia inmutable para el hilo de render
+- DebugOverlays.challenge_snapshot()      -> (review, transcurrido, duración) de la revisión, o ()
+- DebugOverlays.show_challenge(review)    -> revisión de un fallo: recuadro con zoom sobre
+  el pique que repite el último tramo de la pelota (review: line_calls.Review o
+  cualquier objeto con spot / path / shadow / lines / verdict / label / margin)
 
-No tiene dependencias del resto del motor (solo pygame).
+Con un scheduler (engine/timing/scheduler.py) cada marcador programa su propio
+vencimiento y update() no recorre la lista en cada frame.
+
+No tiene dependencias del resto del motor (solo pygame y engine.config).
 """
 
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+try:
+    from engine.config.court import CHALLENGE_MS, CHALLENGE_ZOOM
+except Exception:
+    CHALLENGE_MS, CHALLENGE_ZOOM = 3500, 6.0
+
+# Recuadro de la revisión (esquina superior derecha)
+_CHALLENGE_SIZE = 200
+_CHALLENGE_MARGIN = 12
+
 import pygame
 
 
@@ -22,6 +40,7 @@ class BounceMarker:
     inside: bool         # True = IN, False = OUT
     ttl_ms: int = 450    # vida útil en ms
     max_ttl_ms: int = 450
+    label: str = ""      # texto del fallo ("" = IN / OUT)
 
     def alive(self) -> bool:
         return self.ttl_ms > 0
@@ -33,33 +52,105 @@ class BounceMarker:
 
 
 class DebugOverlays:
-    def __init__(self):
+    def __init__(self, timers=None):
         self._bounces: List[BounceMarker] = []
         self._font_small: Optional[pygame.font.Font] = None
+        self.timers = timers
+        self._expires = {}   # id(marker) -> vencimiento (ms del scheduler)
+
+        # Re-render del fade cada N frames (el governor de calidad lo sube a 2)
+        self.update_every = 1
+        self._frame = 0
+        self._seg_cache = {}     # (x, y, inside) -> (alpha, Surface)
+        self._label_cache = {}   # label -> (texto, sombra)
+
+        # Revisión en curso: (review, inicio, duración) en ms de self.timers (tiempo de frame)
+        # o de pygame.time.get_ticks() si no hay scheduler
+        self._challenge = None
+        self._challenge_timer = None
 
     # ---------- API ----------
-    def add_bounce(self, x: int, y: int, inside: bool, ttl_ms: int = 450) -> None:
+    def add_bounce(self, x: int, y: int, inside: bool, ttl_ms: int = 450, label: str = "") -> None:
+        """
+        Agrega un marcador de pique. 'inside' indica si fue dentro (IN) o fuera (OUT);
+        label reemplaza el texto (p.ej. "LONG", "WIDE", "LET").
+        """
+        m = BounceMarker(x=x, y=y, inside=inside, ttl_ms=ttl_ms, max_ttl_ms=ttl_ms, label=label)
+        self._bounces.append(m)
+        if self.timers is not None:
+            self._expires[id(m)] = self.timers.now_ms + ttl_ms
+            self.timers.schedule(ttl_ms, self._expire, m)
+
+    def show_challenge(self, review, duration_ms: int = CHALLENGE_MS) -> None:
         """
-        Agrega un marcador de pique. 'inside' indica si fue dentro (IN) o fuera (OUT).
+        Arranca la revisión de un fallo (reemplaza la anterior). Corre con el scheduler de UI
+        (tiempo de frame, no el de simulación): no depende de F5/F6.
         """
-        self._bounces.append(BounceMarker(x=x, y=y, inside=inside, ttl_ms=ttl_ms, max_ttl_ms=ttl_ms))
+        self._challenge = (review, self._now_ms(), int(duration_ms))
+        if self.timers is not None:
+            self.timers.cancel(self._challenge_timer)
+            self._challenge_timer = self.timers.schedule(int(duration_ms), self._end_challenge)
+
+    def challenge_active(self) -> bool:
+        ch = self._challenge
+        if ch is not None and self.timers is None and pygame.time.get_ticks() - ch[1] >= ch[2]:
+            self._challenge = ch = None
+        return ch is not None
+
+    def challenge_snapshot(self) -> tuple:
+        """(review, transcurrido, duración) en ms de la revisión en curso, o () si no hay."""
+        if not self.challenge_active():
+            return ()
+        review, t0, duration = self._challenge
+        return review, self._now_ms() - t0, duration
+
+    def _end_challenge(self) -> None:
+        self._challenge_timer = None
+        self._challenge = None
+
+    def _now_ms(self) -> float:
+        return self.timers.now_ms if self.timers is not None else pygame.time.get_ticks()
 
     def clear(self) -> None:
         self._bounces.clear()
+        self._expires.clear()
+        self._challenge = None
+        if self.timers is not None:
+            self.timers.cancel(self._challenge_timer)
+        self._challenge_timer = None
+
+    def has_active(self) -> bool:
+        """True si hay marcadores vivos (animándose)."""
+        return bool(self._bounces)
 
     def update(self, dt_ms: int) -> None:
         """
         dt_ms: milisegundos transcurridos desde el último frame.
         """
-        if not self._bounces:
+        if not self._bounces or self.timers is not None:
             return
         for m in self._bounces:
             m.ttl_ms = max(0, m.ttl_ms - int(dt_ms))
         # eliminar muertos
         self._bounces = [m for m in self._bounces if m.alive()]
 
-    def draw(self, surface: pygame.Surface) -> None:
-        if not self._bounces:
+    def snapshot(self) -> Tuple[BounceMarker, ...]:
+        """Copia de los marcadores vigentes (el hilo de render no toca la lista viva)."""
+        self._sync_ttl()
+        return tuple(BounceMarker(m.x, m.y, m.inside, m.ttl_ms, m.max_ttl_ms, m.label) for m in self._bounces)
+
+    def draw(self, surface: pygame.Surface, markers=None, challenge=None) -> None:
+        """
+        markers: snapshot() previo; None = marcadores vivos. challenge: challenge_snapshot()
+        previo; None = la revisión viva. El hilo de render pasa las dos copias: _end_challenge
+        corre en el hilo principal y puede borrar la revisión a mitad del dibujo.
+        """
+        if markers is None:
+            self._sync_ttl()
+            markers = self._bounces
+        if challenge is None:
+            challenge = self.challenge_snapshot()
+        if not markers and not challenge:
             return
 
         # Lazy font
@@ -69,19 +160,115 @@ class DebugOverlays:
             except Exception:
                 self._font_small = pygame.font.Font(None, 14)
 
-        for m in self._bounces:
+        if challenge:
+            self._draw_challenge(surface, challenge)
+        if not markers:
+            return
+
+        self._frame += 1
+        for m in markers:
             self._draw_bounce_marker(surface, m)
 
+        # Olvidar marcadores que ya no están
+        if len(self._seg_cache) > len(markers):
+            alive = {(m.x, m.y, m.inside) for m in markers}
+            self._seg_cache = {k: v for k, v in self._seg_cache.items() if k in alive}
+
     # ---------- Internos ----------
+    def _expire(self, m: BounceMarker) -> None:
+        self._expires.pop(id(m), None)
+        if m in self._bounces:
+            self._bounces.remove(m)
+
+    def _sync_ttl(self) -> None:
+        """Con scheduler, la vida restante (fade) se deriva del reloj al dibujar."""
+        if self.timers is None:
+            return
+        now = self.timers.now_ms
+        for m in self._bounces:
+            m.ttl_ms = max(0, int(self._expires.get(id(m), now) - now))
+
     def _draw_bounce_marker(self, surface: pygame.Surface, m: BounceMarker) -> None:
         a = m.alpha()
+        label = m.label.upper() if m.label else ("IN" if m.inside else "OUT")
+        radius = 8
+
+        # El disco solo se re-renderiza si cambió el alpha (y cada update_every frames)
+        key = (m.x, m.y, m.inside)
+        cached = self._seg_cache.get(key)
+        if cached is not None and (cached[0] == a or self._frame % self.update_every):
+            seg = cached[1]
+        else:
+            seg = self._build_marker_surface(m.inside, a, radius)
+            self._seg_cache[key] = (a, seg)
+
+        seg_rect = seg.get_rect(center=(m.x, m.y))
+        surface.blit(seg, seg_rect)
+
+        # Etiqueta
+        if self._font_small:
+            if label not in self._label_cache:
+                txt_col = (255, 255, 255)
+                # Texto + sombra
+                self._label_cache[label] = (self._font_small.render(label, True, txt_col),
+                                            self._font_small.render(label, True, (0, 0, 0)))
+            txt, sh = self._label_cache[label]
+            off = 1
+            surface.blit(sh, txt.get_rect(midtop=(m.x + off, m.y + radius + 4 + off)))
+            surface.blit(txt, txt.get_rect(midtop=(m.x, m.y + radius + 4)))
+
+    def _draw_challenge(self, surface: pygame.Surface, challenge: tuple) -> None:
+        """Recuadro con zoom: líneas, sombra y pelota hasta el pique, y el margen del fallo."""
+        review, elapsed, duration = challenge
+        # Primer 40%: la pelota recorre el tramo; después queda la marca
+        u = min(1.0, elapsed / (duration * 0.4))
+
+        size, zoom = _CHALLENGE_SIZE, CHALLENGE_ZOOM
+        box = pygame.Rect(surface.get_width() - size - _CHALLENGE_MARGIN, _CHALLENGE_MARGIN, size, size)
+        cx, cy = box.center
+        sx, sy = review.spot
+
+        def z(p):
+            return (cx + (p[0] - sx) * zoom, cy + (p[1] - sy) * zoom)
+
+        panel = pygame.Surface(box.size, pygame.SRCALPHA)
+        panel.fill((20, 60, 40, 220))
+        surface.blit(panel, box.topleft)
+        clip = surface.get_clip()
+        surface.set_clip(box)
+
+        for poly in review.lines:
+            pygame.draw.polygon(surface, (235, 235, 235), [z(p) for p in poly])
+
+        n = len(review.path) - 1
+        upto = max(1, int(round(u * n)))
+        if n > 0:
+            pygame.draw.lines(surface, (0, 0, 0), False, [z(p) for p in review.shadow[:upto + 1]], 2)
+            pygame.draw.lines(surface, (255, 230, 90), False, [z(p) for p in review.path[:upto + 1]], 2)
+        ball = z(review.path[upto] if n > 0 else review.spot)
+        pygame.draw.circle(surface, (255, 255, 255), (int(ball[0]), int(ball[1])), max(3, int(zoom)), 1)
+
+        if u >= 1.0:
+            inside = review.verdict != "out"
+            col = (40, 220, 120) if inside else (240, 70, 70)
+            pygame.draw.circle(surface, col, (cx, cy), max(2, int(zoom * 0.5)))
+            text = f"{review.label.upper()}  {review.margin:+.2f}"
+            txt = self._font_small.render(text, True, (255, 255, 255))
+            sh = self._font_small.render(text, True, (0, 0, 0))
+            pos = txt.get_rect(midbottom=(cx, box.bottom - 6))
+            surface.blit(sh, pos.move(1, 1))
+            surface.blit(txt, pos)
+
+        surface.set_clip(clip)
+        pygame.draw.rect(surface, (255, 255, 255), box, 1)
+
+    @staticmethod
+    def _build_marker_surface(inside: bool, a: int, radius: int) -> pygame.Surface:
         # Colores con alpha
-        col_fill = (40, 220, 120, a) if m.inside else (240, 70, 70, a)
-        col_edge = (25, 140, 75, a) if m.inside else (170, 40, 40, a)
-        label = "IN" if m.inside else "OUT"
+        col_fill = (40, 220, 120, a) if inside else (240, 70, 70, a)
+        col_edge = (25, 140, 75, a) if inside else (170, 40, 40, a)
 
         # Círculo + cruz
-        radius = 8
         seg = pygame.Surface((radius * 4, radius * 4), pygame.SRCALPHA)
         center = (seg.get_width() // 2, seg.get_height() // 2)
 
@@ -92,16 +279,4 @@ class DebugOverlays:
         # Cruz sutil
         pygame.draw.line(seg, col_edge, (center[0] - radius, center[1]), (center[0] + radius, center[1]), 2)
         pygame.draw.line(seg, col_edge, (center[0], center[1] - radius), (center[0], center[1] + radius), 2)
-
-        seg_rect = seg.get_rect(center=(m.x, m.y))
-        surface.blit(seg, seg_rect)
-
-        # Etiqueta
-        if self._font_small:
-            txt_col = (255, 255, 255)
-            txt = self._font_small.render(label, True, txt_col)
-            # Sombra
-            sh = self._font_small.render(label, True, (0, 0, 0))
-            off = 1
-            surface.blit(sh, txt.get_rect(midtop=(m.x + off, m.y + radius + 4 + off)))
-            surface.blit(txt, txt.get_rect(midtop=(m.x, m.y + radius + 4)))
+        return seg
@@ -0,0 +1,136 @@
+"""
+Watchdog de cuelgues del loop principal (opcional, VJ2D_WATCHDOG=1).
+Diseño:
+- StallWatchdog.start()            -> hilo daemon que vigila los check-ins
+- StallWatchdog.checkin()          -> el loop lo llama en cada frame
+- StallWatchdog.suspend()          -> antes de una espera legítima (idle: pygame.event.wait)
+- StallWatchdog.note_event(evento) -> guarda los últimos eventos de input
+
+Si pasa más de threshold_ms sin check-in, captura el stack del hilo principal
+(sys._current_frames), el estado del juego y los últimos eventos, y los escribe
+en un log rotativo. Al volver el check-in registra cuánto duró el cuelgue.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Dict, Optional
+
+import pygame
+
+
+class StallWatchdog:
+    def __init__(self, threshold_ms: float = 250.0, log_path: str = os.path.join("logs", "stalls.log"),
+                 context: Optional[Callable[[], Dict]] = None,
+                 max_bytes: int = 1_000_000, backups: int = 3, max_events: int = 20):
+        self.threshold_s = max(0.01, float(threshold_ms) / 1000.0)
+        self.log_path = log_path
+        self.context = context               # () -> dict con estado del juego (estado_juego, etc.)
+        self._events: deque = deque(maxlen=max(1, int(max_events)))
+
+        self._main_ident = threading.main_thread().ident
+        self._last = time.perf_counter()
+        self._armed = False                  # False mientras el loop espera a propósito
+        self._stall_start: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stalls = 0
+
+        self._log = logging.getLogger("vj2d.watchdog")
+        self._log.setLevel(logging.INFO)
+        self._log.propagate = False
+        self._max_bytes = int(max_bytes)
+        self._backups = int(backups)
+
+    # ---------------------------
+    # Ciclo de vida
+    # ---------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        if not self._log.handlers:
+            folder = os.path.dirname(self.log_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            handler = RotatingFileHandler(self.log_path, maxBytes=self._max_bytes,
+                                          backupCount=self._backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._log.addHandler(handler)
+        self.checkin()
+        self._thread = threading.Thread(target=self._run, name="vj2d-watchdog", daemon=True)
+        self._thread.start()
+        print(f"[Watchdog] activo: umbral={self.threshold_s * 1000:.0f}ms log={self.log_path}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+        for h in list(self._log.handlers):
+            h.close()
+            self._log.removeHandler(h)
+
+    # ---------------------------
+    # Hilo principal
+    # ---------------------------
+    def checkin(self) -> None:
+        now = time.perf_counter()
+        if self._stall_start is not None:
+            self._log.info(f"[STALL FIN] duró {(now - self._stall_start) * 1000:.0f}ms")
+            self._stall_start = None
+        self._last = now
+        self._armed = True
+
+    def suspend(self) -> None:
+        """Espera legítima a continuación (idle): no cuenta como cuelgue hasta el próximo checkin()."""
+        self._armed = False
+
+    def note_event(self, evento) -> None:
+        self._events.append((time.perf_counter(), _event_name(evento)))
+
+    # ---------------------------
+    # Hilo watchdog
+    # ---------------------------
+    def _run(self) -> None:
+        poll = self.threshold_s / 4.0
+        while not self._stop.wait(poll):
+            if not self._armed or self._stall_start is not None:
+                continue
+            now = time.perf_counter()
+            if now - self._last > self.threshold_s:
+                self._stall_start = self._last
+                self.stalls += 1
+                self._report(now - self._last)
+
+    def _report(self, elapsed_s: float) -> None:
+        frame = sys._current_frames().get(self._main_ident)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "(sin stack)\n"
+        try:
+            ctx = self.context() if self.context else {}
+        except Exception as e:
+            ctx = {"error": repr(e)}
+        now = time.perf_counter()
+        events = ", ".join(f"{name}@-{(now - t) * 1000:.0f}ms" for t, name in list(self._events)) or "-"
+
+        self._log.info(
+            f"[STALL] frame sin check-in hace {elapsed_s * 1000:.0f}ms (umbral {self.threshold_s * 1000:.0f}ms)\n"
+            f"  contexto: {ctx}\n"
+            f"  últimos eventos: {events}\n"
+            f"  stack del hilo principal:\n{stack}"
+        )
+        print(f"[Watchdog] cuelgue de {elapsed_s * 1000:.0f}ms en '{ctx.get('estado_juego', '?')}' → {self.log_path}")
+
+
+def _event_name(evento) -> str:
+    """Nombre corto de un evento (KEYDOWN:space, QUIT, ...)."""
+    try:
+        name = pygame.event.event_name(evento.type)
+        key = getattr(evento, "key", None)
+        return f"{name}:{pygame.key.name(key)}" if key is not None else name
+    except Exception:
+        return str(getattr(evento, "type", evento))
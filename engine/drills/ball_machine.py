@@ -0,0 +1,101 @@
+"""
+Modo práctica: máquina lanzapelotas hacia el jugador 1.
+Diseño:
+- BallMachine(game, pool)  -> tira pelotas cada 1/rate s (game.timers, tiempo de simulación)
+- BallMachine.start/stop() -> arranca / corta y devuelve todas las pelotas al pool
+- BallMachine.on_hit(ball) -> el jugador devolvió esa pelota (lo llama Game)
+- BallMachine.update()     -> tras el tick: las pelotas que terminaron (out / doble pique) vuelven al pool
+- BallMachine.hud_text()   -> texto del marcador del modo
+
+Las pelotas salen de un BallPool, así que en sesiones largas no se alocan pelotas
+ni Surfaces nuevas. Con rate alto y cientos de pelotas en vuelo sirve también de
+prueba de carga de la física, las colisiones y el render.
+"""
+
+import os
+
+from engine.utils import rng
+
+try:
+    from engine.config.drills import DRILL_RATE_HZ, DRILL_MAX_BALLS, DRILL_ORIGIN, DRILL_ZONES
+except Exception:
+    DRILL_RATE_HZ, DRILL_MAX_BALLS = 1.5, 200
+    DRILL_ORIGIN = (100.0, -140.0, 30.0)
+    DRILL_ZONES = ("deep_back_left", "back_left", "back_right", "deep_back_right")
+
+_RNG = rng.stream("drill")
+
+
+class BallMachine:
+    def __init__(self, game, pool, rate_hz=None, max_balls=None, zones=DRILL_ZONES, origin=DRILL_ORIGIN):
+        self.game = game
+        self.pool = pool
+        self.rate_hz = float(rate_hz if rate_hz is not None else os.getenv("VJ2D_DRILL_RATE", DRILL_RATE_HZ))
+        self.max_balls = int(max_balls if max_balls is not None else os.getenv("VJ2D_DRILL_MAX", DRILL_MAX_BALLS))
+        self.zones = tuple(z for z in zones if z in game.field.zones) or tuple(game.field.zones)
+        self.origin = origin
+        self.active = False
+        self._timer = None
+        self._hit = set()     # id() de las pelotas devueltas en su vida actual
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.fed = 0          # lanzadas
+        self.returned = 0     # devueltas por el jugador (terminaron después del golpe)
+        self.missed = 0       # terminaron sin que el jugador las devolviera
+        self.peak = 0         # máximo de pelotas en vuelo
+
+    # ---------------------------
+    # Ciclo de vida
+    # ---------------------------
+    def start(self):
+        self.stop()
+        self._reset_stats()
+        self.active = True
+        self._timer = self.game.timers.schedule(0, self._feed)
+        print(f"[Drill] Máquina: {self.rate_hz:g} pelotas/s, máx {self.max_balls} en vuelo")
+
+    def stop(self):
+        self.active = False
+        self.game.timers.cancel(self._timer)
+        self._timer = None
+        self.pool.release_all(self.game.balls)
+        self._hit.clear()
+
+    # ---------------------------
+    # Lanzamiento
+    # ---------------------------
+    def _feed(self):
+        if not self.active:
+            return
+        balls = self.game.balls
+        if len(balls) < self.max_balls:
+            ox, oy, oz = self.origin
+            ball = self.pool.acquire(ox + _RNG.uniform(-20.0, 20.0), oy, z=oz)
+            ball.hit_by_player(None, zone=_RNG.choice(self.zones))
+            balls.add(ball)
+            self.fed += 1
+            self.peak = max(self.peak, len(balls))
+        self._timer = self.game.timers.schedule(1000.0 / max(0.01, self.rate_hz), self._feed)
+
+    def on_hit(self, ball):
+        self._hit.add(id(ball))
+
+    # ---------------------------
+    # Tick
+    # ---------------------------
+    def update(self):
+        """Devuelve al pool las pelotas que terminaron en este tick."""
+        for ball in self.game.balls.sprites():
+            if not ball.out_of_bounds:
+                continue
+            if id(ball) in self._hit:
+                self._hit.discard(id(ball))
+                self.returned += 1
+            else:
+                self.missed += 1
+            self.pool.release(ball)
+
+    def hud_text(self) -> str:
+        return (f"Práctica  lanzadas {self.fed}  devueltas {self.returned}  "
+                f"en juego {len(self.game.balls)}")
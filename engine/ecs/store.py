@@ -0,0 +1,166 @@
+"""
+Almacén de entidades en struct-of-arrays: una columna contigua por campo de componente.
+Diseño:
+- EntityStore(capacity)          -> columnas (array.array) por componente, ids reciclados
+- EntityStore.spawn(kind, mask)  -> eid con esos componentes (campos en cero)
+- EntityStore.destroy(eid)       -> libera la ranura (la reusa el próximo spawn)
+- EntityStore.ids(mask, kind)    -> eids vivos con esos componentes (cacheado hasta el próximo alta/baja)
+- bind(obj, store, kind, mask)   -> alta de la entidad de una fachada (se libera sola con el objeto)
+- sync(store, *groups)           -> fachadas en juego -> columnas (una vez por frame dibujado)
+- live_ids(store, kind)          -> eids en juego según el último sync
+
+Componentes (campos):
+    TRANSFORM   x, y, z, px, py, pz     (posición de mundo y la del tick anterior)
+                live                    (1 = estaba en juego en el último sync; 0 = p.ej. en el BallPool)
+    HITBOX      radius                  (círculo de la pelota)
+
+Alcance: es un espejo del lado del render, no donde corre la simulación. Ball sigue
+simulando sobre sus atributos (snap_prev, vuelo y contactos por objeto): un
+descriptor por campo que fuera a las columnas costaba unos 160 ns por acceso en el
+camino más caliente del tick. snapshot.capture llama a sync una vez por frame
+dibujado y arma las pelotas recorriendo las columnas. Solo hay los componentes que
+alguien lee (los jugadores no se espejan). ENTITY_FIELDS de la clase dice qué
+columnas llena entity_row(), en ese orden. Las columnas crecen en el lugar (la
+identidad del array no cambia), así que una referencia a store.x sigue siendo
+válida después de un spawn.
+"""
+
+import weakref
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Componentes (máscara de bits)
+TRANSFORM = 1 << 0
+HITBOX = 1 << 1
+
+# Tipos de entidad
+BALL = 1
+
+COMPONENTS: Dict[int, Tuple[Tuple[str, str], ...]] = {
+    TRANSFORM: (("x", "d"), ("y", "d"), ("z", "d"), ("px", "d"), ("py", "d"), ("pz", "d"),
+                ("live", "B")),
+    HITBOX: (("radius", "H"),),
+}
+
+
+class EntityStore:
+    def __init__(self, capacity: int = 16):
+        self.capacity = 0
+        self.cols: Dict[str, array] = {}
+        for fields in COMPONENTS.values():
+            for name, code in fields:
+                self.cols[name] = array(code)
+        self.mask = array("B")    # componentes de cada ranura (0 = libre)
+        self.kind = array("B")
+        # store.x, store.radius, ... = las mismas columnas (para quien las recorre)
+        self.__dict__.update(self.cols)
+
+        self._free: List[int] = []
+        self._ids: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        self.alive = 0
+        self._grow(max(1, int(capacity)))
+
+    # ---------------------------
+    # Memoria
+    # ---------------------------
+    def _grow(self, capacity: int) -> None:
+        n = capacity - self.capacity
+        for col in self.cols.values():
+            col.frombytes(bytes(col.itemsize * n))
+        self.mask.frombytes(bytes(n))
+        self.kind.frombytes(bytes(n))
+        # Los huecos nuevos se entregan en orden ascendente
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, kind: int, mask: int) -> int:
+        if not self._free:
+            self._grow(self.capacity * 2)
+        eid = self._free.pop()
+        for col in self.cols.values():
+            col[eid] = 0
+        self.mask[eid] = mask
+        self.kind[eid] = kind
+        self.alive += 1
+        self._ids.clear()
+        return eid
+
+    def destroy(self, eid: int) -> None:
+        if not self.mask[eid]:
+            return
+        self.mask[eid] = 0
+        self.kind[eid] = 0
+        self.alive -= 1
+        self._free.append(eid)
+        self._ids.clear()
+
+    def __len__(self) -> int:
+        return self.alive
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def ids(self, mask: int = 0, kind: int = 0) -> Tuple[int, ...]:
+        """Entidades vivas que tienen todos los componentes de mask (y son de ese kind, si se pide)."""
+        key = (mask, kind)
+        out = self._ids.get(key)
+        if out is None:
+            m, k = self.mask, self.kind
+            out = self._ids[key] = tuple(
+                i for i in range(self.capacity)
+                if m[i] and (m[i] & mask) == mask and (not kind or k[i] == kind))
+        return out
+
+
+_DEFAULT: Optional[EntityStore] = None
+
+
+def default_store() -> EntityStore:
+    """Store compartido para las fachadas creadas sin game.entities (herramientas, scripts)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = EntityStore()
+    return _DEFAULT
+
+
+def store_of(game) -> EntityStore:
+    store = getattr(game, "entities", None)
+    return store if store is not None else default_store()
+
+
+def bind(obj, store: EntityStore, kind: int, mask: int) -> int:
+    """
+    Da de alta la entidad de obj; se libera cuando obj se recolecta.
+    type(obj).ENTITY_FIELDS nombra las columnas que llena obj.entity_row() en sync.
+    """
+    eid = store.spawn(kind, mask)
+    obj._store, obj._eid = store, eid
+    obj._entity_cols = tuple(store.cols[name] for name in type(obj).ENTITY_FIELDS)
+    weakref.finalize(obj, store.destroy, eid)
+    return eid
+
+
+# ---------------------------
+# Sistemas
+# ---------------------------
+def sync(store: EntityStore, *groups: Iterable) -> None:
+    """
+    Fachadas -> columnas (snapshot.capture, una vez por frame dibujado). Solo las de
+    `groups` (p.ej. game.balls) quedan live; el resto (pelotas en el BallPool)
+    conserva su última fila pero live_ids la saltea.
+    """
+    live = store.live
+    for e in store.ids(TRANSFORM):
+        live[e] = 0
+    for group in groups:
+        for obj in group:
+            e = obj._eid
+            for col, value in zip(obj._entity_cols, obj.entity_row()):
+                col[e] = value
+            live[e] = 1
+
+
+def live_ids(store: EntityStore, kind: int = 0) -> Tuple[int, ...]:
+    """Entidades (de ese kind, si se pide) que estaban en juego en el último sync."""
+    live = store.live
+    return tuple(e for e in store.ids(TRANSFORM, kind) if live[e])
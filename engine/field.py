@@ -3,7 +3,8 @@ import pygame
 from typing import Optional
 
 from engine.net import Net
-from engine.utils.screen import ANCHO, ALTO
+from engine.rules.court_model import default_court
+from engine.utils.iso import BALL as BALL_CAMERA
 
 class Field:
     """
@@ -20,26 +21,16 @@ class Field:
         self.right = width
         self.bottom = height
 
-        # Red (con física real, dibujada en 2D)
+        # Líneas, cuadros de saque y red en unidades de mundo (in/out, IA, overlays)
+        self.court = default_court()
+
+        # Red (deformable si hay NumPy, dibujada en 2D)
         self.net = Net(self)
 
         # ---------------------------
-        # ZONAS LÓGICAS (restauradas)
+        # ZONAS LÓGICAS: salen de la cancha (dentro de las líneas, sin tocar la red)
         # ---------------------------
-        self.zones = {
-            "deep_back_left":   (-45, 230, 150, 125),
-            "back_left":        (-45, 105, 150, 125),
-            "deep_front_left":  (-45, -145, 150, 125),
-            "front_left":       (-45, -20, 150, 125),
-
-            "deep_front_right": (105, -145, 150, 125),
-            "front_right":      (105, -20, 150, 125),
-            "deep_back_right":  (105, 230, 150, 125),
-            "back_right":       (105, 105, 150, 125),
-
-            "center_back":      (30, 105, 150, 250),
-            "center_front":     (30, -145, 150, 250),
-        }
+        self.zones = self.court.target_zones()
 
         # Textura principal
         cand = os.path.join("assets", "texturas", "Cancha.png")
@@ -82,7 +73,8 @@ class Field:
     # ---------------------------
     # Dibujo de cancha + red
     # ---------------------------
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, net_state=None) -> None:
+        """net_state: Net.snapshot() capturado en la simulación (None = red quieta)."""
         screen.fill((60, 160, 60))
 
         if self.texture:
@@ -104,9 +96,8 @@ class Field:
             pygame.draw.rect(screen, (0, 180, 0), rect)
             self._last_court_rect = rect
 
-        # Red (actualiza física + dibuja 2D recta)
-        self.net.update()
-        self.net.draw(screen)
+        # Red (la física corre en la simulación: Net.update; acá solo se dibuja)
+        self.net.draw(screen, net_state)
 
     # ---------------------------
     # DEBUG
@@ -115,4 +106,8 @@ class Field:
         if self._last_court_rect:
             pygame.draw.rect(surface, (0, 200, 255), self._last_court_rect, 2)
 
+        # Líneas del CourtModel proyectadas como la pelota (iso + ANCHO/2, ALTO/3)
+        for a, b in self.court.lines():
+            pygame.draw.line(surface, (255, 255, 255), BALL_CAMERA.project(*a), BALL_CAMERA.project(*b), 1)
+
         self.net.draw_debug(surface)
@@ -1,5 +1,6 @@
 import os
 import json
+import time
 import pygame
 from pathlib import Path
 from dataclasses import dataclass
@@ -16,8 +17,34 @@ from engine.field import Field
 from engine.utils.colors import AZUL_OSCURO, BLANCO
 from engine.utils.screen import ANCHO, ALTO, world_to_screen
 from engine.audio import AudioManager
-from engine.ball import Ball
+from engine.ball import Ball, BallPool
+from engine.physics.targeting import shot_table_for
+from engine.ecs.store import EntityStore
 from engine.background import Background
+from engine.timing.fixed_step import FixedTimestep
+from engine.timing.pacing import FramePacer, open_display
+from engine.timing.scheduler import Scheduler
+from engine.perf.gc_policy import GCPolicy
+from engine.physics.collision import CollisionWorld, ball_player_candidates
+from engine.rules.line_calls import LineJudge
+from engine.perf.governor import FrameGovernor
+from engine.render import snapshot as world_snapshot
+from engine.render.pipeline import RenderPipeline
+from engine.scenes.base import SceneStack
+from engine.scenes.game_scenes import MenuScene, OptionsScene, IngameScene, PauseScene, ResultScene
+
+try:
+    from engine.config.timing import SIM_HZ, RENDER_FPS, MAX_SIM_STEPS, IDLE_WAIT_MS, HIDDEN_WAIT_MS
+except Exception:
+    SIM_HZ, RENDER_FPS, MAX_SIM_STEPS = 120, 60, 8
+    IDLE_WAIT_MS, HIDDEN_WAIT_MS = 250, 1000
+
+# Eventos de ventana (pygame 2); getattr por compatibilidad con versiones viejas
+_EV_HIDDEN = {getattr(pygame, n) for n in ("WINDOWMINIMIZED", "WINDOWHIDDEN") if hasattr(pygame, n)}
+_EV_SHOWN = {getattr(pygame, n) for n in ("WINDOWRESTORED", "WINDOWSHOWN", "WINDOWEXPOSED", "WINDOWMAXIMIZED")
+             if hasattr(pygame, n)}
+_EV_FOCUS_LOST = getattr(pygame, "WINDOWFOCUSLOST", None)
+_EV_FOCUS_GAINED = getattr(pygame, "WINDOWFOCUSGAINED", None)
 
 # Debug overlays (pique IN/OUT)
 try:
@@ -31,6 +58,15 @@ try:
 except Exception:
     RestartCountdown = None  # type: ignore
 
+# Watchdog de cuelgues (opcional)
+try:
+    from engine.debug.watchdog import StallWatchdog
+except Exception:
+    StallWatchdog = None  # type: ignore
+
+# Carteles temporales no bloqueantes
+from engine.ui.banner import Banners
+
 # IA simple para P2 (modo 1P)
 try:
     from engine.ai.simple_ai import SimpleTennisAI
@@ -43,33 +79,72 @@ try:
 except Exception:
     ScoreManager = None  # type: ignore
 
+# Modo práctica (máquina lanzapelotas)
+try:
+    from engine.drills.ball_machine import BallMachine
+except Exception:
+    BallMachine = None  # type: ignore
+
 
 class Game:
     def __init__(self, player1_name="P1", player2_name="P2", screen=None):
-        # Ventana
-        self.PANTALLA = pygame.display.set_mode((ANCHO, ALTO))
+        # Config persistente de juego (modo, timing, pacing)
+        self.game_config_path = os.path.join("assets", "game_config.json")
+        self._load_game_config()
+
+        # Ventana (el modo de pacing decide si se pide vsync)
+        pacing = os.getenv("VJ2D_PACING", self._game_cfg.get("pacing", "tick"))
+        self.PANTALLA, pacing = open_display((ANCHO, ALTO), pacing)
         pygame.display.set_caption('Tennis Isométrico en construcción...')
 
         # Mundo
         self.field = Field(6, 10)
+        # Columnas de las pelotas (engine/ecs/store.py) para el snapshot de render
+        self.entities = EntityStore()
         self.jugador1 = Player(520, 350, field=self.field, jugador2=False, game=self)  # >x = derecha, >y = atrás
         self.jugador2 = Player(385, ALTO / 2 - 450, field=self.field, jugador2=True, game=self)
+        self.players = [self.jugador1, self.jugador2]
         self.background = Background(self)
 
-        # Reloj
-        self.reloj = pygame.time.Clock()
+        # Reloj / pacing de frames
+        self.render_fps = int(os.getenv("VJ2D_FPS", self._game_cfg.get("render_fps", RENDER_FPS)))
+        report_ms = int(os.getenv("VJ2D_PACING_REPORT", "0"))
+        self.pacer = FramePacer(pacing, self.render_fps, report_every_ms=report_ms)
+        self.reloj = self.pacer.clock
+
+        # Governor: baja la calidad si el trabajo por frame no entra en el presupuesto
+        budget_ms = float(os.getenv("VJ2D_FRAME_BUDGET_MS", 1000.0 / max(1, self.render_fps)))
+        self.governor = FrameGovernor(budget_ms, enabled=os.getenv("VJ2D_GOVERNOR", "1") == "1")
+
+        # Temporizadores: de simulación (jugabilidad) y de frame (audio, overlays, 3-2-1)
+        self.timers = Scheduler()
+        self.ui_timers = Scheduler()
 
         # --- AUDIO ---
-        self.audio = AudioManager()
+        self.audio = AudioManager(timers=self.ui_timers)
         self._load_audio_assets()
 
         # Config persistente de audio
         self.config_path = os.path.join("assets", "audio_config.json")
         self._load_audio_config()
 
-        # Config persistente de juego (modo)
-        self.game_config_path = os.path.join("assets", "game_config.json")
-        self._load_game_config()
+        # Simulación a paso fijo (física/jugadores/IA) desacoplada del render
+        sim_hz = float(os.getenv("VJ2D_SIM_HZ", self._game_cfg.get("sim_hz", SIM_HZ)))
+        self.sim = FixedTimestep(sim_hz, MAX_SIM_STEPS)
+        self.sim.time_scale = float(os.getenv("VJ2D_TIME_SCALE", "1.0"))
+
+        # Idle: menús/pausa en espera de eventos; ventana oculta ≈ 0% CPU
+        self.idle_enabled = os.getenv("VJ2D_IDLE", "1") == "1"
+        self._window_hidden = False
+        self._window_focused = True
+        self._needs_redraw = True
+
+        # Render en un hilo aparte a partir de snapshots del mundo (opcional)
+        self.pipeline = None
+        if os.getenv("VJ2D_PIPELINE", "1" if self._game_cfg.get("pipeline") else "0") == "1":
+            # El hilo dibuja en Surface fuera de pantalla; el flip queda en el hilo principal
+            self.pipeline = RenderPipeline(self._draw_snapshot, [self.PANTALLA.copy() for _ in range(2)])
+            print("[Render] pipeline simulación/render activo")
 
         # Flags de desarrollo
         self.debug_audio = os.getenv("VJ2D_DEBUG_AUDIO", "1") == "1"
@@ -80,10 +155,17 @@ class Game:
 
         # ---- MODO / ESTADOS ----
         self.modo = os.getenv("VJ2D_MODO", self.modo if hasattr(self, "modo") else "1P")
-        self.estado_juego = 'menu'  # 'menu'|'opciones'|'jugando'|'pausa'|'victoria'|'gameover'
+        # Pila de escenas; estado_juego (solo lectura) es el nombre de la de arriba
+        self.scenes = SceneStack()
+        self._scenes = {sc.name: sc for sc in (
+            MenuScene(self), OptionsScene(self), IngameScene(self), PauseScene(self),
+            ResultScene(self, victory=True), ResultScene(self, victory=False),
+        )}
+        self.scenes.set(self._scenes['menu'])
+        self.running = True
 
         # Menú simple
-        self.menu_items = ["Comenzar", "Opciones", "Salir"]
+        self.menu_items = ["Comenzar", "Práctica", "Opciones", "Salir"] if BallMachine else ["Comenzar", "Opciones", "Salir"]
         self.menu_index = 0
 
         # --- Fuentes ---
@@ -147,11 +229,19 @@ class Game:
             self.menu_bg = pygame.transform.scale(self.menu_bg, (ANCHO, ALTO))
 
         # Score
-        self.score = ScoreManager() if ScoreManager else None
+        self.banners = Banners(self.ui_timers, on_change=self._request_redraw)
+        self.score = ScoreManager(banners=self.banners) if ScoreManager else None
 
         # Pelotas
         self.balls = pygame.sprite.Group()
         self._ball_main = None  # referencia a la pelota principal
+        # Rally nuevo pedido desde Ball.update (punto / let): se arma al terminar balls.update()
+        self._balls_updating = False
+        self._rally_pending = False
+        self.collisions = CollisionWorld()  # spatial hash pelotas / raquetas
+        self.ball_pool = BallPool(self)     # pelotas recicladas entre rallies / drills
+        self.drill = None                   # BallMachine activa (modo práctica) o None
+        self._ball_machine = None
         self.current_server = "P1"
 
         # IA / control según modo
@@ -164,10 +254,11 @@ class Game:
         else:
             self.jugador2.is_human = True
 
-        # Debug overlay (F1 = bounds, F3 = bounces)
+        # Debug overlay (F1 = bounds, F3 = bounces, F4 = revisión del último fallo)
         self._debug_bounds = False
-        self.debug_overlays = DebugOverlays() if DebugOverlays else None
+        self.debug_overlays = DebugOverlays(self.ui_timers) if DebugOverlays else None
         self.show_bounce_debug = True
+        self.line_calls = LineJudge(self.field.court)
 
         # Mute música (legacy, mantenido para UI de opciones)
         self._music_muted = False
@@ -188,17 +279,33 @@ class Game:
         self.last_hitter = None  # "P1"/"P2"/None"
 
         # Cuenta regresiva de reinicio
-        self._restart_cd = RestartCountdown(self._reiniciar_partida) if RestartCountdown else None
+        self._restart_cd = RestartCountdown(self._reiniciar_partida, timers=self.ui_timers) if RestartCountdown else None
         self._restart_block_input = False  # si True, no procesamos entradas durante 3-2-1
 
+        # Tabla de puntería (grilla por efecto) en la carga, no en el primer golpe del rally
+        shot_table_for(self.field, self.sim.step_ms)
+
+        # GC: assets ya cargados → freeze; sin GC automático durante los rallies
+        self.gc_policy = GCPolicy(enabled=os.getenv("VJ2D_GC", "1") == "1")
+        self.gc_policy.after_load()
+
+        # Watchdog de frames colgados (VJ2D_WATCHDOG=1; umbral VJ2D_WATCHDOG_MS)
+        self.watchdog = None
+        if StallWatchdog and os.getenv("VJ2D_WATCHDOG", "0") == "1":
+            self.watchdog = StallWatchdog(float(os.getenv("VJ2D_WATCHDOG_MS", "250")),
+                                          context=self._watchdog_context)
+
     # ---------------------------
     # Config de juego (modo 1P/2P)
     # ---------------------------
     def _load_game_config(self):
+        self._game_cfg = {}
         try:
             if os.path.exists(self.game_config_path):
                 with open(self.game_config_path, "r", encoding="utf-8") as f:
                     cfg = json.load(f)
+                if isinstance(cfg, dict):
+                    self._game_cfg = cfg
                 m = str(cfg.get("modo", "1P")).upper()
                 if m in ("1P", "2P"):
                     self.modo = m
@@ -211,8 +318,11 @@ class Game:
     def _save_game_config(self):
         try:
             os.makedirs(os.path.dirname(self.game_config_path), exist_ok=True)
+            # Se preservan las demás claves (sim_hz, render_fps, ...)
+            cfg = dict(self._game_cfg)
+            cfg["modo"] = self.modo
             with open(self.game_config_path, "w", encoding="utf-8") as f:
-                json.dump({"modo": self.modo}, f, indent=2)
+                json.dump(cfg, f, indent=2)
         except Exception as e:
             print(f"[GameCfg] No se pudo guardar game_config.json: {e}")
 
@@ -354,321 +464,429 @@ class Game:
     # Bucle principal
     # ---------------------------
     def game_loop(self):
-        ejecutando = True
-        while ejecutando:
-            dt = self.reloj.tick(15)
-
-            # Overlays (lifetime)
-            if self.debug_overlays:
-                self.debug_overlays.update(dt)
-            if self._restart_cd and self._restart_cd.active:
-                self._restart_cd.update(dt)
+        self.running = True
+        frame_t0 = None
+        if self.watchdog:
+            self.watchdog.start()
+        while self.running:
+            if self.watchdog:
+                self.watchdog.checkin()
+            # Governor: trabajo real del frame anterior (sin contar la espera del pacing ni idle)
+            if frame_t0 is not None:
+                self._observe_frame((time.perf_counter() - frame_t0) * 1000.0, dt)
+
+            # IDLE: bloquear hasta el próximo evento (o timeout) en vez de girar
+            eventos = []
+            idle = self._idle_ready()
+            if idle:
+                timeout = HIDDEN_WAIT_MS if (self._window_hidden or not self._window_focused) else IDLE_WAIT_MS
+                if self.watchdog:
+                    self.watchdog.suspend()  # esperar eventos no es un cuelgue
+                ev = pygame.event.wait(timeout)
+                if self.watchdog:
+                    self.watchdog.checkin()
+                if ev.type != pygame.NOEVENT:
+                    eventos.append(ev)
+            estado_previo = self.estado_juego
+
+            dt = self.pacer.tick(record=not idle)
+            frame_t0 = None if idle else time.perf_counter()
+
+            # Timers de frame (cooldowns de audio, vida de overlays, 3-2-1)
+            self.ui_timers.advance(dt)
+            self.gc_policy.tick()
+
+            # INPUT (teclas globales + escena activa)
+            eventos.extend(pygame.event.get())
+            if eventos:
+                self._needs_redraw = True
+            for evento in eventos:
+                if self.watchdog:
+                    self.watchdog.note_event(evento)
+                self._handle_window_event(evento)
 
-            # INPUT
-            for evento in pygame.event.get():
                 if evento.type == pygame.QUIT:
-                    ejecutando = False
-
+                    self.running = False
                 elif evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_F1:
-                        self._debug_bounds = not self._debug_bounds
-                        if hasattr(self.field, "debug"):
-                            self.field.debug = self._debug_bounds
-
-                    if evento.key == pygame.K_F3 and self.debug_overlays:
-                        self.show_bounce_debug = not self.show_bounce_debug
-
-                    # Saques
-                    if evento.key == pygame.K_SPACE:
-                        ball = self._ball_main
-                        if ball is not None:
-                            if getattr(ball, "serve_stage", "ready") == "ready":
-                                start_x, start_y = world_to_screen(self.jugador1.world_x, self.jugador1.world_y)
-                                ball.start_toss("P1", start_x - 20, start_y - 60)
-                                self.jugador1.iniciar_saque()
-                            elif getattr(ball, "serve_stage", None) in ("toss", "falling"):
-                                if self.jugador1:
-                                    self.jugador1.realizar_saque()
-                                    ball.hit_by_player(
-                                        (self.jugador1.world_x, self.jugador1.world_y),
-                                        zone=self.jugador1.pending_direction,
-                                        is_player2=self.jugador1.is_player2
-                                    )
-                                else:
-                                    self.jugador2.realizar_saque()
-                                    ball.hit_by_player(
-                                        (self.jugador2.world_x, self.jugador2.world_y),
-                                        zone=self.jugador2.pending_direction,
-                                        is_player2=self.jugador2.is_player2
-                                    )
-                        else:
-                            print("[WARN] No hay pelota principal activa para el saque.")
-
-                    if evento.key == pygame.K_f:
-                        ball = self._ball_main
-                        if ball is not None:
-                            if getattr(ball, "serve_stage", "ready") == "ready":
-                                start_x, start_y = world_to_screen(self.jugador2.world_x, self.jugador2.world_y)
-                                ball.start_toss("P2", start_x - 530, start_y - 250)
-                                self.jugador2.iniciar_saque()  # animación del lanzamiento
-                            # Si la pelota ya fue lanzada → intentar golpear
-                            elif getattr(ball, "serve_stage", None) in ("toss", "falling"):
-                                self.jugador2.realizar_saque()
-                                ball.hit_by_player((self.jugador2.world_x, self.jugador2.world_y), zone=self.jugador2.pending_direction, is_player2=self.jugador2.is_player2)
-                        else:
-                            print("[WARN] No hay pelota principal activa para el saque.")
-
-                    # Mezcla rápida
-                    if evento.key == pygame.K_1:
-                        v = max(0.0, self.audio.group_vol["music"] - 0.05)
-                        self.audio.set_group_volume("music", v)
-                        self._music_prev_vol = v if not self._music_muted else self._music_prev_vol
-                    if evento.key == pygame.K_2:
-                        v = min(1.0, self.audio.group_vol["music"] + 0.05)
-                        self.audio.set_group_volume("music", v)
-                        self._music_prev_vol = v if not self._music_muted else self._music_prev_vol
-                    if evento.key == pygame.K_3:
-                        v = max(0.0, self.audio.group_vol["sfx"] - 0.05)
-                        self.audio.set_group_volume("sfx", v)
-                    if evento.key == pygame.K_4:
-                        v = min(1.0, self.audio.group_vol["sfx"] + 0.05)
-                        self.audio.set_group_volume("sfx", v)
-
-                    # Mute global
-                    if evento.key == pygame.K_m:
-                        self.audio.toggle_mute_all()
-
-                # ---- ESTADOS ----
-                if self.estado_juego == 'menu':
-                    # Click de mouse en botones del menú
-                    if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
-                        for btn in self._menu_buttons:
-                            if btn.rect.collidepoint(evento.pos):
-                                self.audio.play_sound("ui_select")
-                                if btn.action == "start":
-                                    self._set_music_state("ingame")
-                                    self.estado_juego = 'jugando'
-                                    self._start_new_rally()
-                                elif btn.action == "options":
-                                    self._enter_options()
-                                elif btn.action == "quit":
-                                    pygame.event.post(pygame.event.Event(pygame.QUIT))
-                                break
-
-                    # Navegación con teclado
-                    elif evento.type == pygame.KEYDOWN:
-                        # Atajos de modo 1P/2P
-                        if evento.key == pygame.K_1:
-                            self._set_mode("1P")
-                        elif evento.key == pygame.K_2:
-                            self._set_mode("2P")
-
-                        elif evento.key in (pygame.K_UP, pygame.K_w):
-                            self.menu_index = (self.menu_index - 1) % len(self.menu_items)
-                            self.audio.play_sound("ui_move")
-                        elif evento.key in (pygame.K_DOWN, pygame.K_s):
-                            self.menu_index = (self.menu_index + 1) % len(self.menu_items)
-                            self.audio.play_sound("ui_move")
-                        elif evento.key in (pygame.K_RETURN, pygame.K_SPACE):
-                            self.audio.play_sound("ui_select")
-                            self._menu_select()
-                        elif evento.key == pygame.K_ESCAPE:
-                            self.audio.play_sound("ui_back")
-                            ejecutando = False
-
-                elif self.estado_juego == 'opciones':
-                    if evento.type == pygame.KEYDOWN:
-                        handled = self._handle_options_input(evento.key)
-                        if not handled and evento.key == pygame.K_ESCAPE:
-                            self._cancel_options()
-
-                    # --- Mouse: click en botones / sliders ---
-                    elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
-                        # Botones
-                        for btn in self._opt_buttons:
-                            if btn.rect.collidepoint(evento.pos):
-                                self.audio.play_sound("ui_select")
-                                if btn.action == "opts_apply":
-                                    self._apply_options()
-                                    self._back_to_menu()
-                                elif btn.action == "opts_back":
-                                    self._cancel_options()  # descarta cambios
-                                break
-
-                        # Sliders: seleccionar fila y modificar SOLO valores locales
-                        for name, rect in self._opt_bars.items():
-                            if rect.collidepoint(evento.pos):
-                                self._opts_index = {"music": 1, "sfx": 2, "ui": 3}[name]
-                                rel = max(0.0, min(1.0, (evento.pos[0] - rect.left) / rect.width))
-                                self._opts_values[self._opts_index] = round(rel, 2)
-                                self._dragging_bar = name
-                                break
-
-                    elif evento.type == pygame.MOUSEMOTION and self._dragging_bar:
-                        rect = self._opt_bars[self._dragging_bar]
-                        rel = max(0.0, min(1.0, (evento.pos[0] - rect.left) / rect.width))
-                        idx = {"music": 1, "sfx": 2, "ui": 3}[self._dragging_bar]
-                        self._opts_values[idx] = round(rel, 2)
-
-                    elif evento.type == pygame.MOUSEBUTTONUP and evento.button == 1:
-                        self._dragging_bar = None
-
-
-
-                elif self.estado_juego == 'jugando':
-                    if evento.type == pygame.KEYDOWN:
-                        # No aceptar entradas de gameplay durante el 3-2-1
-                        if self._restart_block_input:
-                            if evento.key == pygame.K_ESCAPE:
-                                if "ui_whoosh" in self.audio.sounds:
-                                    self.audio.play_sound("ui_whoosh")
-                                self.audio.play_sound("ui_back")
-                                self.estado_juego = 'pausa'
-                                self.audio.duck_music(0.08)
-                            continue
-
-                        if evento.key == pygame.K_ESCAPE:
-                            if "ui_whoosh" in self.audio.sounds:
-                                self.audio.play_sound("ui_whoosh")
-                            self.audio.play_sound("ui_back")
-                            self.estado_juego = 'pausa'
-                            self.audio.duck_music(0.08)
-
-                        # DEBUG SFX (opcional)
-                        if self.debug_audio:
-                            if evento.key == pygame.K_v:
-                                self.audio.play_sound("serve")
-                            if evento.key == pygame.K_h:
-                                for b in self.balls:
-                                    b.on_racket_hit()
-                                    break
-                            if evento.key == pygame.K_b:
-                                self.audio.play_sound("bounce_court")
-                            if evento.key == pygame.K_n:
-                                if "net_tape" in self.audio.sounds:
-                                    self.audio.play_sound("net_tape")
-                                if "net_body" in self.audio.sounds:
-                                    self.audio.play_sound("net_body")
-                                elif "net_touch" in self.audio.sounds:
-                                    self.audio.play_sound("net_touch")
-                                if "crowd_ooh" in self.audio.sounds:
-                                    self.audio.play_sound("crowd_ooh")
-                            if evento.key == pygame.K_o:
-                                for b in self.balls:
-                                    b.on_out()
-                                    break
-                            if evento.key == pygame.K_p:
-                                for b in self.balls:
-                                    b.on_point_scored()
-                                    break
-                            if evento.key == pygame.K_c and "crowd_ooh" in self.audio.sounds:
-                                self.audio.play_sound("crowd_ooh")
-                            if evento.key == pygame.K_f and "crowd_ahh" in self.audio.sounds:
-                                self.audio.play_sound("crowd_ahh")
-                            if evento.key == pygame.K_k and "sting_match" in self.audio.sounds:
-                                self.audio.duck_music(0.10)
-                                self.audio.play_sound("sting_match")
-                                self.audio.unduck_music()
-                            if evento.key == pygame.K_g:
-                                self._start_debug_restart_countdown()
-
-                elif self.estado_juego == 'pausa':
-                    if evento.type == pygame.KEYDOWN:
-                        if evento.key in (pygame.K_ESCAPE, pygame.K_p):
-                            if "ui_whoosh" in self.audio.sounds: self.audio.play_sound("ui_whoosh")
-                            self.audio.play_sound("ui_back")
-                            self.estado_juego = 'jugando'
-                            self.audio.unduck_music()
-                        elif evento.key in (pygame.K_RETURN, pygame.K_BACKSPACE):
-                            # Volver al menú desde PAUSA
-                            if "ui_whoosh" in self.audio.sounds: self.audio.play_sound("ui_whoosh")
-                            self.audio.play_sound("ui_back")
-                            self._set_music_state("menu")
-                            self.estado_juego = 'menu'
-
-
-                elif self.estado_juego in ('victoria', 'gameover'):
-                    if evento.type == pygame.KEYDOWN:
-                        if evento.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                            self._reiniciar_partida()
-                        elif evento.key == pygame.K_ESCAPE:
-                            self._volver_al_menu()
-
-            # LÓGICA
-            if self.estado_juego == 'jugando':
-                teclas = pygame.key.get_pressed()
-
-                # Bloqueo de entradas/movimientos durante el 3-2-1
-                if not self._restart_block_input:
-                    # P1 (humano)
-                    self.jugador1.mover(teclas)
-
-                    # P2: IA en 1P, humano en 2P
-                    if self.modo == "1P" and self.ai_p2 is not None and self._ball_main is not None:
-                        # asegurar referencia a la pelota por si cambió en el rally
-                        if getattr(self.ai_p2, "ball", None) is not self._ball_main:
-                            self.ai_p2.ball = self._ball_main  # type: ignore
-                        # obtener teclas simuladas desde la IA
-                        simulated_keys = self.ai_p2.get_simulated_keys()
-                        # mover jugador 2 usando las teclas simuladas
-                        self.jugador2.mover(simulated_keys)
-                    else:
-                        self.jugador2.mover(teclas)
-
-                # Actualización de animaciones/estado visual
-                self.jugador1.update()
-                self.jugador2.update()
-
-                # Pelota (no se mueve durante el 3-2-1)
-                if not self._restart_block_input:
-                    self.balls.update()
-
-                # Colisiones jugador-pelota (no durante el 3-2-1)
-                if not self._restart_block_input:
-                    for ball in self.balls:
-                        if self.jugador1.check_ball_collision(ball):
-                            self.last_hitter = "P1"
-                        if self.jugador2.check_ball_collision(ball):
-                            self.last_hitter = "P2"
-
-            # RENDER
-            self.PANTALLA.fill(AZUL_OSCURO)
-
-            if self.estado_juego == 'menu':
-                self._draw_menu()
-            elif self.estado_juego == 'opciones':
-                self._draw_options()
-            elif self.estado_juego == 'jugando':
-                self._render_ingame()
-            elif self.estado_juego == 'pausa':
-                self._render_ingame()
-                self._draw_center_text("PAUSA (Esc/P: continuar, Enter: menú)")
-            elif self.estado_juego == 'victoria':
-                self._render_victoria()
-            elif self.estado_juego == 'gameover':
-                self._render_gameover()
-
-            # Overlays
-            if self.debug_overlays and self.show_bounce_debug:
-                self.debug_overlays.draw(self.PANTALLA)
+                    self._handle_global_key(evento)
+
+                self.scenes.top.handle_event(evento)
+
+            # LÓGICA (solo la escena de partida simula)
+            scene = self.scenes.top
+            if scene.idle:
+                self.sim.reset()
+            alpha = scene.update(dt)
+
+            # RENDER (en idle solo si algo cambió; con la ventana oculta, nunca)
+            if self.estado_juego != estado_previo:
+                self._needs_redraw = True
+            if self._window_hidden:
+                continue
+            if self.scenes.top.idle and self.idle_enabled and not self._needs_redraw:
+                continue
+            self._needs_redraw = False
+
+            # Pipeline: en partida dibuja el hilo de render mientras se simula el próximo frame
+            if self.pipeline is not None and not self.pipeline.alive:
+                self.pipeline = None
+            if self.pipeline is not None:
+                if self.estado_juego == 'jugando':
+                    if self.quality.crowd_anim:
+                        self.background.update(dt)
+                    self.pipeline.submit(world_snapshot.capture(self, alpha))
+                    if self.pipeline.present(self.PANTALLA):
+                        pygame.display.flip()
+                    continue
+                self.pipeline.drain()
+
+            # Escenas overlay (pausa, resultado) reutilizan el frame congelado de abajo
+            self.scenes.draw(self.PANTALLA)
+
+            # Overlays (la revisión F4 se ve aunque F3 apague los piques)
+            if self.debug_overlays:
+                self.debug_overlays.draw(self.PANTALLA, None if self.show_bounce_debug else ())
             if self._restart_cd and self._restart_cd.active:
                 self._restart_cd.draw(self.PANTALLA, "Reiniciando partida")
+            self.banners.draw(self.PANTALLA)
 
             pygame.display.flip()
 
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            print(f"[Render] snapshots={self.pipeline.submitted} dibujados={self.pipeline.rendered} "
+                  f"presentados={self.pipeline.presented} reemplazados={self.pipeline.replaced}")
+
+        # Jitter medido del modo de pacing (para elegir el mejor por máquina)
+        self.pacer.report()
+        self.gc_policy.report()
+        self.gc_policy.shutdown()
+        if self.watchdog:
+            self.watchdog.stop()
+
         # Guardar mezcla al salir
         self._save_audio_config()
         pygame.quit()
 
+    # ---------------------------
+    # Teclas globales (cualquier escena)
+    # ---------------------------
+    def _handle_global_key(self, evento):
+        """Debug, saques, mezcla rápida y mute: activos en cualquier escena (como antes)."""
+        if evento.key == pygame.K_F1:
+            self._debug_bounds = not self._debug_bounds
+            if hasattr(self.field, "debug"):
+                self.field.debug = self._debug_bounds
+
+        if evento.key == pygame.K_F3 and self.debug_overlays:
+            self.show_bounce_debug = not self.show_bounce_debug
+        if evento.key in (pygame.K_F1, pygame.K_F3):
+            self.scenes.invalidate()  # el freeze-frame cambia con los overlays de debug
+        if evento.key == pygame.K_F4:
+            self._show_challenge()
+
+        # Escala de tiempo de simulación: F5 slow-motion, F6 fast-forward
+        if evento.key in (pygame.K_F5, pygame.K_F6):
+            target = 0.25 if evento.key == pygame.K_F5 else 2.0
+            self.sim.time_scale = 1.0 if self.sim.time_scale == target else target
+            print(f"[Timing] time_scale={self.sim.time_scale}")
+
+        # Saques (en práctica no hay saque: la máquina tira)
+        if evento.key == pygame.K_SPACE and self.drill is None:
+            ball = self._ball_main
+            if ball is not None:
+                if getattr(ball, "serve_stage", "ready") == "ready":
+                    start_x, start_y = world_to_screen(self.jugador1.world_x, self.jugador1.world_y)
+                    ball.start_toss("P1", start_x - 20, start_y - 60)
+                    self.jugador1.iniciar_saque()
+                elif getattr(ball, "serve_stage", None) in ("toss", "falling"):
+                    if self.jugador1:
+                        self.jugador1.realizar_saque()
+                        ball.hit_by_player(
+                            (self.jugador1.world_x, self.jugador1.world_y),
+                            zone=self.jugador1.pending_direction,
+                            is_player2=self.jugador1.is_player2
+                        )
+                    else:
+                        self.jugador2.realizar_saque()
+                        ball.hit_by_player(
+                            (self.jugador2.world_x, self.jugador2.world_y),
+                            zone=self.jugador2.pending_direction,
+                            is_player2=self.jugador2.is_player2
+                        )
+            else:
+                print("[WARN] No hay pelota principal activa para el saque.")
+
+        if evento.key == pygame.K_f and self.drill is None:
+            ball = self._ball_main
+            if ball is not None:
+                if getattr(ball, "serve_stage", "ready") == "ready":
+                    start_x, start_y = world_to_screen(self.jugador2.world_x, self.jugador2.world_y)
+                    ball.start_toss("P2", start_x - 530, start_y - 250)
+                    self.jugador2.iniciar_saque()  # animación del lanzamiento
+                # Si la pelota ya fue lanzada → intentar golpear
+                elif getattr(ball, "serve_stage", None) in ("toss", "falling"):
+                    self.jugador2.realizar_saque()
+                    ball.hit_by_player((self.jugador2.world_x, self.jugador2.world_y), zone=self.jugador2.pending_direction, is_player2=self.jugador2.is_player2)
+            else:
+                print("[WARN] No hay pelota principal activa para el saque.")
+
+        # Mezcla rápida
+        if evento.key == pygame.K_1:
+            v = max(0.0, self.audio.group_vol["music"] - 0.05)
+            self.audio.set_group_volume("music", v)
+            self._music_prev_vol = v if not self._music_muted else self._music_prev_vol
+        if evento.key == pygame.K_2:
+            v = min(1.0, self.audio.group_vol["music"] + 0.05)
+            self.audio.set_group_volume("music", v)
+            self._music_prev_vol = v if not self._music_muted else self._music_prev_vol
+        if evento.key == pygame.K_3:
+            v = max(0.0, self.audio.group_vol["sfx"] - 0.05)
+            self.audio.set_group_volume("sfx", v)
+        if evento.key == pygame.K_4:
+            v = min(1.0, self.audio.group_vol["sfx"] + 0.05)
+            self.audio.set_group_volume("sfx", v)
+
+        # Mute global
+        if evento.key == pygame.K_m:
+            self.audio.toggle_mute_all()
+
+    def _show_challenge(self):
+        """F4: repite el último pique fallado con zoom y su margen a la línea."""
+        review = self.line_calls.review()
+        if review is None or not self.debug_overlays:
+            print("[Calls] No hay piques para revisar.")
+            return
+        self.debug_overlays.show_challenge(review)
+        self._needs_redraw = True
+        print(f"[Calls] Revisión: {review.verdict.upper()} ({review.label}) margen {review.margin:+.2f}")
+
+    def _handle_debug_sfx(self, key):
+        """Atajos de prueba de SFX en partida (VJ2D_DEBUG_AUDIO)."""
+        if key == pygame.K_v:
+            self.audio.play_sound("serve")
+        if key == pygame.K_h:
+            for b in self.balls:
+                b.on_racket_hit()
+                break
+        if key == pygame.K_b:
+            self.audio.play_sound("bounce_court")
+        if key == pygame.K_n:
+            if "net_tape" in self.audio.sounds:
+                self.audio.play_sound("net_tape")
+            if "net_body" in self.audio.sounds:
+                self.audio.play_sound("net_body")
+            elif "net_touch" in self.audio.sounds:
+                self.audio.play_sound("net_touch")
+            if "crowd_ooh" in self.audio.sounds:
+                self.audio.play_sound("crowd_ooh")
+        if key == pygame.K_o:
+            for b in self.balls:
+                b.on_out()
+                break
+        if key == pygame.K_p:
+            for b in self.balls:
+                b.on_point_scored()
+                break
+        if key == pygame.K_c and "crowd_ooh" in self.audio.sounds:
+            self.audio.play_sound("crowd_ooh")
+        if key == pygame.K_f and "crowd_ahh" in self.audio.sounds:
+            self.audio.play_sound("crowd_ahh")
+        if key == pygame.K_k and "sting_match" in self.audio.sounds:
+            self.audio.duck_music(0.10)
+            self.audio.play_sound("sting_match")
+            self.audio.unduck_music()
+        if key == pygame.K_g:
+            self._start_debug_restart_countdown()
+
+    # ---------------------------
+    # Escenas
+    # ---------------------------
+    @property
+    def estado_juego(self) -> str:
+        """Escena activa: 'menu'|'opciones'|'jugando'|'pausa'|'victoria'|'gameover' (solo lectura)."""
+        return self.scenes.name
+
+    def _goto(self, name: str):
+        """Reemplaza toda la pila por la escena 'name'."""
+        self.scenes.set(self._scenes[name])
+
+    def _push_scene(self, name: str):
+        self.scenes.push(self._scenes[name])
+
+    def _start_match(self):
+        self._stop_drill()
+        self._set_music_state("ingame")
+        self._goto('jugando')
+        self._start_new_rally()
+
+    def _start_drill(self):
+        """Modo práctica: sin saque ni marcador, la máquina tira hacia el jugador 1."""
+        if BallMachine is None:
+            return
+        self._set_music_state("ingame")
+        self._goto('jugando')
+        self.ball_pool.release_all(self.balls)
+        self._ball_main = None
+        self.last_hitter = None
+        if self._ball_machine is None:
+            self._ball_machine = BallMachine(self, self.ball_pool)
+        self.drill = self._ball_machine
+        self.drill.start()
+
+    def _stop_drill(self):
+        if self.drill is None:
+            return
+        self.drill.stop()
+        print(f"[Drill] lanzadas={self.drill.fed} devueltas={self.drill.returned} "
+              f"perdidas={self.drill.missed} pico={self.drill.peak} "
+              f"pool: creadas={self.ball_pool.created} libres={self.ball_pool.free}")
+        self.drill = None
+
+    def _pause(self):
+        if "ui_whoosh" in self.audio.sounds:
+            self.audio.play_sound("ui_whoosh")
+        self.audio.play_sound("ui_back")
+        self._push_scene('pausa')
+        self.audio.duck_music(0.08)
+
+    def _request_redraw(self):
+        self._needs_redraw = True
+
+    # ---------------------------
+    # Calidad (governor de presupuesto de frame)
+    # ---------------------------
+    @property
+    def quality(self):
+        return self.governor.flags
+
+    def _observe_frame(self, work_ms, frame_ms):
+        if not self.governor.observe(work_ms, frame_ms):
+            return
+        if self.debug_overlays:
+            self.debug_overlays.update_every = self.quality.overlay_every
+        self.scenes.invalidate()
+
+    def _watchdog_context(self):
+        """Estado que el watchdog adjunta a cada cuelgue (se lee desde su hilo)."""
+        return {
+            "estado_juego": self.estado_juego,
+            "sim_ticks": self.sim.ticks,
+            "score": self.score.get_score_str() if self.score else None,
+            "calidad": self.governor.level,
+            "pipeline": self.pipeline is not None,
+        }
+
+    # ---------------------------
+    # Idle / ventana
+    # ---------------------------
+    def _idle_ready(self) -> bool:
+        """True si el loop puede bloquearse esperando eventos (nada se anima solo)."""
+        if not self.idle_enabled:
+            return False
+        if not self.scenes.top.idle:
+            return False
+        if self.banners.active:
+            return False
+        if self._restart_cd and self._restart_cd.active:
+            return False
+        if self.debug_overlays and self.show_bounce_debug and self.debug_overlays.has_active():
+            return False
+        if self.debug_overlays and self.debug_overlays.challenge_active():
+            return False
+        return True
+
+    def _handle_window_event(self, evento):
+        """Sigue foco/visibilidad de la ventana; sin foco en partida → pausa automática."""
+        if evento.type in _EV_HIDDEN:
+            self._window_hidden = True
+        elif evento.type in _EV_SHOWN:
+            self._window_hidden = False
+            self._needs_redraw = True
+        elif evento.type == _EV_FOCUS_LOST:
+            self._window_focused = False
+        elif evento.type == _EV_FOCUS_GAINED:
+            self._window_focused = True
+            self._needs_redraw = True
+        else:
+            return
+
+        if (self._window_hidden or not self._window_focused) and self.estado_juego == 'jugando':
+            self._push_scene('pausa')
+            self.audio.duck_music(0.08)
+
+    # ---------------------------
+    # Tick de simulación
+    # ---------------------------
+    def _sim_step(self, teclas, dt_ms):
+        """Avanza jugadores, IA, pelotas y colisiones un tick fijo de dt_ms."""
+        # Timers de jugabilidad vencidos en este tick (swing, saque, cooldown de red)
+        self.timers.advance_to(self.sim.time_ms)
+
+        # Inicio del tick: posición anterior (interpolación de render y tests barridos)
+        for jugador in self.players:
+            jugador.snap_prev()
+        for b in self.balls:
+            b.snap_prev()
+
+        # Bloqueo de entradas/movimientos durante el 3-2-1
+        if not self._restart_block_input:
+            # P1 (humano)
+            self.jugador1.mover(teclas, dt_ms)
+
+            # P2: IA en 1P, humano en 2P (en práctica se queda quieto)
+            if self.drill is not None:
+                pass
+            elif self.modo == "1P" and self.ai_p2 is not None and self._ball_main is not None:
+                # asegurar referencia a la pelota por si cambió en el rally
+                if getattr(self.ai_p2, "ball", None) is not self._ball_main:
+                    self.ai_p2.ball = self._ball_main  # type: ignore
+                # obtener teclas simuladas desde la IA
+                simulated_keys = self.ai_p2.get_simulated_keys()
+                # mover jugador 2 usando las teclas simuladas
+                self.jugador2.mover(simulated_keys, dt_ms)
+            else:
+                self.jugador2.mover(teclas, dt_ms)
+
+        # Actualización de animaciones/estado visual
+        for jugador in self.players:
+            jugador.update()
+
+        # Pelota (no se mueve durante el 3-2-1)
+        if not self._restart_block_input:
+            self._balls_updating = True
+            try:
+                self.balls.update(dt_ms)
+            finally:
+                self._balls_updating = False
+            if self._rally_pending:
+                self._rally_pending = False
+                self._start_new_rally()
+
+        # Red deformable (solo se mueve tras un impacto; en reposo no cuesta nada)
+        self.field.net.update(dt_ms)
+
+        # Colisiones jugador-pelota (no durante el 3-2-1)
+        if not self._restart_block_input:
+            for ball, jugador in ball_player_candidates(self.collisions, self.balls, self.players):
+                if jugador.check_ball_collision(ball):
+                    self.last_hitter = "P2" if jugador.is_player2 else "P1"
+                    if self.drill is not None:
+                        self.drill.on_hit(ball)
+
+        # Práctica: las pelotas que terminaron vuelven al pool
+        if self.drill is not None:
+            self.drill.update()
+
     # ---------------------------
     # MENÚ
     # ---------------------------
     def _menu_select(self):
         item = self.menu_items[self.menu_index]
         if item == "Comenzar":
-            self._set_music_state("ingame")
-            self.estado_juego = 'jugando'
-            self._start_new_rally()
+            self._start_match()
+        elif item == "Práctica":
+            self._start_drill()
         elif item == "Opciones":
             self._enter_options()
         elif item == "Salir":
@@ -711,7 +929,7 @@ class Game:
         if "ui_whoosh" in self.audio.sounds:
             self.audio.play_sound("ui_whoosh")
         self.audio.play_sound("ui_select")
-        self.estado_juego = 'opciones'
+        self._push_scene('opciones')
 
         # Snapshot para poder cancelar
         self._opts_snapshot_mode = self.modo
@@ -818,7 +1036,8 @@ class Game:
     # Jingles / ESTADOS FINALES
     # ---------------------------
     def _enter_victoria(self):
-        self.estado_juego = 'victoria'
+        self._push_scene('victoria')
+        self.gc_policy.menu_break()
         self.audio.fadeout_music(200)
         if "win_jingle" in self.audio.sounds:
             self.audio.play_sound("win_jingle")
@@ -826,7 +1045,8 @@ class Game:
             self._set_music_state("menu")
 
     def _enter_gameover(self):
-        self.estado_juego = 'gameover'
+        self._push_scene('gameover')
+        self.gc_policy.menu_break()
         self.audio.fadeout_music(200)
         if "lose_jingle" in self.audio.sounds:
             self.audio.play_sound("lose_jingle")
@@ -836,49 +1056,17 @@ class Game:
     # ---------------------------
     # RENDER helpers
     # ---------------------------
-    def _render_ingame(self):
-        self.field.draw(self.PANTALLA)
-        dt = self.reloj.get_time()
-        self.background.update(dt)
-        self.background.draw(self.PANTALLA)
-
-        if self._debug_bounds:
-            self.field.draw_debug_bounds(self.PANTALLA)
-            self.field.net.draw_debug(self.PANTALLA)
-
-        for b in self.balls:
-            b.draw(self.PANTALLA)
-
-        self.jugador2.draw(self.PANTALLA)
-        self.jugador1.draw(self.PANTALLA)
-
-        if self._debug_bounds:
-            self._draw_player_hitboxes(self.jugador1, self.PANTALLA)
-            self._draw_player_hitboxes(self.jugador2, self.PANTALLA)
-
-        if self.score:
-            self.score.draw_hud(self.PANTALLA, self.font_hud)
-
-    def _render_victoria(self):
-        # Fondo tenue del ingame + cartel
-        self._render_ingame()
-        overlay = pygame.Surface((ANCHO, ALTO), pygame.SRCALPHA)
-        overlay.fill((10, 40, 10, 180))
-        self.PANTALLA.blit(overlay, (0, 0))
-        t1 = self.font_title.render("¡VICTORIA!", True, BLANCO)
-        t2 = self.font_small.render("Enter: Reintentar   |   Esc: Volver al menú", True, BLANCO)
-        self.PANTALLA.blit(t1, t1.get_rect(center=(ANCHO // 2, ALTO // 2 - 20)))
-        self.PANTALLA.blit(t2, t2.get_rect(center=(ANCHO // 2, ALTO // 2 + 40)))
-
-    def _render_gameover(self):
-        self._render_ingame()
-        overlay = pygame.Surface((ANCHO, ALTO), pygame.SRCALPHA)
-        overlay.fill((40, 10, 10, 180))
-        self.PANTALLA.blit(overlay, (0, 0))
-        t1 = self.font_title.render("GAME OVER", True, BLANCO)
-        t2 = self.font_small.render("Enter: Reintentar   |   Esc: Volver al menú", True, BLANCO)
-        self.PANTALLA.blit(t1, t1.get_rect(center=(ANCHO // 2, ALTO // 2 - 20)))
-        self.PANTALLA.blit(t2, t2.get_rect(center=(ANCHO // 2, ALTO // 2 + 40)))
+    def _render_ingame(self, alpha: float = 1.0):
+        """alpha: interpolación entre los dos últimos ticks de simulación."""
+        if self.quality.crowd_anim:
+            self.background.update(self.reloj.get_time())
+        world_snapshot.draw(self, self.PANTALLA, world_snapshot.capture(self, alpha))
+
+    def _draw_snapshot(self, snap, surface):
+        """Hilo de render: frame completo de partida en un buffer fuera de pantalla (sin flip)."""
+        surface.fill(AZUL_OSCURO)
+        world_snapshot.draw(self, surface, snap)
+        world_snapshot.draw_overlays(self, surface, snap)
 
     def set_starting_player(self, player: str):
         """Permite elegir el jugador que saca ('P1' o 'P2')."""
@@ -892,11 +1080,13 @@ class Game:
     # Rally / PUNTUACIÓN
     # ---------------------------
     def _start_new_rally(self):
+        # Corte natural entre puntos: colección barata ahora, no en medio del rally
+        self.gc_policy.rally_break()
+
         cx, cy = self.jugador1.x, self.jugador1.y
         wx, wy = world_to_screen(cx, cy)
-        self.balls.empty()
-        ball = Ball(wx - 20, wy - 60, game=self, vx=0, vy=0)
-        ball.z = 0
+        self.ball_pool.release_all(self.balls)
+        ball = self.ball_pool.acquire(wx - 20, wy - 60, z=0)
         ball.serve_stage = "ready"
         self.balls.add(ball)
         self._ball_main = ball
@@ -911,8 +1101,10 @@ class Game:
             self.score.reset_game()
 
     def point_for(self, who: str):
+        if self.drill is not None:
+            return  # en práctica no se cuenta: la máquina recicla la pelota
         if not self.score:
-            self._start_new_rally()
+            self._next_rally()
             return
         self.background.aplaudir()
         self.score.point_for(who)
@@ -936,12 +1128,33 @@ class Game:
                     self._enter_victoria()
             return
 
-        self._start_new_rally()
+        self._next_rally()
+
+    def replay_point(self):
+        """Let (VJ2D_SERVE_RULES): el saque se repite sin sumar el punto."""
+        if self.drill is None:
+            self._next_rally()
+
+    def _next_rally(self):
+        """
+        Rally siguiente tras un punto o un let. Si lo pide una pelota desde su update()
+        se difiere hasta que termina balls.update(): _start_new_rally recicla esa misma
+        Ball y no puede resetearse a mitad de su propio tick.
+        """
+        if self._balls_updating:
+            self._rally_pending = True
+        else:
+            self._start_new_rally()
 
     # ---------------------------
     # REINTENTAR / VOLVER
     # ---------------------------
     def _reiniciar_partida(self):
+        if self.drill is not None:
+            self._restart_block_input = False
+            self._start_drill()
+            return
+
         # Música de juego (respeta mute)
         self._set_music_state("ingame")
 
@@ -956,13 +1169,15 @@ class Game:
         if hasattr(self.jugador2, "reset_position"):
             self.jugador2.reset_position()
 
+        self._goto('jugando')
         self._start_new_rally()
-        self.estado_juego = 'jugando'
         self._restart_block_input = False  # liberar inputs
 
     def _volver_al_menu(self):
+        self._stop_drill()
         self._set_music_state("menu")
-        self.estado_juego = 'menu'
+        self._goto('menu')
+        self.gc_policy.menu_break()
 
     # ---------------------------
     # Autowin de debug → “3,2,1” reiniciando partida
@@ -977,23 +1192,11 @@ class Game:
         self._restart_block_input = True
         self._restart_cd.start(ms)
 
-    # ---------------------------
-    # Debug overlay: cajas de colisión de jugadores
-    # ---------------------------
-    def _draw_player_hitboxes(self, player, surface):
-        try:
-            from engine.config.collisions import COLOR_BODY, COLOR_RACKET
-        except Exception:
-            COLOR_BODY, COLOR_RACKET = (50, 220, 60), (240, 200, 40)
-
-        if hasattr(player, "body_rect"):
-            pygame.draw.rect(surface, COLOR_BODY, player.body_rect, width=2)
-        if hasattr(player, "racket_rect"):
-            pygame.draw.rect(surface, COLOR_RACKET, player.racket_rect, width=2)
-
     def _build_menu_buttons(self):
         cx, base_y, gap = ANCHO // 2, 260, 70
         items = [("Comenzar", "start"), ("Opciones", "options"), ("Salir", "quit")]
+        if BallMachine:
+            items.insert(1, ("Práctica", "drill"))
         self._menu_buttons.clear()
         for i, (label, action) in enumerate(items):
             rect = pygame.Rect(0, 0, 280, 56)
@@ -1093,11 +1296,11 @@ class Game:
         if "ui_whoosh" in self.audio.sounds:
             self.audio.play_sound("ui_whoosh")
         self.audio.play_sound("ui_back")
-        self.estado_juego = 'menu'
+        self._goto('menu')
 
 
     def _back_to_menu(self):
         if "ui_whoosh" in self.audio.sounds:
             self.audio.play_sound("ui_whoosh")
         self.audio.play_sound("ui_back")
-        self.estado_juego = 'menu'
+        self._goto('menu')
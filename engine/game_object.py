@@ -27,6 +27,7 @@ class GameObject:
         self.y = y
 
         self.sprite_sheet: Optional[pygame.Surface] = None
+        self.sprite_sheet_path: Optional[str] = None
         self.animations: Dict[str, List[FrameRect]] = {}
         self.current_animation: str = 'idle'
         self.frame_index: int = 0
@@ -36,6 +37,8 @@ class GameObject:
         self._shadow_enabled: bool = True  # sombra elíptica bajo el objeto
         self._shadow_alpha: int = 70       # 0..255
 
+        self._shadow_surf: Optional[pygame.Surface] = None  # cache (se rehace si cambia el tamaño)
+
         # Animator por tiempo (si está disponible)
         self._animator: Optional["Animator"] = Animator(default_fps=10) if Animator else None
 
@@ -78,6 +81,7 @@ class GameObject:
                 self.sprite_sheet = _load_image(candidate)
             else:
                 self.sprite_sheet = pygame.image.load(candidate).convert_alpha()
+            self.sprite_sheet_path = candidate
 
             # Animaciones: default dict de listas
             self.animations = collections.defaultdict(list)
@@ -168,8 +172,11 @@ class GameObject:
             shadow_w = int(self.rect.width * 0.6)
             shadow_h = max(4, int(self.rect.height * 0.18))
             if shadow_w > 4 and shadow_h > 2:
-                shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
-                pygame.draw.ellipse(shadow, (0, 0, 0, self._shadow_alpha), shadow.get_rect())
+                shadow = self._shadow_surf
+                if shadow is None or shadow.get_size() != (shadow_w, shadow_h):
+                    shadow = pygame.Surface((shadow_w, shadow_h), pygame.SRCALPHA)
+                    pygame.draw.ellipse(shadow, (0, 0, 0, self._shadow_alpha), shadow.get_rect())
+                    self._shadow_surf = shadow
                 sh_rect = shadow.get_rect(midtop=(self.rect.centerx, self.rect.bottom - shadow_h // 2))
                 surface.blit(shadow, sh_rect)
 
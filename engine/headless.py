@@ -0,0 +1,279 @@
+"""
+Runner headless: simula partidos completos sin ventana, sin mixer y sin dibujar.
+Ambos jugadores los maneja SimpleTennisAI y el saque es automático.
+
+Uso:
+    python -m engine.headless --matches 100 --seed 7
+
+Un "partido" es un game completo del ScoreManager (0-15-30-40-Deuce-Game).
+Al terminar imprime partidos/s y ticks/s.
+
+Reproducibilidad (engine.utils.rng + engine.debug.desync):
+    python -m engine.headless --matches 5 --seed 7 --hash-log a.log
+    python -m engine.headless --matches 5 --seed 7 --hash-check a.log
+La segunda corrida se compara tick a tick contra la grabación y se corta en la
+primera diferencia, con el campo que se desvió.
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+from typing import Optional
+
+import pygame
+
+from engine.ball import BallPool
+from engine.ecs.store import EntityStore
+from engine.field import Field
+from engine.player import Player
+from engine.score import ScoreManager
+from engine.ai.simple_ai import SimpleTennisAI
+from engine.physics.collision import CollisionWorld, ball_player_candidates
+from engine.physics.targeting import shot_table_for
+from engine.rules.line_calls import LineJudge
+from engine.debug.desync import WorldHasher, DesyncDetector, canonical, describe
+from engine.utils import rng
+from engine.timing.fixed_step import FixedTimestep
+from engine.timing.scheduler import Scheduler
+from engine.utils.screen import ALTO, world_to_screen
+
+try:
+    from engine.config.timing import SIM_HZ
+except Exception:
+    SIM_HZ = 120
+
+
+class NullAudio:
+    """AudioManager mudo: misma interfaz mínima, sin tocar el mixer."""
+    enabled = False
+
+    def __init__(self):
+        self.sounds = {}
+        self.group_vol = {"ui": 0.0, "sfx": 0.0, "amb": 0.0, "music": 0.0}
+
+    def play_sound(self, name, loops=0):
+        pass
+
+    def play_sound_panned(self, name, pan=0.0):
+        pass
+
+
+class HeadlessMatch:
+    """
+    Mundo mínimo compatible con lo que Ball / Player / IA esperan de Game
+    (field, audio, sim, timers, _ball_main, last_hitter, point_for).
+    """
+
+    def __init__(self, sim_hz: float = SIM_HZ, max_rally_ms: float = 60000.0, predict: bool = False,
+                 hash_log: Optional[str] = None, hash_check: Optional[str] = None):
+        self.sim = FixedTimestep(sim_hz)
+        self.timers = Scheduler()
+        self.audio = NullAudio()
+        self.field = Field(6, 10)
+        shot_table_for(self.field, self.sim.step_ms)   # fuera de la medición de ticks/s
+        # Store propio para las Ball (no el default_store); sin render no hay sync
+        self.entities = EntityStore()
+        self.jugador1 = Player(520, 350, field=self.field, jugador2=False, game=self)
+        self.jugador2 = Player(385, ALTO / 2 - 450, field=self.field, jugador2=True, game=self)
+        self.players = [self.jugador1, self.jugador2]
+        for p in self.players:
+            p.is_human = False
+        self.score = ScoreManager()
+
+        self.balls = pygame.sprite.Group()
+        self._ball_main = None
+        self._balls_updating = False  # ver Game._next_rally
+        self._rally_pending = False
+        self.collisions = CollisionWorld()
+        self.ball_pool = BallPool(self)
+        self.last_hitter = None
+        self.current_server = "P1"
+        self.line_calls = LineJudge(self.field.court)
+
+        self.ai_p1 = SimpleTennisAI(self.jugador1, None, side="bottom", use_prediction=predict)
+        self.ai_p2 = SimpleTennisAI(self.jugador2, None, side="top", use_prediction=predict)
+
+        self.max_rally_ms = float(max_rally_ms)
+        self._rally_start_ms = 0.0
+
+        # Estadísticas
+        self.matches = 0
+        self.points = 0
+        self.wins = {"P1": 0, "P2": 0}
+        self.stuck_rallies = 0
+        self.lets = 0
+
+        # Hash del mundo por tick (log y/o comparación contra una grabación)
+        self.hasher = WorldHasher(hash_log) if (hash_log or hash_check) else None
+        self.detector = DesyncDetector(hash_check) if hash_check else None
+        self.desync = None            # (Divergence, estado canónico) de la primera diferencia
+
+        self._start_new_rally()
+
+    # ---------------------------
+    # Rally / PUNTUACIÓN (espejo de Game)
+    # ---------------------------
+    def _start_new_rally(self):
+        server = self.jugador1 if self.current_server == "P1" else self.jugador2
+        wx, wy = world_to_screen(server.x, server.y)
+        self.ball_pool.release_all(self.balls)
+        ball = self.ball_pool.acquire(wx - 20, wy - 60, z=0)
+        ball.serve_stage = "ready"
+        self.balls.add(ball)
+        self._ball_main = ball
+        ball.start_rally()
+        self.last_hitter = None
+        self.ai_p1.ball = ball
+        self.ai_p2.ball = ball
+        self._rally_start_ms = self.sim.time_ms
+
+    def point_for(self, who: str):
+        self.points += 1
+        self.score.point_for(who)
+        winner = self.score.game_winner
+        if winner is not None:
+            self.matches += 1
+            self.wins[winner] = self.wins.get(winner, 0) + 1
+            self.score.reset_game()
+            # Alternar saque por game
+            self.current_server = "P2" if self.current_server == "P1" else "P1"
+        self._next_rally()
+
+    def replay_point(self):
+        self.lets += 1
+        self._next_rally()
+
+    def _next_rally(self):
+        if self._balls_updating:
+            self._rally_pending = True
+        else:
+            self._start_new_rally()
+
+    def _auto_serve(self, ball):
+        """Equivalente a las teclas de saque (Espacio P1 / F P2) de Game."""
+        server = self.jugador1 if self.current_server == "P1" else self.jugador2
+        stage = getattr(ball, "serve_stage", None)
+        if stage == "ready":
+            sx, sy = world_to_screen(server.world_x, server.world_y)
+            if server.is_player2:
+                ball.start_toss("P2", sx - 530, sy - 250)
+            else:
+                ball.start_toss("P1", sx - 20, sy - 60)
+            server.iniciar_saque()
+        elif stage == "falling":
+            server.realizar_saque()
+            ball.hit_by_player((server.world_x, server.world_y),
+                               zone=server.pending_direction, is_player2=server.is_player2)
+            self.last_hitter = self.current_server
+
+    # ---------------------------
+    # Tick
+    # ---------------------------
+    def step(self):
+        dt_ms = self.sim.advance()
+        self.timers.advance_to(self.sim.time_ms)
+        ball = self._ball_main
+        # Inicio del tick: segmento para los tests barridos
+        for p in self.players:
+            p.snap_prev()
+        for b in self.balls:
+            b.snap_prev()
+
+        if ball is not None and getattr(ball, "serve_stage", None) in ("ready", "falling"):
+            self._auto_serve(ball)
+
+        self.jugador1.mover(self.ai_p1.get_simulated_keys(), dt_ms)
+        self.jugador2.mover(self.ai_p2.get_simulated_keys(), dt_ms)
+        for p in self.players:
+            p.update()
+
+        self._balls_updating = True
+        try:
+            self.balls.update(dt_ms)
+        finally:
+            self._balls_updating = False
+        if self._rally_pending:
+            self._rally_pending = False
+            self._start_new_rally()
+        self.field.net.update(dt_ms)
+
+        for b, jugador in ball_player_candidates(self.collisions, self.balls, self.players):
+            if jugador.check_ball_collision(b):
+                self.last_hitter = "P2" if jugador.is_player2 else "P1"
+
+        # Rally trabado (p.ej. pelota detenida sin picar): se descarta y se vuelve a sacar
+        if self.sim.time_ms - self._rally_start_ms > self.max_rally_ms:
+            self.stuck_rallies += 1
+            self._start_new_rally()
+
+        if self.hasher is not None:
+            self.hasher.update(self)
+            if self.detector is not None and self.desync is None:
+                div = self.detector.check(self.sim.ticks, self.hasher)
+                if div is not None:
+                    self.desync = (div, canonical(self))
+
+    def run(self, matches: int, max_ticks: int = 0) -> None:
+        while self.matches < matches:
+            self.step()
+            if max_ticks and self.sim.ticks >= max_ticks:
+                break
+            if self.desync is not None:
+                break
+        if self.hasher is not None:
+            self.hasher.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulación headless de partidos (sin ventana ni audio).")
+    parser.add_argument("--matches", type=int, default=100, help="games completos a simular")
+    parser.add_argument("--seed", type=int, default=None, help="semilla del módulo random")
+    parser.add_argument("--sim-hz", type=float, default=SIM_HZ, help="ritmo de simulación (ticks/s)")
+    parser.add_argument("--max-ticks", type=int, default=0, help="corte de seguridad (0 = sin límite)")
+    parser.add_argument("--predict", action="store_true", help="IA anticipa el pique (Ball.predict)")
+    parser.add_argument("--verbose", action="store_true", help="no silenciar los prints del motor")
+    parser.add_argument("--hash-log", default=None, help="escribe el hash del mundo de cada tick en este archivo")
+    parser.add_argument("--hash-check", default=None, help="compara cada tick contra un --hash-log grabado")
+    args = parser.parse_args(argv)
+
+    # Rutas de assets relativas a la raíz del proyecto
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    if args.seed is not None:
+        random.seed(args.seed)
+        rng.seed_all(args.seed)
+
+    out = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(devnull)
+        with quiet:
+            match = HeadlessMatch(sim_hz=args.sim_hz, predict=args.predict,
+                                  hash_log=args.hash_log, hash_check=args.hash_check)
+            t0 = time.perf_counter()
+            match.run(args.matches, args.max_ticks)
+            elapsed = max(1e-9, time.perf_counter() - t0)
+
+    ticks = match.sim.ticks
+    print(f"[Headless] partidos={match.matches} puntos={match.points} "
+          f"ticks={ticks} sim={match.sim.time_ms / 1000.0:.1f}s real={elapsed:.2f}s", file=out)
+    print(f"[Headless] {match.matches / elapsed:.1f} partidos/s  {ticks / elapsed:.0f} ticks/s  "
+          f"(x{match.sim.time_ms / 1000.0 / elapsed:.0f} tiempo real)", file=out)
+    print(f"[Headless] ganados P1={match.wins.get('P1', 0)} P2={match.wins.get('P2', 0)} "
+          f"rallies trabados={match.stuck_rallies} lets={match.lets}", file=out)
+    calls = match.line_calls
+    print(f"[Headless] piques fallados={calls.total} ajustados={calls.close}", file=out)
+    if match.hasher is not None:
+        print(f"[Headless] hash final={match.hasher.hash.hex()} (seed={rng.master_seed()})", file=out)
+    if match.detector is not None:
+        if match.desync is not None:
+            print(describe(*match.desync), file=out)
+            return 1
+        print(f"[Desync] {match.detector.checked} ticks iguales a {args.hash_check}", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,30 @@
 import pygame
 import os
 
+from engine.utils.iso import BALL as BALL_CAMERA
+
+try:
+    from engine.physics.net_cloth import NetCloth, np
+except ImportError:
+    NetCloth, np = None, None
+
+try:
+    from engine.config.net import NET_CLOTH, NET_POSTS_X, NET_DRAW_HEIGHT, NET_DRAW_OFFSET
+except Exception:
+    NET_CLOTH, NET_POSTS_X, NET_DRAW_HEIGHT, NET_DRAW_OFFSET = True, (-87.0, 289.0), 67.0, (0, -20)
+NET_CLOTH = os.environ.get("VJ2D_NET_CLOTH", "1" if NET_CLOTH else "0") == "1"
+
+NET_LINE_COLOR = (235, 235, 235)
+
+
 class Net:
     """
     Red de tenis dibujada en 2D (pantalla), pero usando coordenadas de mundo
     solo para la física y colisiones.
+
+    Con NumPy la red es deformable (engine/physics/net_cloth.py): update(dt_ms) la
+    avanza en la fase de simulación y, mientras se mueve, se dibuja como malla de
+    segmentos. Quieta (o sin NumPy / VJ2D_NET_CLOTH=0) se dibuja la textura red.png.
     """
 
     def __init__(self, field, color=(255, 0, 0)):
@@ -14,8 +34,10 @@ class Net:
         # Altura de la red en unidades de mundo (para física)
         self.height = 12.0
 
-        # La red está exactamente a la mitad de la cancha
-        self.y = field.height / 2.0
+        # La red está exactamente a la mitad de la cancha (línea de red del CourtModel)
+        self.y = self._court_net_y()
+        # Rect de colisión (en mundo): la red no se mueve, se arma una sola vez
+        self.rect = pygame.Rect(0, self.y - self.height / 2, self.field.width, self.height)
 
         # Cargar textura 2D
         texture_path = os.path.join("assets", "texturas", "red.png")
@@ -25,21 +47,61 @@ class Net:
             print("[Net] No se pudo cargar red.png, usando fallback.")
             self.texture = None
 
-        self.rect = None
+        # Red deformable (opcional)
+        self.cloth = None
+        if NET_CLOTH and NetCloth is not None and np is not None:
+            self.cloth = NetCloth(NET_POSTS_X[0], NET_POSTS_X[1], self.height)
+            self._build_mesh()
+
         self.debug = False
 
-    def update(self):
-        """Actualiza rect de colisión (en mundo)."""
-        self.y = self.field.height / 2.0
-        self.rect = pygame.Rect(
-            0,
-            self.y - self.height / 2,
-            self.field.width,
-            self.height
-        )
-
-    def draw(self, screen):
-        """Dibujo en 2D (pantalla), sin isométrico."""
+    def _court_net_y(self) -> float:
+        court = getattr(self.field, "court", None)
+        return court.net_y if court is not None else self.field.height / 2.0
+
+    def _build_mesh(self):
+        """Posición en pantalla de cada nodo en reposo (misma proyección que la pelota)."""
+        c = self.cloth
+        xs = np.linspace(NET_POSTS_X[0], NET_POSTS_X[1], c.cols)
+        zs = np.linspace(0.0, NET_DRAW_HEIGHT, c.rows)
+        cam = BALL_CAMERA.shifted(*NET_DRAW_OFFSET)
+        mx, my = cam.project_arrays(xs[None, :], self.y, zs[:, None])
+        self._mesh_x = np.broadcast_to(mx, (c.rows, c.cols)).copy()
+        self._mesh_y = my
+
+    # ---------------------------
+    # Simulación
+    # ---------------------------
+    def update(self, dt_ms=None):
+        """Avanza la red deformable un tick (no hace nada en reposo o sin cloth)."""
+        if self.cloth is not None:
+            self.cloth.step(dt_ms)
+
+    def impact(self, x: float, z: float, vy: float) -> float:
+        """La pelota toca la red: impulso a la malla y rigidez local (1 = red rígida)."""
+        if self.cloth is None:
+            return 1.0
+        return self.cloth.impact(x, z, vy)
+
+    def impact_many(self, x, z, vy):
+        """impact() con arrays (BallBatch): rigidez de cada toque; 1 con la red fija."""
+        if self.cloth is None:
+            return 1.0
+        return self.cloth.impact_many(x, z, vy)
+
+    def snapshot(self):
+        """Deformación para el render (None = red quieta: se dibuja la textura)."""
+        return self.cloth.snapshot() if self.cloth is not None else None
+
+    # ---------------------------
+    # Dibujo
+    # ---------------------------
+    def draw(self, screen, state=None):
+        """Dibujo en 2D (pantalla). state: snapshot() de la red; None = textura."""
+        if state is not None and self.cloth is not None:
+            self._draw_mesh(screen, state)
+            return
+
         if not self.texture:
             if self.rect:
                 # fallback rojo visible
@@ -66,6 +128,28 @@ class Net:
 
         screen.blit(self.texture, (net_x, net_y))
 
+    def _draw_mesh(self, screen, d):
+        """
+        Malla deformada: el desplazamiento d (en y de mundo) corre cada nodo (-d, d/2)
+        en pantalla. Hilos verticales muestreados entre columnas, horizontales por fila,
+        cinta y postes más gruesos.
+        """
+        px = self._mesh_x - d
+        py = self._mesh_y + d * 0.5
+        rows, cols = d.shape
+
+        # Hilos verticales: nodos + uno intermedio por hueco (la textura tiene ~2 por nodo)
+        fx = np.concatenate(((px[:, :-1] + px[:, 1:]) * 0.5, px), axis=1)
+        fy = np.concatenate(((py[:, :-1] + py[:, 1:]) * 0.5, py), axis=1)
+        for j in range(fx.shape[1]):
+            pygame.draw.lines(screen, NET_LINE_COLOR, False, list(zip(fx[:, j], fy[:, j])), 1)
+        for i in range(rows - 1):
+            pygame.draw.lines(screen, NET_LINE_COLOR, False, list(zip(px[i], py[i])), 1)
+
+        pygame.draw.lines(screen, NET_LINE_COLOR, False, list(zip(px[-1], py[-1])), 2)
+        for j in (0, cols - 1):
+            pygame.draw.line(screen, NET_LINE_COLOR, (px[0, j], py[0, j] + 4), (px[-1, j], py[-1, j]), 3)
+
     def draw_debug(self, screen):
         """Línea simple indicando dónde está la red (debug)."""
         if self.rect:
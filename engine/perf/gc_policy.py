@@ -0,0 +1,118 @@
+"""
+Política del recolector de basura (GC) para evitar pausas en medio de un rally.
+Diseño:
+- GCPolicy.after_load()   -> collect + gc.freeze(): assets y módulos fuera de las generaciones
+- GCPolicy.rally_break()  -> pausa natural entre puntos: collect(1) (o collect(2) si gen2 acumula
+                             max_gen2_pending colecciones de gen1) y GC automático apagado
+- GCPolicy.menu_break()   -> menú / fin de partida: collect completo y GC automático encendido
+- GCPolicy.tick()         -> red de seguridad: si gen0 crece demasiado en un rally, collect(0)
+- GCPolicy.report()       -> colecciones por generación y duración de pausas (ms)
+
+Las pausas se miden con gc.callbacks, tanto las automáticas como las explícitas,
+para comparar el p99 de frame con VJ2D_GC=0 / 1.
+"""
+
+import gc
+import time
+from collections import deque
+from typing import Dict
+
+
+class GCPolicy:
+    def __init__(self, enabled: bool = True, max_pending: int = 200_000, max_gen2_pending: int = 10,
+                 window: int = 512):
+        self.enabled = bool(enabled)
+        self.max_pending = int(max_pending)   # objetos pendientes en gen0 antes de forzar collect(0)
+        # Colecciones de gen1 desde la última completa (gc.get_count()[2]) antes de hacer una
+        # collect(2) en el corte: sin esto, en un partido largo gen2 solo se limpia en el menú
+        self.max_gen2_pending = max(1, int(max_gen2_pending))
+        self.in_rally = False
+
+        # Estadísticas
+        self.collections = [0, 0, 0]          # por generación (automáticas + explícitas)
+        self.rally_collections = 0            # automáticas durante un rally (lo que queremos en 0)
+        self.forced = 0                       # collect(0) de la red de seguridad
+        self.pauses_ms: deque = deque(maxlen=max(8, int(window)))
+        self.max_pause_ms = 0.0
+        self._t0 = 0.0
+        self._explicit = False
+
+        gc.callbacks.append(self._on_gc)
+
+    # ---------------------------
+    # Puntos de control del juego
+    # ---------------------------
+    def after_load(self) -> None:
+        """Tras cargar assets: todo lo vivo pasa a la generación permanente."""
+        self._collect(2)
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+            print(f"[GC] freeze: {gc.get_freeze_count()} objetos fuera del GC")
+
+    def rally_break(self) -> None:
+        """Entre puntos: limpieza barata y sin GC automático hasta el próximo corte."""
+        self.in_rally = True
+        if not self.enabled:
+            return
+        self._collect(2 if gc.get_count()[2] >= self.max_gen2_pending else 1)
+        gc.disable()
+
+    def menu_break(self) -> None:
+        """Menú / fin de partida: colección completa y GC automático normal."""
+        self.in_rally = False
+        if not self.enabled:
+            return
+        self._collect(2)
+        gc.enable()
+
+    def tick(self) -> None:
+        """Llamar una vez por frame: evita que un rally eterno acumule memoria sin límite."""
+        if self.in_rally and self.enabled and gc.get_count()[0] > self.max_pending:
+            self.forced += 1
+            self._collect(0)
+
+    def shutdown(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        gc.enable()
+
+    # ---------------------------
+    # Medición
+    # ---------------------------
+    def _collect(self, generation: int) -> None:
+        self._explicit = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._explicit = False
+
+    def _on_gc(self, phase: str, info: Dict) -> None:
+        if phase == "start":
+            self._t0 = time.perf_counter()
+            return
+        ms = (time.perf_counter() - self._t0) * 1000.0
+        gen = int(info.get("generation", 0))
+        self.collections[min(2, max(0, gen))] += 1
+        self.pauses_ms.append(ms)
+        self.max_pause_ms = max(self.max_pause_ms, ms)
+        if self.in_rally and not self._explicit:
+            self.rally_collections += 1
+
+    def stats(self) -> Dict[str, float]:
+        s = sorted(self.pauses_ms)
+        p99 = s[min(len(s) - 1, int(len(s) * 0.99))] if s else 0.0
+        return {
+            "gen0": self.collections[0],
+            "gen1": self.collections[1],
+            "gen2": self.collections[2],
+            "rally": self.rally_collections,
+            "forced": self.forced,
+            "max_ms": self.max_pause_ms,
+            "p99_ms": p99,
+        }
+
+    def report(self) -> None:
+        st = self.stats()
+        print(f"[GC] política={'on' if self.enabled else 'off'} colecciones gen0={st['gen0']} "
+              f"gen1={st['gen1']} gen2={st['gen2']} en rally={st['rally']} forzadas={st['forced']} "
+              f"pausa máx={st['max_ms']:.2f}ms p99={st['p99_ms']:.2f}ms")
@@ -0,0 +1,99 @@
+"""
+Governor de presupuesto de frame: baja la calidad cuando el frame no entra en el
+presupuesto y la vuelve a subir cuando sobra margen.
+Diseño:
+- FrameGovernor.observe(work_ms) -> registra el trabajo real del frame (sin la espera del pacing)
+- FrameGovernor.flags            -> QualityFlags del nivel actual
+- Niveles (acumulativos): 0 completo, 1 público congelado, 2 sin sombras,
+  3 HUD con contorno simple, 4 overlays a mitad de ritmo
+
+Histéresis: baja si el percentil supera el presupuesto, sube si queda por debajo
+de presupuesto * headroom, y entre transiciones espera hold_ms.
+"""
+
+from collections import deque
+from typing import NamedTuple
+
+try:
+    from engine.config.timing import (GOVERNOR_PERCENTILE, GOVERNOR_WINDOW,
+                                      GOVERNOR_HEADROOM, GOVERNOR_HOLD_MS)
+except Exception:
+    GOVERNOR_PERCENTILE, GOVERNOR_WINDOW, GOVERNOR_HEADROOM, GOVERNOR_HOLD_MS = 0.95, 90, 0.60, 1500
+
+
+class QualityFlags(NamedTuple):
+    crowd_anim: bool = True     # Background.update (animación del público)
+    shadows: bool = True        # sombras de pelota
+    hud_outline: str = "full"   # "full" = 8 blits de contorno, "simple" = 1 sombra
+    overlay_every: int = 1      # re-render de overlays de debug cada N frames
+
+
+QUALITY_LEVELS = (
+    ("completa", QualityFlags()),
+    ("público congelado", QualityFlags(crowd_anim=False)),
+    ("sin sombras", QualityFlags(crowd_anim=False, shadows=False)),
+    ("HUD simple", QualityFlags(crowd_anim=False, shadows=False, hud_outline="simple")),
+    ("overlays a mitad de ritmo", QualityFlags(crowd_anim=False, shadows=False, hud_outline="simple",
+                                               overlay_every=2)),
+)
+
+
+class FrameGovernor:
+    def __init__(self, budget_ms: float, enabled: bool = True,
+                 percentile: float = GOVERNOR_PERCENTILE, window: int = GOVERNOR_WINDOW,
+                 headroom: float = GOVERNOR_HEADROOM, hold_ms: float = GOVERNOR_HOLD_MS):
+        self.budget_ms = float(budget_ms)
+        self.enabled = bool(enabled)
+        self.percentile = max(0.5, min(0.999, float(percentile)))
+        self.headroom = float(headroom)
+        self.hold_ms = float(hold_ms)
+
+        self.level = 0
+        self.transitions = 0
+        self._samples: deque = deque(maxlen=max(8, int(window)))
+        self._since_change_ms = 0.0
+
+    @property
+    def flags(self) -> QualityFlags:
+        return QUALITY_LEVELS[self.level][1]
+
+    @property
+    def level_name(self) -> str:
+        return QUALITY_LEVELS[self.level][0]
+
+    def current_percentile(self) -> float:
+        s = sorted(self._samples)
+        if not s:
+            return 0.0
+        return s[min(len(s) - 1, int(len(s) * self.percentile))]
+
+    def observe(self, work_ms: float, frame_ms: float = 0.0) -> bool:
+        """
+        work_ms: tiempo de trabajo del frame; frame_ms: duración total (para hold_ms).
+        Devuelve True si cambió el nivel de calidad.
+        """
+        if not self.enabled:
+            return False
+        self._samples.append(float(work_ms))
+        self._since_change_ms += float(frame_ms or work_ms)
+        if len(self._samples) < self._samples.maxlen or self._since_change_ms < self.hold_ms:
+            return False
+
+        p = self.current_percentile()
+        if p > self.budget_ms and self.level < len(QUALITY_LEVELS) - 1:
+            self._set_level(self.level + 1, p)
+            return True
+        if p < self.budget_ms * self.headroom and self.level > 0:
+            self._set_level(self.level - 1, p)
+            return True
+        return False
+
+    def _set_level(self, level: int, p: float) -> None:
+        prev = self.level
+        self.level = level
+        self.transitions += 1
+        self._samples.clear()
+        self._since_change_ms = 0.0
+        arrow = "↓" if level > prev else "↑"
+        print(f"[Governor] calidad {arrow} {prev}→{level} ({self.level_name}) "
+              f"p{int(self.percentile * 100)}={p:.2f}ms presupuesto={self.budget_ms:.2f}ms")
@@ -0,0 +1,451 @@
+"""
+Física de pelotas en lote (struct-of-arrays con NumPy).
+Diseño:
+- BallBatch(capacity)           -> x/y/z/vx/vy/vz/spin/bounce_count/flags en arrays
+- BallBatch.spawn(...) -> idx   -> alta de una pelota (reusa huecos libres)
+- BallBatch.step(dt_ms, net)    -> avanza TODAS las pelotas activas en un paso vectorizado
+- BallBatch.fired(FLAG)         -> índices con ese evento (último step) o estado
+- BallView(batch, idx)          -> vista fina con la interfaz de Ball (x, y, z, draw, ...)
+
+Misma semántica que Ball.update (rally, sin saque): vuelo con el integrador
+(integrator.step_many: gravedad, arrastre, Magnus, decaimiento del spin), rebote 0.7 con
+el contacto sobre la curva del tick (swept.ground_contact), conteo de piques, out fuera de los límites,
+segundo pique = punto y toque de red (barrido) con cooldown; el toque de red usa la rigidez
+local y empuja la malla como Ball.update (Net.impact_many). Las pelotas que terminan (OUT / DEAD) quedan congeladas hasta kill().
+
+Alcance: herramienta offline (benchmark y paridad). El juego, los drills incluidos, sigue
+avanzando cada pelota con Ball.update; pasar las Ball a vistas del lote no está hecho.
+
+Uso offline:
+    python -m engine.physics.ball_batch --balls 5000 --ticks 600
+    python -m engine.physics.ball_batch --check          # paridad con Ball.update (sale con 1 si difiere)
+"""
+
+import argparse
+import time
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él solo existe el camino escalar (Ball)
+    np = None
+
+from engine.ball import (
+    Ball, FLIGHT, COURT, COEF_REBOTE, VZ_REPOSO,
+    NET_BALL_Y, NET_CLEAR, NET_DAMP_VZ,
+)
+from engine.physics.integrator import step_many
+from engine.timing.fixed_step import SIM_REF_HZ, ref_ticks, lerp
+
+# Flags de estado (persistentes)
+ACTIVE = 1 << 0
+OUT = 1 << 1          # picó fuera / salió de los límites
+DEAD = 1 << 2         # segundo pique dentro: punto
+# Flags de evento (solo el último step)
+BOUNCE = 1 << 3
+NET = 1 << 4
+ENDED = OUT | DEAD
+
+
+def _interval(a0, a1, lo: float, hi: float):
+    """Versión vectorizada de swept._interval: rango de t con a(t) en [lo, hi] por pelota."""
+    da = a1 - a0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0, t1 = (lo - a0) / da, (hi - a0) / da
+    still = da == 0.0
+    inside = still & (a0 >= lo) & (a0 <= hi)
+    t_lo, t_hi = np.minimum(t0, t1), np.maximum(t0, t1)
+    t_lo[still] = np.where(inside[still], -np.inf, 1.0)
+    t_hi[still] = np.where(inside[still], np.inf, 0.0)
+    return t_lo, t_hi
+
+
+def _ground_contact(z0, vz0, z1, vz1, k: float):
+    """Versión vectorizada de swept.ground_contact (solo para las pelotas con z1 <= 0 < z0)."""
+    c = (vz1 - vz0) * k * 0.5
+    b = (z1 - z0) - c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        linear = z0 / (z0 - z1)
+        disc = b * b - 4.0 * c * z0
+        q = -0.5 * (b + np.copysign(np.sqrt(np.maximum(disc, 0.0)), b))
+        r1, r2 = q / c, z0 / q
+    r1 = np.where((r1 >= 0.0) & (r1 <= 1.0), r1, np.inf)
+    r2 = np.where((q != 0.0) & (r2 >= 0.0) & (r2 <= 1.0), r2, np.inf)
+    t = np.minimum(r1, r2)
+    flat = (np.abs(c) <= 1e-12 * (np.abs(b) + z0)) | (disc < 0.0) | ~np.isfinite(t)
+    return np.where(flat, linear, t)
+
+
+def _net_stiffness(net, x, z, vy):
+    """Rigidez de la red en cada toque (y su impulso a la malla); 1 = red rígida, como Ball.update."""
+    many = getattr(net, "impact_many", None)
+    if many is not None:
+        return many(x, z, vy)
+    one = getattr(net, "impact", None)
+    if one is None:
+        return 1.0
+    return np.array([one(a, b, c) for a, b, c in zip(x, z, vy)])
+
+
+def _curve_at(a0, v0, a1, v1, k: float, t):
+    c = (v1 - v0) * k * 0.5
+    return a0 + ((a1 - a0) - c) * t + c * t * t
+
+
+class BallBatch:
+    def __init__(self, capacity: int = 1024, radio: int = 7, net_cd_ms: float = 100.0):
+        if np is None:
+            raise RuntimeError("BallBatch necesita NumPy (pip install numpy)")
+        self.radio = radio
+        self.net_cd_ms = float(net_cd_ms)
+        self.capacity = 0
+        self._free = []
+        self._alloc(max(1, int(capacity)))
+
+    # ---------------------------
+    # Memoria
+    # ---------------------------
+    _FLOAT_FIELDS = ("x", "y", "z", "vx", "vy", "vz", "spin", "prev_x", "prev_y", "prev_z", "net_cd")
+
+    def _alloc(self, capacity: int) -> None:
+        old = self.capacity
+        for name in self._FLOAT_FIELDS:
+            arr = np.zeros(capacity, dtype=np.float64)
+            if old:
+                arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        for name, dtype in (("bounce_count", np.int32), ("flags", np.uint8), ("events", np.uint8)):
+            arr = np.zeros(capacity, dtype=dtype)
+            if old:
+                arr[:old] = getattr(self, name)
+            setattr(self, name, arr)
+        # Los huecos nuevos se entregan en orden ascendente
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, x: float, y: float, z: float = 80.0,
+              vx: float = 0.0, vy: float = 0.0, vz: float = 0.0, spin: float = 0.0) -> int:
+        if not self._free:
+            self._alloc(self.capacity * 2)
+        i = self._free.pop()
+        self.x[i], self.y[i], self.z[i] = x, y, z
+        self.prev_x[i], self.prev_y[i], self.prev_z[i] = x, y, z
+        self.vx[i], self.vy[i], self.vz[i] = vx, vy, vz
+        self.spin[i] = spin
+        self.net_cd[i] = 0.0
+        self.bounce_count[i] = 0
+        self.flags[i] = ACTIVE
+        self.events[i] = 0
+        return i
+
+    def kill(self, i: int) -> None:
+        if self.flags[i] & ACTIVE:
+            self.flags[i] = 0
+            self.events[i] = 0
+            self._free.append(int(i))
+
+    def clear(self) -> None:
+        self.flags[:] = 0
+        self.events[:] = 0
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    @property
+    def alive(self) -> int:
+        return self.capacity - len(self._free)
+
+    def live(self):
+        """Índices de pelotas vivas (incluye las terminadas sin kill)."""
+        return np.flatnonzero(self.flags & ACTIVE)
+
+    # ---------------------------
+    # Simulación
+    # ---------------------------
+    def snap_prev(self) -> None:
+        """Posición actual -> 'tick anterior' para interpolar el render."""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+        np.copyto(self.prev_z, self.z)
+
+    def step(self, dt_ms: Optional[float] = None, net=None) -> None:
+        """
+        Avanza un tick de dt_ms (None = tick de referencia) para todas las pelotas en juego.
+        net: Net (o algo con .y, .height y opcional impact_many / impact); None = sin red.
+        """
+        k = ref_ticks(dt_ms)
+        dt = float(dt_ms) if dt_ms is not None else 1000.0 / SIM_REF_HZ
+        self.events[:] = 0
+        moving = (self.flags & ACTIVE).astype(bool) & ~(self.flags & ENDED).astype(bool)
+        if not moving.any():
+            return
+
+        x, y, z = self.x, self.y, self.z
+        vx, vy, vz = self.vx, self.vy, self.vz
+        x0, y0, z0 = x.copy(), y.copy(), z.copy()
+        vx0, vy0, vz0 = vx.copy(), vy.copy(), vz.copy()
+
+        # --- Vuelo (mismo integrador que Ball.update; segmento recto para la red) ---
+        (x[moving], y[moving], z[moving], vx[moving], vy[moving], vz[moving],
+         self.spin[moving]) = step_many(x[moving], y[moving], z[moving], vx[moving], vy[moving],
+                                        vz[moving], self.spin[moving], k, FLIGHT)
+
+        # --- Contactos barridos (engine.physics.swept, en versión vectorizada) ---
+        ground = moving & (z <= 0.0)
+        t_ground = np.full_like(z, np.inf)
+        t_ground[ground & (z0 <= 0.0)] = 0.0
+        air = ground & (z0 > 0.0)
+        if air.any():
+            t_ground[air] = _ground_contact(z0[air], vz0[air], z[air], vz[air], k)
+
+        self.net_cd[self.net_cd > 0.0] = np.maximum(0.0, self.net_cd[self.net_cd > 0.0] - dt)
+        first_net = np.zeros_like(moving)
+        if net is not None:
+            ylo, yhi = _interval(y0, y, float(net.y) - self.radio, float(net.y) + self.radio)
+            zlo, zhi = _interval(z0, z, 0.0, float(net.height))
+            t_net = np.maximum(np.maximum(ylo, zlo), 0.0)
+            hit = moving & (self.net_cd <= 0.0) & (t_net <= np.minimum(np.minimum(yhi, zhi), 1.0))
+            first_net = hit & (t_net < t_ground)
+
+        # --- Colisión con red ---
+        if first_net.any():
+            tn = t_net[first_net]
+            x[first_net] = x0[first_net] + (x[first_net] - x0[first_net]) * tn
+            y[first_net] = y0[first_net] + (y[first_net] - y0[first_net]) * tn
+            z[first_net] = z0[first_net] + (z[first_net] - z0[first_net]) * tn
+            self.events[first_net] |= NET
+            self.net_cd[first_net] = self.net_cd_ms
+            # La red absorbe según dónde pegó (más en el centro, menos junto a postes / cinta)
+            stiff = _net_stiffness(net, x[first_net], z[first_net], vy[first_net])
+            vx[first_net] = 0.0
+            vy[first_net] = 0.0
+            vz[first_net] *= NET_DAMP_VZ * stiff
+            above = first_net & (y > NET_BALL_Y)
+            below = first_net & ~above
+            y[above] = NET_BALL_Y + self.radio + NET_CLEAR
+            y[below] = NET_BALL_Y - (self.radio + NET_CLEAR)
+
+        # --- Rebote en cancha (en el instante exacto del contacto) ---
+        ground &= ~first_net
+        if ground.any():
+            tg = t_ground[ground]
+            cx = _curve_at(x0[ground], vx0[ground], x[ground], vx[ground], k, tg)
+            cy = _curve_at(y0[ground], vy0[ground], y[ground], vy[ground], k, tg)
+            vz_out = -(vz0[ground] + (vz[ground] - vz0[ground]) * tg) * COEF_REBOTE
+            z[ground] = vz_out * (1.0 - tg) * k
+            vz[ground] = vz_out
+
+            inside_c = np.zeros_like(moving)
+            inside_c[ground] = COURT.inside_many(cx, cy)
+            bounced = ground & inside_c
+            self.bounce_count[bounced] += 1
+            self.events[bounced] |= BOUNCE
+
+            dead = bounced & (self.bounce_count >= 2)
+            self.flags[dead] |= DEAD
+            self.flags[ground & ~inside_c] |= OUT
+
+            settle = bounced & ~dead & (np.abs(vz) < VZ_REPOSO)
+            z[settle] = 0.0
+            vz[settle] = 0.0
+            moving &= ~(self.flags & ENDED).astype(bool)
+
+        # --- Out más allá de los límites (pelota rodando) ---
+        inside = COURT.inside_many(x, y)
+        rolling_out = moving & (z == 0.0) & ~inside
+        self.flags[rolling_out] |= OUT
+
+    def fired(self, flag: int):
+        """Índices que dispararon flag (BOUNCE / NET) en el último step, o que tienen OUT / DEAD."""
+        src = self.events if flag & (BOUNCE | NET) else self.flags
+        return np.flatnonzero(src & flag)
+
+    # ---------------------------
+    # Vistas
+    # ---------------------------
+    def view(self, i: int) -> "BallView":
+        return BallView(self, i)
+
+
+class BallView:
+    """
+    Vista de una pelota del lote con la interfaz que usan render / IA de Ball.
+    No guarda estado propio: leer o escribir x, vx, ... toca directamente los arrays.
+    """
+    __slots__ = ("batch", "idx")
+
+    def __init__(self, batch: BallBatch, idx: int):
+        self.batch = batch
+        self.idx = idx
+
+    def _field(name):
+        def fget(self):
+            return float(getattr(self.batch, name)[self.idx])
+
+        def fset(self, value):
+            getattr(self.batch, name)[self.idx] = value
+        return property(fget, fset)
+
+    x, y, z = _field("x"), _field("y"), _field("z")
+    vx, vy, vz = _field("vx"), _field("vy"), _field("vz")
+    spin = _field("spin")
+    prev_x, prev_y, prev_z = _field("prev_x"), _field("prev_y"), _field("prev_z")
+    del _field
+
+    @property
+    def radio(self) -> int:
+        return self.batch.radio
+
+    @property
+    def bounce_count(self) -> int:
+        return int(self.batch.bounce_count[self.idx])
+
+    @property
+    def out_of_bounds(self) -> bool:
+        return bool(self.batch.flags[self.idx] & ENDED)
+
+    def draw(self, screen, alpha: float = 1.0):
+        Ball.draw_state(screen,
+                        lerp(self.prev_x, self.x, alpha),
+                        lerp(self.prev_y, self.y, alpha),
+                        lerp(self.prev_z, self.z, alpha),
+                        self.radio)
+
+
+# ---------------------------
+# Benchmark offline
+# ---------------------------
+def _court_net():
+    """Net de verdad (malla deformable incluida) sobre un Field mínimo: solo lee width y court."""
+    from types import SimpleNamespace
+    from engine.net import Net
+
+    return Net(SimpleNamespace(width=6, height=10, court=COURT))
+
+
+def _bench(balls: int, ticks: int, seed: int) -> None:
+    from engine.timing.fixed_step import FixedTimestep
+
+    rng = np.random.default_rng(seed)
+    batch = BallBatch(balls)
+    net = _court_net()
+    for _ in range(balls):
+        batch.spawn(rng.uniform(-40, 240), rng.uniform(-140, 340), rng.uniform(20, 100),
+                    rng.uniform(-6, 6), rng.uniform(-10, 10), rng.uniform(-2, 8))
+
+    dt = FixedTimestep().step_ms
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        batch.snap_prev()
+        batch.step(dt, net)
+    el = time.perf_counter() - t0
+    print(f"[BallBatch] {balls} pelotas × {ticks} ticks en {el:.2f}s "
+          f"→ {balls * ticks / max(1e-9, el):,.0f} pelota-ticks/s  "
+          f"out={len(batch.fired(OUT))} punto={len(batch.fired(DEAD))}")
+
+
+# ---------------------------
+# Paridad con Ball.update
+# ---------------------------
+class _StubGame:
+    """Lo que Ball.update le pide al juego (red, timers, audio, punto) sin pygame ni Field."""
+
+    def __init__(self, net):
+        from types import SimpleNamespace
+        from engine.timing.scheduler import Scheduler
+
+        self.field = SimpleNamespace(net=net)
+        self.audio = SimpleNamespace(sounds={}, enabled=False, play_sound=lambda name: None)
+        self.timers = Scheduler()
+        self.last_hitter = "P1"
+        self.points = 0
+
+    def point_for(self, who: str) -> None:
+        self.points += 1
+
+
+def _check(balls: int, ticks: int, seed: int, tol: float = 1e-9) -> int:
+    """
+    Mismos estados iniciales por Ball.update (una por una) y por BallBatch.step (todas
+    juntas), sin y con arrastre y sin y con spin. Compara posición, velocidad, spin y piques
+    en cada tick, y el final (OUT / DEAD vs out_of_bounds). Devuelve las pelotas que difieren.
+    """
+    import engine.ball as ball_mod
+    from engine.timing.fixed_step import FixedTimestep
+
+    global FLIGHT
+    base = FLIGHT
+    dt = FixedTimestep().step_ms
+    # Una Net real por camino: cada uno empuja su malla y al final los impulsos deben coincidir
+    ball_net, batch_net = _court_net(), _court_net()
+    cases = (("gravedad", 0.0, False), ("spin", 0.0, True),
+             ("arrastre", base.drag or 0.0004, False), ("arrastre+spin", base.drag or 0.0004, True))
+    bad_total = 0
+    try:
+        for name, drag, with_spin in cases:
+            # Ball.update y BallBatch.step leen FLIGHT de su módulo: se cambia en los dos
+            FLIGHT = ball_mod.FLIGHT = base._replace(drag=float(drag))
+            rng = np.random.default_rng(seed)
+            batch = BallBatch(balls)
+            game = _StubGame(ball_net)
+            for net in (ball_net, batch_net):
+                if net.cloth is not None:
+                    net.cloth._kick.fill(0.0)
+            net_hits = 0
+            pairs = []
+            for _ in range(balls):
+                x, y, z = rng.uniform(-40, 240), rng.uniform(-140, 340), rng.uniform(20, 100)
+                vx, vy, vz = rng.uniform(-6, 6), rng.uniform(-10, 10), rng.uniform(-2, 8)
+                spin = rng.uniform(-0.9, 0.9) if with_spin else 0.0
+                b = Ball(x, y, game, vx, vy)
+                b.z, b.vz, b.spin = z, vz, spin
+                pairs.append((b, batch.spawn(x, y, z, vx, vy, vz, spin)))
+
+            bad = set()
+            for _ in range(ticks):
+                game.timers.advance(dt)
+                for b, _ in pairs:
+                    if not b.out_of_bounds:
+                        b.update(dt)
+                batch.step(dt, batch_net)
+                net_hits += len(batch.fired(NET))
+                for j, (b, i) in enumerate(pairs):
+                    if j in bad:
+                        continue
+                    ended = bool(batch.flags[i] & ENDED)
+                    if b.out_of_bounds or ended:
+                        if b.out_of_bounds != ended:
+                            bad.add(j)
+                        continue
+                    got = (batch.x[i], batch.y[i], batch.z[i], batch.vx[i], batch.vy[i], batch.vz[i], batch.spin[i])
+                    want = (b.x, b.y, b.z, b.vx, b.vy, b.vz, b.spin)
+                    if (any(abs(g - w) > tol for g, w in zip(got, want))
+                            or batch.bounce_count[i] != b.bounce_count):
+                        bad.add(j)
+            kick_ok = True
+            if ball_net.cloth is not None:
+                kick_ok = bool(np.allclose(ball_net.cloth._kick, batch_net.cloth._kick, rtol=1e-9, atol=tol))
+            ended = sum(1 for b, _ in pairs if b.out_of_bounds)
+            print(f"[BallBatch] paridad {name:<14} drag={FLIGHT.drag:g}: {balls} pelotas × {ticks} ticks, "
+                  f"terminadas={ended} red={net_hits} malla={'ok' if kick_ok else 'DIFIERE'} "
+                  f"diferencias={len(bad)}")
+            bad_total += len(bad) + (0 if kick_ok else 1)
+    finally:
+        FLIGHT = ball_mod.FLIGHT = base
+    return bad_total
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark de BallBatch / paridad con Ball.update")
+    ap.add_argument("--balls", type=int, default=None, help="default 5000 (benchmark) / 300 (--check)")
+    ap.add_argument("--ticks", type=int, default=None, help="default 600 (benchmark) / 240 (--check)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--check", action="store_true", help="comparar contra Ball.update en vez de medir")
+    args = ap.parse_args(argv)
+    if args.check:
+        bad = _check(args.balls or 300, args.ticks or 240, args.seed)
+        return 1 if bad else 0
+    _bench(args.balls or 5000, args.ticks or 600, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
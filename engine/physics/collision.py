@@ -1,6 +1,21 @@
+import argparse
+import math
+import time
+from itertools import combinations
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
 import pygame
 from pygame import Rect
-from typing import Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: la fase fina cae a un loop en Python
+    np = None
+
+try:
+    from engine.config.collisions import HASH_CELL
+except Exception:
+    HASH_CELL = 64.0
 
 VectorLike = Union[Tuple[float, float], pygame.math.Vector2]
 
@@ -127,3 +142,407 @@ def resolve_axis_penetration(moving: Rect, solid: Rect, vx: float, vy: float) ->
             moving.bottom = solid.top - 1
         else:
             moving.top = solid.bottom + 1
+
+
+# =============================================================================
+# Mundo de colisiones: spatial hash uniforme + fase fina en lote
+# =============================================================================
+# Diseño:
+# - SpatialHash(cell)                 -> celdas (ix, iy) -> handles; re-bucket solo si cambia el rango de celdas
+# - CollisionWorld.sync_circle/rect   -> alta o movimiento de una forma (por dueño + tipo)
+# - CollisionWorld.circle_rect(kinds) -> Contacts (arrays) círculo–rect de los pares candidatos
+# - CollisionWorld.circle_circle()    -> Contacts (arrays) pelota–pelota
+# - CollisionWorld.candidates(a, b)   -> pares (dueño_a, dueño_b) que comparten celda
+#
+# Las coordenadas son las del plano de la cancha (x, y de mundo de la pelota); la
+# altura y el barrido exacto quedan para el test de cada par (Player.check_ball_collision).
+
+BALL, RACKET, BODY = 1, 2, 4
+
+# Con pocos pares el filtro en Python es más barato que armar arrays
+_NUMPY_MIN_PAIRS = 32
+
+_CIRCLE, _RECT = 0, 1
+
+
+class SpatialHash:
+    def __init__(self, cell: float = HASH_CELL):
+        self.cell = float(cell)
+        self.cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._span: Dict[int, Tuple[int, int, int, int]] = {}
+        self.rebuckets = 0   # cuántas veces una forma cambió de celdas (diagnóstico)
+        self._pairs: Optional[Set[Tuple[int, int]]] = None   # vale hasta el próximo re-bucket
+        self._pair_arr = None
+
+    def _cells_of(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[int, int, int, int]:
+        c = self.cell
+        return int(math.floor(x0 / c)), int(math.floor(y0 / c)), int(math.floor(x1 / c)), int(math.floor(y1 / c))
+
+    def update(self, h: int, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Inserta o mueve h. Si su rango de celdas no cambió, no toca los buckets."""
+        span = self._cells_of(x0, y0, x1, y1)
+        old = self._span.get(h)
+        if old == span:
+            return
+        if old is not None:
+            self._unlink(h, old)
+        self._span[h] = span
+        self.rebuckets += 1
+        self._pairs = self._pair_arr = None
+        cells = self.cells
+        for ix in range(span[0], span[2] + 1):
+            for iy in range(span[1], span[3] + 1):
+                bucket = cells.get((ix, iy))
+                if bucket is None:
+                    bucket = cells[(ix, iy)] = set()
+                bucket.add(h)
+
+    def remove(self, h: int) -> None:
+        old = self._span.pop(h, None)
+        if old is not None:
+            self._unlink(h, old)
+            self._pairs = self._pair_arr = None
+
+    def _unlink(self, h: int, span: Tuple[int, int, int, int]) -> None:
+        cells = self.cells
+        for ix in range(span[0], span[2] + 1):
+            for iy in range(span[1], span[3] + 1):
+                bucket = cells.get((ix, iy))
+                if bucket is not None:
+                    bucket.discard(h)
+                    if not bucket:
+                        del cells[(ix, iy)]
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> Set[int]:
+        span = self._cells_of(x0, y0, x1, y1)
+        out: Set[int] = set()
+        cells = self.cells
+        for ix in range(span[0], span[2] + 1):
+            for iy in range(span[1], span[3] + 1):
+                bucket = cells.get((ix, iy))
+                if bucket:
+                    out |= bucket
+        return out
+
+    def pairs(self) -> Set[Tuple[int, int]]:
+        """Pares (a, b) con a < b que comparten al menos una celda (cacheado hasta que algo cambie de celda)."""
+        if self._pairs is None:
+            out: Set[Tuple[int, int]] = set()
+            for bucket in self.cells.values():
+                if len(bucket) > 1:
+                    out.update(combinations(sorted(bucket), 2))
+            self._pairs = out
+        return self._pairs
+
+    def pair_array(self):
+        """pairs() como array (n, 2) de NumPy (misma validez que pairs())."""
+        if self._pair_arr is None:
+            pairs = self.pairs()
+            self._pair_arr = (np.fromiter((h for p in pairs for h in p), dtype=np.int64, count=2 * len(pairs))
+                              .reshape(-1, 2))
+        return self._pair_arr
+
+
+class Contacts(NamedTuple):
+    a: "np.ndarray"       # handles (círculo)
+    b: "np.ndarray"       # handles (rect o segundo círculo)
+    nx: "np.ndarray"      # normal de b hacia a
+    ny: "np.ndarray"
+    depth: "np.ndarray"   # penetración (>= 0)
+
+
+def _empty_contacts() -> Contacts:
+    if np is None:
+        return Contacts([], [], [], [], [])
+    e = np.empty(0)
+    return Contacts(e.astype(np.int64), e.astype(np.int64), e, e, e)
+
+
+class CollisionWorld:
+    def __init__(self, cell: float = HASH_CELL, capacity: int = 64):
+        self.hash = SpatialHash(cell)
+        self._owners: List[object] = []
+        self._keys: Dict[Tuple[int, int], int] = {}    # (id(dueño), kind) -> handle
+        self._free: List[int] = []
+        self._grow(max(1, int(capacity)))
+
+    def _grow(self, capacity: int) -> None:
+        old = len(self._owners)
+        self._owners.extend([None] * (capacity - old))
+        if np is not None:
+            def ext(arr, dtype=float):
+                new = np.zeros(capacity, dtype=dtype)
+                if arr is not None:
+                    new[:old] = arr
+                return new
+            self.shape = ext(getattr(self, "shape", None), np.int8)
+            self.kind = ext(getattr(self, "kind", None), np.int8)
+            self.oid = ext(getattr(self, "oid", None), np.int64)   # id(dueño): descarta pares propios
+            # Círculo: (a, b) = centro, r ; rect: (a, b, c, d) = x0, y0, x1, y1
+            self.a = ext(getattr(self, "a", None))
+            self.b = ext(getattr(self, "b", None))
+            self.c = ext(getattr(self, "c", None))
+            self.d = ext(getattr(self, "d", None))
+        else:
+            for name in ("shape", "kind", "oid", "a", "b", "c", "d"):
+                lst = getattr(self, name, [])
+                setattr(self, name, list(lst) + [0] * (capacity - old))
+        self._free.extend(range(capacity - 1, old - 1, -1))
+
+    # ---------------------------
+    # Alta / movimiento
+    # ---------------------------
+    def _handle(self, owner, kind: int) -> int:
+        key = (id(owner), kind)
+        h = self._keys.get(key)
+        if h is None:
+            if not self._free:
+                self._grow(len(self._owners) * 2)
+            h = self._free.pop()
+            self._keys[key] = h
+            self._owners[h] = owner
+            self.kind[h] = kind
+            self.oid[h] = id(owner)
+        return h
+
+    def sync_circle(self, owner, x: float, y: float, r: float, kind: int = BALL) -> int:
+        h = self._handle(owner, kind)
+        self.shape[h] = _CIRCLE
+        self.a[h], self.b[h], self.c[h] = x, y, r
+        self.hash.update(h, x - r, y - r, x + r, y + r)
+        return h
+
+    def sync_rect(self, owner, x0: float, y0: float, x1: float, y1: float, kind: int) -> int:
+        h = self._handle(owner, kind)
+        self.shape[h] = _RECT
+        self.a[h], self.b[h], self.c[h], self.d[h] = x0, y0, x1, y1
+        self.hash.update(h, x0, y0, x1, y1)
+        return h
+
+    def remove(self, owner, kind: Optional[int] = None) -> None:
+        for key in [k for k in self._keys if k[0] == id(owner) and (kind is None or k[1] == kind)]:
+            h = self._keys.pop(key)
+            self.hash.remove(h)
+            self._owners[h] = None
+            self._free.append(h)
+
+    def prune(self, alive: Iterable[object], kind: int) -> None:
+        """Da de baja las formas de ese tipo cuyos dueños ya no están (pelotas eliminadas)."""
+        ids = {id(o) for o in alive}
+        for key in [k for k in self._keys if k[1] == kind and k[0] not in ids]:
+            h = self._keys.pop(key)
+            self.hash.remove(h)
+            self._owners[h] = None
+            self._free.append(h)
+
+    def owner(self, h: int):
+        return self._owners[h]
+
+    # ---------------------------
+    # Fase amplia
+    # ---------------------------
+    def _pairs(self, kind_a: int, kind_b: int):
+        """Pares candidatos (forma de kind_a, forma de kind_b), sin pares del mismo dueño."""
+        if np is not None and len(self.hash.pairs()) >= _NUMPY_MIN_PAIRS:
+            pairs = self.hash.pair_array()
+            h0, h1 = pairs[:, 0], pairs[:, 1]
+            k0, k1 = self.kind[h0], self.kind[h1]
+            fwd = ((k0 & kind_a) != 0) & ((k1 & kind_b) != 0)
+            rev = ~fwd & ((k1 & kind_a) != 0) & ((k0 & kind_b) != 0)
+            ia, ib = np.where(fwd, h0, h1), np.where(fwd, h1, h0)
+            keep = (fwd | rev) & (self.oid[h0] != self.oid[h1])
+            return ia[keep], ib[keep]
+
+        kind, owners = self.kind, self._owners
+        ia, ib = [], []
+        for h0, h1 in self.hash.pairs():
+            if not (kind[h0] & kind_a and kind[h1] & kind_b):
+                if not (kind[h1] & kind_a and kind[h0] & kind_b):
+                    continue
+                h0, h1 = h1, h0
+            if owners[h0] is owners[h1]:
+                continue
+            ia.append(h0)
+            ib.append(h1)
+        if np is not None:
+            return np.asarray(ia, dtype=np.int64), np.asarray(ib, dtype=np.int64)
+        return ia, ib
+
+    def candidates(self, kind_a: int = BALL, kind_b: int = RACKET) -> List[Tuple[object, object]]:
+        """(dueño_a, dueño_b) que comparten celda; útil para delegar el test exacto."""
+        ia, ib = self._pairs(kind_a, kind_b)
+        owners = self._owners
+        return [(owners[x], owners[y]) for x, y in zip(ia.tolist() if np is not None else ia,
+                                                        ib.tolist() if np is not None else ib)]
+
+    # ---------------------------
+    # Fase fina (en lote)
+    # ---------------------------
+    def circle_rect(self, kinds: int = RACKET | BODY, circles: int = BALL) -> Contacts:
+        """Contactos círculo–rect entre los candidatos, en arrays (una pasada vectorizada)."""
+        ia, ib = self._pairs(circles, kinds)
+        if np is None:
+            return self._circle_rect_py(ia, ib) if ia else _empty_contacts()
+        keep = (self.shape[ia] == _CIRCLE) & (self.shape[ib] == _RECT)
+        ia, ib = ia[keep], ib[keep]
+        if not len(ia):
+            return _empty_contacts()
+
+        cx, cy, r = self.a[ia], self.b[ia], self.c[ia]
+        x0, y0, x1, y1 = self.a[ib], self.b[ib], self.c[ib], self.d[ib]
+        px, py = np.clip(cx, x0, x1), np.clip(cy, y0, y1)
+        dx, dy = cx - px, cy - py
+        d2 = dx * dx + dy * dy
+        hit = d2 <= r * r
+        ia, ib, cx, cy, r, x0, y0, x1, y1, dx, dy, d2 = (
+            v[hit] for v in (ia, ib, cx, cy, r, x0, y0, x1, y1, dx, dy, d2))
+
+        dist = np.sqrt(d2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            nx, ny = dx / dist, dy / dist
+        depth = r - dist
+
+        # Centro dentro del rect: salida por el lado de menor penetración (como circle_rect_mtv)
+        inside = dist == 0.0
+        if inside.any():
+            pens = np.stack((cx - x0, x1 - cx, cy - y0, y1 - cy))[:, inside]
+            side = np.argmin(pens, axis=0)
+            nx[inside] = np.choose(side, (-1.0, 1.0, 0.0, 0.0))
+            ny[inside] = np.choose(side, (0.0, 0.0, -1.0, 1.0))
+            depth[inside] = r[inside] + np.min(pens, axis=0)
+        return Contacts(ia, ib, nx, ny, depth)
+
+    def _circle_rect_py(self, ia: list, ib: list) -> Contacts:
+        out = ([], [], [], [], [])
+        for h0, h1 in zip(ia, ib):
+            x0, y0, x1, y1 = self.a[h1], self.b[h1], self.c[h1], self.d[h1]
+            cx, cy, r = self.a[h0], self.b[h0], self.c[h0]
+            px, py = _clamp(cx, x0, x1), _clamp(cy, y0, y1)
+            dx, dy = cx - px, cy - py
+            d2 = dx * dx + dy * dy
+            if d2 > r * r:
+                continue
+            dist = math.sqrt(d2)
+            if dist == 0.0:
+                pens = (cx - x0, x1 - cx, cy - y0, y1 - cy)
+                side = pens.index(min(pens))
+                n = ((-1.0, 0.0), (1.0, 0.0), (0.0, -1.0), (0.0, 1.0))[side]
+                depth = r + min(pens)
+            else:
+                n, depth = (dx / dist, dy / dist), r - dist
+            for lst, v in zip(out, (h0, h1, n[0], n[1], depth)):
+                lst.append(v)
+        return Contacts(*out)
+
+    def circle_circle(self, kinds: int = BALL) -> Contacts:
+        """Contactos círculo–círculo (pelota–pelota) entre los candidatos, en arrays."""
+        ia, ib = self._pairs(kinds, kinds)
+        if np is None:
+            out = ([], [], [], [], [])
+            for h0, h1 in zip(ia, ib):
+                if self.shape[h0] != _CIRCLE or self.shape[h1] != _CIRCLE:
+                    continue
+                dx, dy = self.a[h0] - self.a[h1], self.b[h0] - self.b[h1]
+                dist, rr = math.hypot(dx, dy), self.c[h0] + self.c[h1]
+                if dist > rr:
+                    continue
+                n = (dx / dist, dy / dist) if dist > 0.0 else (1.0, 0.0)
+                for lst, v in zip(out, (h0, h1, n[0], n[1], rr - dist)):
+                    lst.append(v)
+            return Contacts(*out)
+
+        keep = (self.shape[ia] == _CIRCLE) & (self.shape[ib] == _CIRCLE)
+        ia, ib = ia[keep], ib[keep]
+        if not len(ia):
+            return _empty_contacts()
+        dx, dy = self.a[ia] - self.a[ib], self.b[ia] - self.b[ib]
+        rr = self.c[ia] + self.c[ib]
+        d2 = dx * dx + dy * dy
+        hit = d2 <= rr * rr
+        ia, ib, dx, dy, rr, d2 = (v[hit] for v in (ia, ib, dx, dy, rr, d2))
+        dist = np.sqrt(d2)
+        safe = np.where(dist > 0.0, dist, 1.0)
+        nx = np.where(dist > 0.0, dx / safe, 1.0)
+        ny = np.where(dist > 0.0, dy / safe, 0.0)
+        return Contacts(ia, ib, nx, ny, rr - dist)
+
+
+# -----------------------------
+# Rally: pelotas y jugadores
+# -----------------------------
+def sync_rally(world: CollisionWorld, balls, players, kinds: Tuple[int, ...] = (RACKET, BODY)) -> None:
+    """
+    Actualiza el mundo con las pelotas (círculo que cubre el tramo del tick) y las
+    huellas de raqueta / cuerpo de cada jugador en el plano de la cancha.
+    """
+    for ball in balls:
+        x1, y1 = ball.x, ball.y
+        x0, y0 = getattr(ball, "prev_x", x1), getattr(ball, "prev_y", y1)
+        half = 0.5 * math.hypot(x1 - x0, y1 - y0)
+        world.sync_circle(ball, (x0 + x1) * 0.5, (y0 + y1) * 0.5, getattr(ball, "radio", 7) + half, BALL)
+    world.prune(balls, BALL)
+    for p in players:
+        for kind in kinds:
+            world.sync_rect(p, *p.footprint(kind), kind)
+
+
+def ball_player_candidates(world: CollisionWorld, balls, players) -> List[Tuple[object, object]]:
+    """
+    Pares (pelota, jugador) cuya pelota está cerca de la raqueta, en el orden de
+    `balls` y luego de `players` (el mismo que el doble loop que reemplaza).
+    Solo entran los jugadores con la raqueta activa (el resto no puede golpear).
+    """
+    players = [p for p in players if getattr(p, "racket_active", True)]
+    if not players:
+        return []
+    if any(getattr(p, "hitboxes", None) is None for p in players):
+        # Sin volúmenes en mundo el test de la raqueta es en pantalla: todos contra todos
+        return [(b, p) for b in balls for p in players]
+    sync_rally(world, balls, players, (RACKET,))
+    near = {(id(b), id(p)) for b, p in world.candidates(BALL, RACKET)}
+    if not near:
+        return []
+    return [(b, p) for b in balls for p in players if (id(b), id(p)) in near]
+
+
+def _bench(balls: int, players: int, ticks: int, seed: int) -> None:
+    import random
+    rnd = random.Random(seed)
+    world = CollisionWorld()
+    pos = [[rnd.uniform(-50, 250), rnd.uniform(-150, 350), rnd.uniform(-6, 6), rnd.uniform(-6, 6)]
+           for _ in range(balls)]
+    owners = [object() for _ in range(balls)]
+    racks = [object() for _ in range(players)]
+    found = 0
+    t0 = time.perf_counter()
+    for _ in range(ticks):
+        for o, p in zip(owners, pos):
+            p[0] += p[2]
+            p[1] += p[3]
+            if not -50 <= p[0] <= 250:
+                p[2] = -p[2]
+            if not -150 <= p[1] <= 350:
+                p[3] = -p[3]
+            world.sync_circle(o, p[0], p[1], 7.0)
+        for i, o in enumerate(racks):
+            x = -50 + 300 * (i + 0.5) / players
+            world.sync_rect(o, x - 20, 320, x + 20, 345, RACKET)
+            world.sync_rect(o, x - 8, 335, x + 8, 345, BODY)
+        found += len(world.circle_rect().a) + len(world.circle_circle().a)
+    el = time.perf_counter() - t0
+    print(f"[Collision] {balls} pelotas + {players} jugadores × {ticks} ticks en {el:.2f}s "
+          f"({el / ticks * 1000:.2f} ms/tick)  contactos={found}  re-buckets={world.hash.rebuckets}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark del mundo de colisiones")
+    ap.add_argument("--balls", type=int, default=300)
+    ap.add_argument("--players", type=int, default=4)
+    ap.add_argument("--ticks", type=int, default=600)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+    _bench(args.balls, args.players, args.ticks, args.seed)
+
+
+if __name__ == "__main__":
+    main()
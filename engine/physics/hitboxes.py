@@ -0,0 +1,182 @@
+"""
+Volúmenes de golpe por frame de animación (raqueta y cuerpo) en espacio de mundo.
+Diseño:
+- HitboxTable.load(path, animations) -> compila el JSON a un array('f') plano
+- HitboxTable.record(anim, frame)    -> offset del registro del frame (o el default)
+- HitboxTable.sweep(off, kind, p0, p1, r) -> t∈[0,1] del primer contacto o None
+- HitboxTable.footprint(off, kind, mirror, far) -> huella de la caja en el piso (fase amplia)
+- HitboxTable.screen_rect(off, kind, rect, cx, cy, mirror, far) -> proyección en pantalla (debug), en el lugar
+- local_point(x, y, z, mirror, far) -> punto del mundo (relativo a los pies) al espacio del JSON
+
+Formato del JSON (junto a player.json), en unidades de mundo de la pelota y relativo
+a los pies del jugador de ABAJO (P1: la red hacia -y), mirando a la DERECHA:
+    {
+      "default":    {"racket": {"center": [dx, dy, dz], "half": [hx, hy, hz]}, "body": {...}},
+      "animations": {"stroke-right": [{"racket": {...}}, {...}, ...], ...}
+    }
+Los frames sin entrada (o sin "racket"/"body") heredan del default.
+Los volúmenes de P2 (incluidas las animaciones "-P2") se escriben igual, de cara a la
+red: far=True invierte y para que queden del lado de la red del jugador de arriba, y
+después mirror (mirando a la izquierda) cambia x por y, como el sprite.
+
+Cada registro son 14 floats: raqueta (centro 3, semiejes 3, radio de la esfera
+envolvente) + cuerpo (ídem). El test barato es esfera envolvente vs esfera del
+segmento del tick; recién si pasa se hace el barrido exacto contra la caja.
+"""
+
+import json
+import math
+import os
+from array import array
+from typing import Dict, Optional, Sequence, Tuple
+
+from engine.physics.swept import aabb_toi
+
+RACKET, BODY = 0, 7
+_RECORD = 14
+
+# Si el JSON no está, mismos valores que assets/sprites/player_animation/player_hitboxes.json
+_BUILTIN_DEFAULT = {
+    "racket": {"center": [14.0, -14.0, 24.0], "half": [18.0, 18.0, 24.0]},
+    "body": {"center": [0.0, 0.0, 28.0], "half": [8.0, 8.0, 28.0]},
+}
+
+_CACHE: Dict[str, "HitboxTable"] = {}
+
+
+def local_point(x: float, y: float, z: float, mirror: bool = False, far: bool = False) -> Tuple[float, float, float]:
+    """Inversa de la ubicación de las cajas (far y después mirror): del mundo al espacio del JSON."""
+    if mirror:
+        x, y = y, x
+    return (x, -y, z) if far else (x, y, z)
+
+
+def _volume(src: Optional[dict], fallback: Sequence[float]) -> Tuple[float, ...]:
+    if not src:
+        return tuple(fallback)
+    cx, cy, cz = (float(v) for v in src["center"])
+    hx, hy, hz = (abs(float(v)) for v in src["half"])
+    return (cx, cy, cz, hx, hy, hz, math.sqrt(hx * hx + hy * hy + hz * hz))
+
+
+class HitboxTable:
+    def __init__(self):
+        self.data = array("f")
+        self.index: Dict[str, Tuple[int, int]] = {}   # anim -> (offset, frames)
+        self.default = 0
+
+    # ---------------------------
+    # Carga / compilación
+    # ---------------------------
+    @classmethod
+    def load(cls, path: str, animations=None) -> "HitboxTable":
+        """
+        Compila el JSON una vez por ruta (los dos jugadores comparten la tabla).
+        animations: dict anim -> frames del sprite; se avisa si el JSON no coincide.
+        """
+        cached = _CACHE.get(path)
+        if cached is not None:
+            return cached
+
+        data = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            print(f"[Hitboxes] {path} no existe, usando volúmenes por defecto.")
+        except Exception as e:
+            print(f"[Hitboxes] Error leyendo {path}: {e}. Usando volúmenes por defecto.")
+
+        table = cls()
+        d = data.get("default") or _BUILTIN_DEFAULT
+        d_racket = _volume(d.get("racket") or _BUILTIN_DEFAULT["racket"], ())
+        d_body = _volume(d.get("body") or _BUILTIN_DEFAULT["body"], ())
+        table.default = table._append(d_racket, d_body)
+
+        for anim, frames in (data.get("animations") or {}).items():
+            if animations is not None and anim not in animations:
+                print(f"[Hitboxes] Animación '{anim}' no existe en el sprite, se ignora.")
+                continue
+            if animations is not None and len(frames) != len(animations[anim]):
+                print(f"[Hitboxes] '{anim}': {len(frames)} volúmenes para {len(animations[anim])} frames.")
+            offset = len(table.data)
+            for fr in frames:
+                fr = fr or {}
+                table._append(_volume(fr.get("racket"), d_racket), _volume(fr.get("body"), d_body))
+            table.index[anim] = (offset, len(frames))
+
+        _CACHE[path] = table
+        return table
+
+    def _append(self, racket: Sequence[float], body: Sequence[float]) -> int:
+        offset = len(self.data)
+        self.data.extend(racket)
+        self.data.extend(body)
+        return offset
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def record(self, anim: str, frame: int) -> int:
+        entry = self.index.get(anim)
+        if entry is None or entry[1] == 0:
+            return self.default
+        offset, count = entry
+        return offset + (frame % count) * _RECORD
+
+    def sweep(self, off: int, kind: int, p0: Sequence[float], p1: Sequence[float],
+              r: float) -> Optional[float]:
+        """
+        Esfera de radio r de p0 a p1 (coordenadas locales al jugador) contra el volumen.
+        Devuelve t∈[0,1] del primer contacto o None.
+        """
+        d = self.data
+        b = off + kind
+        cx, cy, cz, hx, hy, hz, rad = d[b], d[b + 1], d[b + 2], d[b + 3], d[b + 4], d[b + 5], d[b + 6]
+
+        # Prefiltro: esfera envolvente de la caja vs esfera que envuelve el segmento
+        mx, my, mz = (p0[0] + p1[0]) * 0.5 - cx, (p0[1] + p1[1]) * 0.5 - cy, (p0[2] + p1[2]) * 0.5 - cz
+        sx, sy, sz = p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2]
+        reach = rad + r + 0.5 * math.sqrt(sx * sx + sy * sy + sz * sz)
+        if mx * mx + my * my + mz * mz > reach * reach:
+            return None
+
+        return aabb_toi(p0, p1, r, (cx - hx, cy - hy, cz - hz), (cx + hx, cy + hy, cz + hz))
+
+    def footprint(self, off: int, kind: int, mirror: bool = False,
+                  far: bool = False) -> Tuple[float, float, float, float]:
+        """(x0, y0, x1, y1) de la caja en el plano del piso, local a los pies del jugador."""
+        d = self.data
+        b = off + kind
+        x0, x1 = d[b] - d[b + 3], d[b] + d[b + 3]
+        y0, y1 = d[b + 1] - d[b + 4], d[b + 1] + d[b + 4]
+        if far:
+            y0, y1 = -y1, -y0
+        if mirror:
+            x0, x1, y0, y1 = y0, y1, x0, x1
+        return x0, y0, x1, y1
+
+    def screen_rect(self, off: int, kind: int, rect, cx: float, cy: float,
+                    mirror: bool = False, far: bool = False) -> None:
+        """
+        Actualiza rect (en el lugar) con la proyección isométrica de la caja, con los pies
+        del jugador en (cx, cy) de pantalla. Solo para dibujar los hitboxes de debug.
+        """
+        d = self.data
+        b = off + kind
+        x0, x1 = d[b] - d[b + 3], d[b] + d[b + 3]
+        y0, y1 = d[b + 1] - d[b + 4], d[b + 1] + d[b + 4]
+        z0, z1 = d[b + 2] - d[b + 5], d[b + 2] + d[b + 5]
+        if far:
+            y0, y1 = -y1, -y0
+        if mirror:
+            x0, x1, y0, y1 = y0, y1, x0, x1
+        left, right = x0 - y1, x1 - y0
+        top, bottom = (x0 + y0) * 0.5 - z1, (x1 + y1) * 0.5 - z0
+        rect.update(int(cx + left), int(cy + top), max(1, int(right - left)), max(1, int(bottom - top)))
+
+
+def hitbox_path(json_path: str) -> str:
+    """player.json -> player_hitboxes.json en la misma carpeta."""
+    base, _ = os.path.splitext(json_path)
+    return base + "_hitboxes.json"
@@ -0,0 +1,204 @@
+"""
+Integrador del vuelo de la pelota con dt real.
+Diseño:
+- FlightParams(method, gravity, drag, ...)          -> parámetros del vuelo (por tick de referencia)
+- flight_params(gravity)                            -> FlightParams desde engine.config.physics
+- step(x, y, z, vx, vy, vz, spin, k, p)             -> estado tras k = ref_ticks(dt_ms) ticks
+- step_many(...)                                    -> ídem sobre arrays de NumPy (BallBatch)
+- ballistic(p, spin)                                -> True si solo actúa la gravedad
+- drop(z0, vz, g, k, n, method)                     -> z tras n ticks balísticos (forma cerrada)
+- landing(x, y, z, vx, vy, vz, spin, k, p)          -> primer pique simulado (sub-tick)
+
+Unidades de Ball: velocidades por tick de referencia, aceleraciones por tick².
+Con v_h = (vx, vy):
+    gravedad   a_z  = g
+    arrastre   a   -= drag·|v|·v                    (cuadrático)
+    Magnus     a_z -= magnus·spin·|v_h|             (topspin cae antes, slice flota)
+               v_h gira drift·spin rad por tick     (deriva lateral, no cambia |v_h|)
+    spin      *= decay^k
+
+Métodos (VJ2D_INTEGRATOR):
+- "rk2" (Heun): con solo gravedad es exacto, así que el arco es el mismo a 15 Hz que
+  a 120 Hz. Si el arrastre o el giro por paso crecen (dt enormes) el tick se subdivide.
+- "semi_implicit": v += a·k y después p += v·k. El arrastre va implícito
+  (v / (1 + drag·|v|·k)) y la deriva es una rotación exacta: estable con cualquier k.
+
+Solo con gravedad, tras n ticks:  z_n = z0 + k*(n*v0 + g*k*(n² + s·n)/2)
+con s = 0 (rk2) o 1 (semi_implicit). Trajectory y la puntería usan esa forma cerrada
+y recién simulan paso a paso cuando hay arrastre o spin. Por eso el arrastre viene
+apagado (AIR_DRAG = 0, se prende con VJ2D_AIR_DRAG): con él cada golpe simula el vuelo.
+"""
+
+import math
+import os
+from typing import NamedTuple, Optional, Tuple
+
+from engine.physics.swept import ground_contact, curve_at
+
+try:
+    import numpy as np
+except ImportError:  # solo step_many lo necesita
+    np = None
+
+try:
+    from engine.config.physics import (
+        INTEGRATOR, AIR_DRAG, MAGNUS_REF_SPEED,
+        SPIN_GRAVITY_SCALE, SPIN_DRIFT_SCALE, SPIN_DECAY,
+    )
+except Exception:
+    INTEGRATOR, AIR_DRAG, MAGNUS_REF_SPEED = "rk2", 0.0, 10.0
+    SPIN_GRAVITY_SCALE, SPIN_DRIFT_SCALE, SPIN_DECAY = 0.12, 0.06, 0.96
+
+METHODS = ("rk2", "semi_implicit")
+# Corrimiento de la forma cerrada balística por método (ver docstring)
+DROP_SHIFT = {"rk2": 0.0, "semi_implicit": 1.0}
+# RK2: por subpaso, pérdida por arrastre y giro máximos antes de subdividir
+_RK2_MAX_DRAG = 0.5
+_RK2_MAX_TURN = 0.25
+
+
+class FlightParams(NamedTuple):
+    method: str
+    gravity: float
+    drag: float      # coeficiente cuadrático (1 / unidad de mundo)
+    magnus: float    # a_z por unidad de spin y de |v_h|
+    drift: float     # rad por tick por unidad de spin
+    decay: float     # spin que queda tras un tick de referencia
+
+
+def flight_params(gravity: float, method: Optional[str] = None) -> FlightParams:
+    """Parámetros de la config (VJ2D_INTEGRATOR pisa el método, VJ2D_AIR_DRAG el arrastre)."""
+    method = (method or os.environ.get("VJ2D_INTEGRATOR") or INTEGRATOR).strip().lower()
+    if method not in METHODS:
+        print(f"[Physics] Integrador '{method}' desconocido, usando rk2.")
+        method = "rk2"
+    ref = float(MAGNUS_REF_SPEED) or 1.0
+    drag = float(os.environ.get("VJ2D_AIR_DRAG", AIR_DRAG))
+    return FlightParams(method, float(gravity), drag,
+                        float(SPIN_GRAVITY_SCALE) / ref, float(SPIN_DRIFT_SCALE) / ref, float(SPIN_DECAY))
+
+
+def ballistic(p: FlightParams, spin: float = 0.0) -> bool:
+    """True si el vuelo es una parábola pura (vale drop / la forma cerrada)."""
+    return p.drag == 0.0 and (spin == 0.0 or (p.magnus == 0.0 and p.drift == 0.0))
+
+
+def drop(z0: float, vz: float, g: float, k: float, n: float, method: str) -> float:
+    """Altura tras n ticks de solo gravedad, exactamente como la deja step()."""
+    return z0 + k * (n * vz + g * k * (n * n + DROP_SHIFT[method] * n) * 0.5)
+
+
+# ---------------------------
+# Paso escalar (Ball)
+# ---------------------------
+def _accel(vx: float, vy: float, vz: float, spin: float, p: FlightParams) -> Tuple[float, float, float]:
+    sh = math.sqrt(vx * vx + vy * vy)
+    sp = math.sqrt(sh * sh + vz * vz)
+    w = p.drift * spin
+    c = p.drag * sp
+    return (-w * vy - c * vx,
+            w * vx - c * vy,
+            p.gravity - p.magnus * spin * sh - c * vz)
+
+
+def _heun(x, y, z, vx, vy, vz, spin, h, p):
+    ax, ay, az = _accel(vx, vy, vz, spin, p)
+    px, py, pz = vx + ax * h, vy + ay * h, vz + az * h
+    spin1 = spin * p.decay ** h if spin else spin
+    bx, by, bz = _accel(px, py, pz, spin1, p)
+    half = h * 0.5
+    return (x + (vx + px) * half, y + (vy + py) * half, z + (vz + pz) * half,
+            vx + (ax + bx) * half, vy + (ay + by) * half, vz + (az + bz) * half, spin1)
+
+
+def _semi_implicit(x, y, z, vx, vy, vz, spin, k, p):
+    if spin:
+        turn = p.drift * spin * k
+        if turn:
+            c, s = math.cos(turn), math.sin(turn)
+            vx, vy = vx * c - vy * s, vx * s + vy * c
+        vz += (p.gravity - p.magnus * spin * math.sqrt(vx * vx + vy * vy)) * k
+        spin *= p.decay ** k
+    else:
+        vz += p.gravity * k
+    if p.drag:
+        f = 1.0 / (1.0 + p.drag * math.sqrt(vx * vx + vy * vy + vz * vz) * k)
+        vx, vy, vz = vx * f, vy * f, vz * f
+    return x + vx * k, y + vy * k, z + vz * k, vx, vy, vz, spin
+
+
+def step(x: float, y: float, z: float, vx: float, vy: float, vz: float, spin: float,
+         k: float, p: FlightParams) -> Tuple[float, float, float, float, float, float, float]:
+    """Avanza k ticks de referencia. Devuelve (x, y, z, vx, vy, vz, spin)."""
+    if p.method == "semi_implicit":
+        return _semi_implicit(x, y, z, vx, vy, vz, spin, k, p)
+    n = 1
+    if p.drag or spin:
+        load = max(p.drag * math.sqrt(vx * vx + vy * vy + vz * vz) / _RK2_MAX_DRAG,
+                   abs(p.drift * spin) / _RK2_MAX_TURN) * k
+        if load > 1.0:
+            n = int(math.ceil(load))
+    h = k / n
+    for _ in range(n):
+        x, y, z, vx, vy, vz, spin = _heun(x, y, z, vx, vy, vz, spin, h, p)
+    return x, y, z, vx, vy, vz, spin
+
+
+def landing(x: float, y: float, z: float, vx: float, vy: float, vz: float, spin: float,
+            k: float, p: FlightParams, max_ticks: int = 4000) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Vuela paso a paso (sin red) hasta tocar el piso.
+    Devuelve (ticks con fracción, x, y, vz en el contacto) o None si no llega en max_ticks.
+    """
+    for n in range(1, max_ticks + 1):
+        x1, y1, z1, vx1, vy1, vz1, spin = step(x, y, z, vx, vy, vz, spin, k, p)
+        t = ground_contact(z, vz, z1, vz1, k)
+        if t is not None:
+            return (n - 1 + t, curve_at(x, vx, x1, vx1, k, t), curve_at(y, vy, y1, vy1, k, t),
+                    vz + (vz1 - vz) * t)
+        x, y, z, vx, vy, vz = x1, y1, z1, vx1, vy1, vz1
+    return None
+
+
+# ---------------------------
+# Paso vectorizado (BallBatch)
+# ---------------------------
+def _accel_many(vx, vy, vz, spin, p: FlightParams):
+    sh = np.sqrt(vx * vx + vy * vy)
+    c = p.drag * np.sqrt(sh * sh + vz * vz)
+    w = p.drift * spin
+    return (-w * vy - c * vx,
+            w * vx - c * vy,
+            p.gravity - p.magnus * spin * sh - c * vz)
+
+
+def step_many(x, y, z, vx, vy, vz, spin, k: float, p: FlightParams):
+    """step() sobre arrays (mismas operaciones, mismo resultado por pelota)."""
+    if p.method == "semi_implicit":
+        turn = p.drift * spin * k
+        c, s = np.cos(turn), np.sin(turn)
+        vx, vy = vx * c - vy * s, vx * s + vy * c
+        vz = vz + (p.gravity - p.magnus * spin * np.sqrt(vx * vx + vy * vy)) * k
+        spin = spin * p.decay ** k
+        if p.drag:
+            f = 1.0 / (1.0 + p.drag * np.sqrt(vx * vx + vy * vy + vz * vz) * k)
+            vx, vy, vz = vx * f, vy * f, vz * f
+        return x + vx * k, y + vy * k, z + vz * k, vx, vy, vz, spin
+
+    # RK2: la subdivisión es la del peor caso del lote (con dt normales es 1)
+    n = 1
+    if len(vx) and (p.drag or spin.any()):
+        load = float(np.max(np.maximum(p.drag * np.sqrt(vx * vx + vy * vy + vz * vz) / _RK2_MAX_DRAG,
+                                       np.abs(p.drift * spin) / _RK2_MAX_TURN))) * k
+        if load > 1.0:
+            n = int(math.ceil(load))
+    h = k / n
+    half = h * 0.5
+    for _ in range(n):
+        ax, ay, az = _accel_many(vx, vy, vz, spin, p)
+        px, py, pz = vx + ax * h, vy + ay * h, vz + az * h
+        spin = spin * p.decay ** h
+        bx, by, bz = _accel_many(px, py, pz, spin, p)
+        x, y, z = x + (vx + px) * half, y + (vy + py) * half, z + (vz + pz) * half
+        vx, vy, vz = vx + (ax + bx) * half, vy + (ay + by) * half, vz + (az + bz) * half
+    return x, y, z, vx, vy, vz, spin
@@ -0,0 +1,203 @@
+"""
+Máscaras pixel-perfect de la raqueta para los frames de golpe (modo preciso, opcional).
+Diseño:
+- RacketMasks.load(sheet_path, sheet, animations) -> máscaras de stroke-* / Saque-* (cache en disco)
+- RacketMasks.get(anim, frame)                   -> pygame.mask.Mask del frame o None
+- RacketMasks.hit(anim, frame, topleft, p0, p1, r) -> t∈[0,1] del primer contacto en pantalla o None
+
+La raqueta se separa del resto del sprite por color (RACKET_MASK_COLOR ± tolerancia),
+se engorda RACKET_MASK_GROW px (el marco dibujado tiene huecos) y se rellena el
+encordado (lo que no se alcanza desde el borde del frame), así la pelota que pasa
+por el centro de la cabeza también cuenta.
+
+El test de cajas (hitboxes / racket_rect) sigue siendo la fase amplia: la máscara
+solo se consulta en los casi-golpes, y el costo por frame no cambia.
+
+Cache: .cache/masks/<sha1 de la hoja + parámetros>.json con los píxeles de cada
+máscara; si la hoja cambia, el hash cambia y se reconstruye.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import zlib
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+try:
+    from engine.config.collisions import RACKET_MASK_COLOR, RACKET_MASK_TOL, RACKET_MASK_GROW, MASK_ANIM_PREFIXES
+except Exception:
+    RACKET_MASK_COLOR, RACKET_MASK_TOL, RACKET_MASK_GROW = (143, 86, 59), 24, 2
+    MASK_ANIM_PREFIXES = ("stroke-", "Saque-")
+
+CACHE_DIR = os.path.join(".cache", "masks")
+_VERSION = 1
+_CACHE: Dict[str, "RacketMasks"] = {}
+_ball_masks: Dict[int, pygame.mask.Mask] = {}
+
+
+def _ball_mask(r: int) -> pygame.mask.Mask:
+    """Máscara circular de la pelota (cacheada por radio)."""
+    m = _ball_masks.get(r)
+    if m is None:
+        surf = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (255, 255, 255, 255), (r, r), r)
+        m = _ball_masks[r] = pygame.mask.from_surface(surf)
+    return m
+
+
+def _dilate(mask: pygame.mask.Mask, px: int) -> pygame.mask.Mask:
+    """Engorda la máscara px píxeles (cierra los huecos del marco dibujado a mano)."""
+    kernel = pygame.mask.Mask((2 * px + 1, 2 * px + 1), fill=True)
+    out = pygame.mask.Mask(mask.get_size())
+    mask.convolve(kernel, out, (-px, -px))
+    return out
+
+
+def _fill_holes(mask: pygame.mask.Mask) -> pygame.mask.Mask:
+    """Rellena las zonas cerradas por la máscara (el encordado dentro del marco)."""
+    w, h = mask.get_size()
+    outside = mask.copy()
+    outside.invert()
+    reach = pygame.mask.Mask((w, h))
+    # Semillas en todo el borde: componentes de "vacío" que tocan el borde del frame
+    for x, y in [(x, 0) for x in range(w)] + [(x, h - 1) for x in range(w)] + \
+                [(0, y) for y in range(h)] + [(w - 1, y) for y in range(h)]:
+        if outside.get_at((x, y)) and not reach.get_at((x, y)):
+            reach.draw(outside.connected_component((x, y)), (0, 0))
+    reach.invert()
+    return reach
+
+
+def _sheet_key(sheet_path: str, frames: Dict[str, List[Tuple[int, int, int, int]]]) -> str:
+    h = hashlib.sha1()
+    with open(sheet_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    h.update(json.dumps([_VERSION, list(RACKET_MASK_COLOR), RACKET_MASK_TOL, RACKET_MASK_GROW, frames],
+                        sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _encode(mask: pygame.mask.Mask) -> dict:
+    w, h = mask.get_size()
+    pts = array("H")
+    for x, y in _set_bits(mask):
+        pts.append(x)
+        pts.append(y)
+    return {"size": [w, h], "bits": base64.b64encode(zlib.compress(pts.tobytes())).decode("ascii")}
+
+
+def _set_bits(mask: pygame.mask.Mask):
+    get = mask.get_at
+    for rect in mask.get_bounding_rects():
+        for y in range(rect.top, rect.bottom):
+            for x in range(rect.left, rect.right):
+                if get((x, y)):
+                    yield x, y
+
+
+def _decode(entry: dict) -> pygame.mask.Mask:
+    w, h = entry["size"]
+    pts = array("H")
+    pts.frombytes(zlib.decompress(base64.b64decode(entry["bits"])))
+    mask = pygame.mask.Mask((int(w), int(h)))
+    set_at = mask.set_at
+    for i in range(0, len(pts), 2):
+        set_at((pts[i], pts[i + 1]))
+    return mask
+
+
+class RacketMasks:
+    def __init__(self, masks: Dict[str, List[pygame.mask.Mask]]):
+        self.masks = masks
+
+    # ---------------------------
+    # Carga / cache
+    # ---------------------------
+    @classmethod
+    def load(cls, sheet_path: str, sheet: Optional[pygame.Surface],
+             animations: Dict[str, List[Tuple[int, int, int, int]]],
+             prefixes: Sequence[str] = MASK_ANIM_PREFIXES) -> "RacketMasks":
+        """
+        Máscaras de las animaciones con esos prefijos. Se leen del cache en disco si el
+        hash de la hoja coincide; si no, se construyen desde `sheet` y se guardan.
+        """
+        frames = {a: [list(fr) for fr in f] for a, f in animations.items()
+                  if any(a.startswith(p) for p in prefixes)}
+        key = _sheet_key(sheet_path, frames)
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        path = os.path.join(CACHE_DIR, key + ".json")
+        masks = None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            masks = {a: [_decode(e) for e in lst] for a, lst in data["masks"].items()}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[Masks] Cache inválido ({path}): {e}. Se reconstruye.")
+
+        if masks is None:
+            if sheet is None:
+                masks = {}
+            else:
+                masks = {a: [cls._build(sheet, fr) for fr in lst] for a, lst in frames.items()}
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump({"sheet": os.path.basename(sheet_path),
+                                   "masks": {a: [_encode(m) for m in lst] for a, lst in masks.items()}}, f)
+                    print(f"[Masks] {sum(len(v) for v in masks.values())} máscaras guardadas en {path}")
+                except OSError as e:
+                    print(f"[Masks] No se pudo escribir el cache: {e}")
+
+        table = _CACHE[key] = cls(masks)
+        return table
+
+    @staticmethod
+    def _build(sheet: pygame.Surface, frame: Sequence[int]) -> pygame.mask.Mask:
+        fx, fy, fw, fh = frame
+        surf = sheet.subsurface(pygame.Rect(fx, fy, fw, fh))
+        tol = RACKET_MASK_TOL
+        mask = pygame.mask.from_threshold(surf, tuple(RACKET_MASK_COLOR) + (255,), (tol, tol, tol, 255))
+        return _fill_holes(_dilate(mask, RACKET_MASK_GROW))
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def get(self, anim: str, frame: int) -> Optional[pygame.mask.Mask]:
+        lst = self.masks.get(anim)
+        if not lst:
+            return None
+        return lst[frame % len(lst)]
+
+    def hit(self, anim: str, frame: int, topleft: Sequence[float],
+            p0: Sequence[float], p1: Sequence[float], r: float,
+            t0: float = 0.0) -> Optional[float]:
+        """
+        Fase fina: la pelota (círculo de radio r) va de p0 a p1 en pantalla, desde t0.
+        Muestrea el tramo cada ~r/2 px contra la máscara del frame (el sprite se dibuja
+        con la esquina en `topleft`). Devuelve el primer t con solapamiento, o None.
+        Sin máscara para el frame devuelve t0 (vale la fase amplia).
+        """
+        mask = self.get(anim, frame)
+        if mask is None:
+            return t0
+        ri = max(1, int(r))
+        ball = _ball_mask(ri)
+        ox, oy = topleft[0] + ri, topleft[1] + ri
+        dx, dy = p1[0] - p0[0], p1[1] - p0[1]
+        span = (1.0 - t0) * max(abs(dx), abs(dy))
+        steps = max(1, int(span / max(1.0, ri * 0.5)) + 1)
+        for i in range(steps + 1):
+            t = t0 + (1.0 - t0) * i / steps
+            if mask.overlap(ball, (int(p0[0] + dx * t - ox), int(p0[1] + dy * t - oy))):
+                return t
+        return None
@@ -0,0 +1,176 @@
+"""
+Red deformable: grilla chica de nodos masa-resorte integrada con Verlet en NumPy.
+Diseño:
+- NetCloth(x0, x1, height, cols, rows) -> nodos entre los postes (columnas en x, filas en z)
+- NetCloth.step(dt_ms)                 -> avanza la red (fase de simulación, nunca en draw)
+- NetCloth.impact(x, z, vy)            -> impulso de la pelota; devuelve la rigidez local (0..1]
+- NetCloth.impact_many(x, z, vy)       -> lo mismo con arrays (varias pelotas, BallBatch)
+- NetCloth.awake                       -> False en reposo: step() vuelve sin calcular nada
+- NetCloth.snapshot()                  -> copia del desplazamiento para el render (None en reposo)
+
+Cada nodo guarda solo su desplazamiento fuera del plano de la red (d, en y de mundo):
+con la red tensada es lo único que se ve. La fuerza es la de resortes a los 4 vecinos,
+k·Σ(d_vecino - d); los postes (columnas extremas) quedan fijos y la cinta (fila de
+arriba) tiene resortes horizontales NET_TAPE_STIFFNESS veces más duros.
+Verlet por subpaso h:  d' = d + (d - d_prev)·(1 - amortiguación) + a·h².
+
+Costo acotado para correr en pleno rally:
+- nodos <= NET_MAX_NODES (se recortan columnas y filas al crear la red);
+- subpasos por tick <= NET_MAX_SUBSTEPS: si el dt pidiera más para ser estable,
+  se usa una rigidez menor en ese tick (la red se ablanda en vez de explotar);
+- con el movimiento bajo NET_SLEEP_EPS la red se duerme y step() no cuesta nada.
+"""
+
+import math
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy la red queda fija (textura de Net)
+    np = None
+
+from engine.timing.fixed_step import ref_ticks
+
+try:
+    from engine.config.net import (
+        NET_COLS, NET_ROWS, NET_MAX_NODES, NET_MAX_SUBSTEPS,
+        NET_STIFFNESS, NET_TAPE_STIFFNESS, NET_DAMPING, NET_MAX_DEFLECTION,
+        NET_IMPULSE_GAIN, NET_SLACK, NET_SLEEP_EPS,
+    )
+except Exception:
+    NET_COLS, NET_ROWS, NET_MAX_NODES, NET_MAX_SUBSTEPS = 24, 6, 256, 4
+    NET_STIFFNESS, NET_TAPE_STIFFNESS, NET_DAMPING, NET_MAX_DEFLECTION = 0.6, 3.0, 0.15, 20.0
+    NET_IMPULSE_GAIN, NET_SLACK, NET_SLEEP_EPS = 1.5, 0.6, 0.05
+
+# Verlet explícito es estable con (suma de rigideces de un nodo)·h² < 2; margen de 2x
+_STABLE = 1.0
+
+
+class NetCloth:
+    def __init__(self, x0: float, x1: float, height: float,
+                 cols: int = NET_COLS, rows: int = NET_ROWS, max_nodes: int = NET_MAX_NODES):
+        if np is None:
+            raise RuntimeError("NetCloth necesita NumPy")
+        cols, rows = max(3, int(cols)), max(2, int(rows))
+        while cols * rows > max_nodes and cols > 3:
+            cols -= 1
+        while cols * rows > max_nodes and rows > 2:
+            rows -= 1
+        self.cols, self.rows = cols, rows
+        self.x0, self.x1 = float(x0), float(x1)
+        self.height = float(height)
+
+        self.d = np.zeros((rows, cols))
+        self.prev = np.zeros((rows, cols))
+        self._force = np.zeros((rows, cols))
+        self._tmp = np.zeros((rows, cols))
+        self._kick = np.zeros((rows, cols))   # velocidad de impactos pendiente del próximo step
+        # Rigidez horizontal por fila (la cinta es más dura), vertical uniforme
+        self._kh = np.full((rows, 1), 1.0)
+        self._kh[-1, 0] = NET_TAPE_STIFFNESS
+        # Suma de rigideces del nodo más cargado (cinta: 2 horizontales + 1 vertical)
+        self._load = 2.0 * NET_TAPE_STIFFNESS + 1.0
+
+        self.awake = False
+        self.steps = 0         # subpasos integrados desde el arranque (costo medido)
+
+    # ---------------------------
+    # Simulación
+    # ---------------------------
+    def step(self, dt_ms: Optional[float] = None) -> None:
+        if not self.awake:
+            return
+        k_tick = ref_ticks(dt_ms)
+        stiff = NET_STIFFNESS
+        n = max(1, int(math.ceil(math.sqrt(stiff * self._load / _STABLE) * k_tick)))
+        if n > NET_MAX_SUBSTEPS:
+            n = NET_MAX_SUBSTEPS
+            h = k_tick / n
+            stiff = min(stiff, _STABLE / (self._load * h * h))
+        h = k_tick / n
+        keep = (1.0 - NET_DAMPING) ** h
+        kh2 = stiff * h * h
+
+        d, prev, f, tmp = self.d, self.prev, self._force, self._tmp
+        # Impactos: empujar "prev" hacia atrás = darle velocidad al nodo en Verlet
+        self._kick *= h
+        prev -= self._kick
+        self._kick.fill(0.0)
+        for _ in range(n):
+            # Resortes horizontales (por fila) y verticales
+            f.fill(0.0)
+            np.subtract(d[:, :-1], d[:, 1:], out=tmp[:, 1:])
+            tmp[:, 1:] *= self._kh
+            f[:, 1:] += tmp[:, 1:]
+            f[:, :-1] -= tmp[:, 1:]
+            np.subtract(d[:-1, :], d[1:, :], out=tmp[1:, :])
+            f[1:, :] += tmp[1:, :]
+            f[:-1, :] -= tmp[1:, :]
+
+            # Verlet: prev pasa a ser el nuevo estado (sin alocar)
+            np.subtract(d, prev, out=tmp)
+            tmp *= keep
+            tmp += d
+            f *= kh2
+            tmp += f
+            np.clip(tmp, -NET_MAX_DEFLECTION, NET_MAX_DEFLECTION, out=tmp)
+            tmp[:, 0] = 0.0
+            tmp[:, -1] = 0.0
+            prev[...] = d
+            d[...] = tmp
+        self.steps += n
+
+        if float(np.abs(d).max()) < NET_SLEEP_EPS and float(np.abs(d - prev).max()) < NET_SLEEP_EPS:
+            d.fill(0.0)
+            prev.fill(0.0)
+            self.awake = False
+
+    def impact(self, x: float, z: float, vy: float) -> float:
+        """
+        La pelota toca la red en (x, z) con velocidad vy (por tick de referencia).
+        Reparte el impulso en los 4 nodos que la rodean y devuelve la rigidez local:
+        1 en los postes y la cinta, menos en el centro (absorbe más).
+        """
+        u = min(1.0, max(0.0, (x - self.x0) / (self.x1 - self.x0)))
+        v = min(1.0, max(0.0, z / self.height)) if self.height > 0 else 0.0
+
+        fc, fr = u * (self.cols - 1), v * (self.rows - 1)
+        c, r = min(int(fc), self.cols - 2), min(int(fr), self.rows - 2)
+        wc, wr = fc - c, fr - r
+        dv = vy * NET_IMPULSE_GAIN
+        kick = self._kick
+        kick[r, c] += dv * (1 - wc) * (1 - wr)
+        kick[r, c + 1] += dv * wc * (1 - wr)
+        kick[r + 1, c] += dv * (1 - wc) * wr
+        kick[r + 1, c + 1] += dv * wc * wr
+        kick[:, 0] = 0.0
+        kick[:, -1] = 0.0
+        self.awake = True
+
+        return 1.0 - NET_SLACK * math.sin(math.pi * u) * (1.0 - v)
+
+    def impact_many(self, x, z, vy):
+        """impact() para varias pelotas a la vez (arrays): mismos impulsos y rigidez por pelota."""
+        u = np.clip((x - self.x0) / (self.x1 - self.x0), 0.0, 1.0)
+        v = np.clip(z / self.height, 0.0, 1.0) if self.height > 0 else np.zeros_like(u)
+
+        fc, fr = u * (self.cols - 1), v * (self.rows - 1)
+        c = np.minimum(fc.astype(np.intp), self.cols - 2)
+        r = np.minimum(fr.astype(np.intp), self.rows - 2)
+        wc, wr = fc - c, fr - r
+        dv = vy * NET_IMPULSE_GAIN
+        kick = self._kick
+        np.add.at(kick, (r, c), dv * (1 - wc) * (1 - wr))
+        np.add.at(kick, (r, c + 1), dv * wc * (1 - wr))
+        np.add.at(kick, (r + 1, c), dv * (1 - wc) * wr)
+        np.add.at(kick, (r + 1, c + 1), dv * wc * wr)
+        kick[:, 0] = 0.0
+        kick[:, -1] = 0.0
+        if len(u):
+            self.awake = True
+
+        return 1.0 - NET_SLACK * np.sin(np.pi * u) * (1.0 - v)
+
+    def snapshot(self):
+        """Copia del desplazamiento (filas × columnas) o None si la red está quieta."""
+        return self.d.copy() if self.awake else None
@@ -0,0 +1,315 @@
+"""
+Puntería de golpes por balística inversa.
+Diseño:
+- flight_ticks(origen, objetivo, red, k)  -> ticks de vuelo mínimos que pasan la red con margen
+- shot_velocity(origen, objetivo, n, k)   -> (vx, vy, vz) para picar EXACTAMENTE en el tick n
+- refine_shot(origen, objetivo, n, k, v)  -> v corregida por arrastre / spin (simulando el vuelo)
+- SpinFlight(spin, k)                     -> coeficientes por tick del vuelo con ese spin (sin arrastre)
+- ShotTable(zones, net, dt_ms)            -> tabla precalculada: grilla de orígenes × zona × spin
+- ShotTable.aim(x, y, z, tx, ty, zone)    -> velocidades para el golpe (lookup + fórmula)
+- shot_table_for(field, dt_ms)            -> tabla cacheada en el Field
+
+Con solo gravedad, el integrador de Ball.update deja tras n ticks:
+    x_n = x0 + n*vx*k        z_n = integrator.drop(z0, vz, GRAVEDAD, k, n)
+Fijado n, vx/vy/vz salen en forma cerrada. Lo caro es elegir n (pasar la red con
+margen sin superar la velocidad máxima): eso se resuelve al construir la tabla en
+los nodos de la grilla y en cada golpe se interpola bilinealmente.
+
+Con spin y sin arrastre el vuelo sigue siendo lineal en la velocidad inicial: la
+deriva gira (y escala) v_h igual para cualquier v_h, y Magnus empuja z en proporción
+a |v_h|. Tras n ticks, con (a_n, b_n, m_n, g_n) que dependen solo de spin, k y n:
+    x_n = x0 + a_n·vx - b_n·vy      y_n = y0 + b_n·vx + a_n·vy
+    z_n = z0 + n·k·vz + g_n + m_n·|v_h|
+SpinFlight saca esos coeficientes simulando una vez dos pelotas unitarias, y la
+tabla tiene su grilla de ticks para cada efecto de SHOT_SPINS (plano, topspin,
+slice): el golpe con efecto cuesta lo mismo que el plano.
+
+Con arrastre, o con un spin que no está en la tabla, la forma cerrada es el punto de
+partida: aim() simula el vuelo (integrator.landing) y corrige las velocidades hasta
+picar en el objetivo en ~n ticks (SHOT_REFINE_ITERS pasadas). El margen sobre la red
+es el de la parábola.
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+from engine.ball import GRAVEDAD, FLIGHT
+from engine.physics.integrator import DROP_SHIFT, ballistic, drop, landing, step
+from engine.physics.swept import slab_toi
+from engine.timing.fixed_step import SIM_HZ, ref_ticks
+
+try:
+    from engine.config.physics import (
+        SHOT_NET_CLEARANCE, SHOT_MAX_SPEED, SHOT_MAX_FLIGHT_MS, SHOT_GRID_STEP, SHOT_REFINE_ITERS,
+    )
+except Exception:
+    SHOT_NET_CLEARANCE, SHOT_MAX_SPEED, SHOT_MAX_FLIGHT_MS, SHOT_GRID_STEP = 6.0, 13.5, 3000.0, 50.0
+    SHOT_REFINE_ITERS = 4
+try:
+    from engine.config.physics import SPIN_FLAT, SPIN_TOPSPIN, SPIN_SLICE
+except Exception:
+    SPIN_FLAT, SPIN_TOPSPIN, SPIN_SLICE = 0.0, +0.9, -0.7
+
+# Efectos de los golpes del jugador (Player.SHOT_SPIN): cada uno tiene su grilla en ShotTable
+SHOT_SPINS = (float(SPIN_FLAT), float(SPIN_TOPSPIN), float(SPIN_SLICE))
+
+# Apenas bajo el piso en el tick de llegada: z_n <= 0 aun con redondeo acumulado
+_LAND_Z = -1e-6
+# Orígenes cubiertos por la tabla (mundo de la pelota; fuera se usa el borde)
+GRID_X = (-100.0, 300.0)
+GRID_Y = (-250.0, 450.0)
+# Puntos de muestreo dentro de cada zona (mismo rango que el jitter de hit_by_player)
+_ZONE_SAMPLES = ((0.2, 0.2), (0.8, 0.2), (0.2, 0.8), (0.8, 0.8), (0.5, 0.5))
+
+
+def _z_after(z0: float, vz: float, k: float, n: float) -> float:
+    return drop(z0, vz, GRAVEDAD, k, n, FLIGHT.method)
+
+
+def shot_velocity(x0: float, y0: float, z0: float, tx: float, ty: float,
+                  n: int, k: float) -> Tuple[float, float, float]:
+    """Velocidades (por tick de referencia) que llevan la pelota a (tx, ty, 0) en n ticks."""
+    n = max(1, int(n))
+    vx = (tx - x0) / (n * k)
+    vy = (ty - y0) / (n * k)
+    vz = ((_LAND_Z - z0) / k - GRAVEDAD * k * (n * n + DROP_SHIFT[FLIGHT.method] * n) * 0.5) / n
+    return vx, vy, vz
+
+
+def refine_shot(x0: float, y0: float, z0: float, tx: float, ty: float, n: int, k: float,
+                v: Tuple[float, float, float], spin: float = 0.0,
+                iters: int = SHOT_REFINE_ITERS) -> Tuple[float, float, float]:
+    """
+    Corrige v (solución balística) para el vuelo con arrastre / spin: simula hasta el
+    pique y ajusta vz por el error de tiempo (dT/dvz ≈ T/|vz|) y vx/vy por el error de
+    posición repartido en los n ticks que va a durar el vuelo corregido.
+    """
+    vx, vy, vz = v
+    for _ in range(max(0, int(iters))):
+        hit = landing(x0, y0, z0, vx, vy, vz, spin, k, FLIGHT, max_ticks=4 * n + 16)
+        if hit is None:
+            break
+        t, lx, ly, vz_hit = hit
+        ex, ey, et = tx - lx, ty - ly, n - t
+        if abs(ex) < 0.25 and abs(ey) < 0.25 and abs(et) < 0.05:
+            break
+        vx += ex / (n * k)
+        vy += ey / (n * k)
+        if vz_hit < 0.0:
+            vz += et * -vz_hit / max(t, 1.0)
+    return vx, vy, vz
+
+
+class SpinFlight:
+    """
+    Vuelo con spin fijo y sin arrastre (ver docstring del módulo): coeficientes por tick,
+    calculados a demanda simulando con step() una pelota con v = (1, 0, 0) y otra quieta.
+    """
+
+    def __init__(self, spin: float, k: float):
+        self.spin, self.k = float(spin), k
+        # [j] = valor tras j ticks
+        self._a, self._b, self._m, self._g = [0.0], [0.0], [0.0], [0.0]
+        self._unit = (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, self.spin)
+        self._rest = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, self.spin)
+
+    def _ensure(self, n: int) -> None:
+        k, unit, rest = self.k, self._unit, self._rest
+        while len(self._a) <= n:
+            unit = step(*unit, k, FLIGHT)
+            rest = step(*rest, k, FLIGHT)
+            self._a.append(unit[0])
+            self._b.append(unit[1])
+            self._m.append(unit[2] - rest[2])
+            self._g.append(rest[2])
+        self._unit, self._rest = unit, rest
+
+    def velocity(self, x0: float, y0: float, z0: float, tx: float, ty: float,
+                 n: int) -> Tuple[float, float, float]:
+        """Velocidades que llevan la pelota a (tx, ty, 0) en n ticks con este spin."""
+        n = max(1, int(n))
+        self._ensure(n)
+        a, b = self._a[n], self._b[n]
+        dx, dy = tx - x0, ty - y0
+        det = a * a + b * b
+        vx = (a * dx + b * dy) / det
+        vy = (a * dy - b * dx) / det
+        vz = (_LAND_Z - z0 - self._g[n] - self._m[n] * math.hypot(vx, vy)) / (n * self.k)
+        return vx, vy, vz
+
+    def at(self, x0: float, y0: float, z0: float, vx: float, vy: float, vz: float,
+           j: int) -> Tuple[float, float, float]:
+        """Posición tras j ticks."""
+        self._ensure(j)
+        a, b = self._a[j], self._b[j]
+        return (x0 + a * vx - b * vy, y0 + b * vx + a * vy,
+                z0 + j * self.k * vz + self._g[j] + self._m[j] * math.hypot(vx, vy))
+
+
+def flight_ticks(x0: float, y0: float, z0: float, tx: float, ty: float, k: float,
+                 net_y: Optional[float] = None, net_top: float = 0.0, radio: float = 7.0,
+                 max_speed: float = SHOT_MAX_SPEED, min_ticks: int = 1,
+                 flight: Optional[SpinFlight] = None) -> int:
+    """
+    Menor cantidad de ticks de vuelo tal que:
+    - la velocidad horizontal no supera max_speed
+    - si la red está entre origen y objetivo, z >= net_top en todos los ticks en que
+      la pelota cruza la franja |y - net_y| <= radio (mismo test barrido que Ball.update)
+    Si ni un globo de SHOT_MAX_FLIGHT_MS pasa la red (objetivo pegado a la franja),
+    se devuelve el tiro directo. flight: vuelo con spin (None = parábola); la cuenta
+    continua de abajo es solo el punto de partida, el test exacto usa su curva.
+    """
+    dist = math.hypot(tx - x0, ty - y0)
+    n = direct = max(1, int(min_ticks), int(math.ceil(dist / (max_speed * k))))
+    max_ticks = max(direct, int(ref_ticks(SHOT_MAX_FLIGHT_MS) / k))
+
+    f = None
+    if net_y is not None and ty != y0:
+        f = (net_y - y0) / (ty - y0)       # fracción del vuelo en la que se cruza la red
+        # Franja de la red en fracciones del vuelo; si el objetivo o el origen caen dentro
+        # no hay altura que la evite: se deja el tiro directo
+        f_lo, f_hi = sorted(((net_y - radio - y0) / (ty - y0), (net_y + radio - y0) / (ty - y0)))
+        if not (0.0 < f_lo and f_hi < 1.0):
+            f = None
+    if f is None:
+        return n
+
+    # Aproximación continua: z(f*N) = z0(1-f) + |g| k²/2 · f(1-f) · N²
+    need = net_top - z0 * (1.0 - f)
+    if need > 0.0:
+        n = max(n, int(math.ceil(math.sqrt(need / (-GRAVEDAD * k * k * 0.5 * f * (1.0 - f))))))
+
+    # Ajuste exacto: ningún segmento de tick que toque la franja entra en la red (swept)
+    if flight is not None:
+        return _spin_flight_ticks(flight, x0, y0, z0, tx, ty, n, max_ticks, direct,
+                                  f_lo, f_hi, net_y, radio, net_top)
+    dy = ty - y0
+    while n <= max_ticks:
+        _, _, vz = shot_velocity(x0, y0, z0, tx, ty, n, k)
+        lo, hi = max(1, int(math.floor(f_lo * n))), min(n, int(math.ceil(f_hi * n)))
+        if all(slab_toi((0.0, y0 + dy * (j - 1) / n, _z_after(z0, vz, k, j - 1)),
+                        (0.0, y0 + dy * j / n, _z_after(z0, vz, k, j)),
+                        net_y, radio, net_top) is None
+               for j in range(lo, hi + 1)):
+            return n
+        n += 1
+    return direct
+
+
+def _spin_flight_ticks(flight: SpinFlight, x0: float, y0: float, z0: float, tx: float, ty: float,
+                       n: int, max_ticks: int, direct: int, f_lo: float, f_hi: float,
+                       net_y: float, radio: float, net_top: float) -> int:
+    """flight_ticks con la curva de flight (la deriva corre el cruce: dos ticks de margen)."""
+    while n <= max_ticks:
+        v = flight.velocity(x0, y0, z0, tx, ty, n)
+        lo, hi = max(1, int(math.floor(f_lo * n)) - 2), min(n, int(math.ceil(f_hi * n)) + 2)
+        p0 = flight.at(x0, y0, z0, *v, lo - 1)
+        for j in range(lo, hi + 1):
+            p1 = flight.at(x0, y0, z0, *v, j)
+            if slab_toi((0.0, p0[1], p0[2]), (0.0, p1[1], p1[2]), net_y, radio, net_top) is not None:
+                break
+            p0 = p1
+        else:
+            return n
+        n += 1
+    return direct
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
+
+
+class ShotTable:
+    def __init__(self, zones: Dict[str, Tuple[float, float, float, float]], net=None,
+                 dt_ms: Optional[float] = None, clearance: float = SHOT_NET_CLEARANCE,
+                 step: float = SHOT_GRID_STEP, radio: float = 7.0):
+        self.zones = dict(zones)
+        self.k = ref_ticks(float(dt_ms) if dt_ms is not None else 1000.0 / SIM_HZ)
+        self.net_y = float(net.y) if net is not None else None
+        self.net_top = (float(net.height) if net is not None else 0.0) + float(clearance)
+        self.radio = radio
+        self.clearance = float(clearance)
+
+        self.step = float(step)
+        self.nx = int(round((GRID_X[1] - GRID_X[0]) / self.step)) + 1
+        self.ny = int(round((GRID_Y[1] - GRID_Y[0]) / self.step)) + 1
+
+        # Efectos con vuelo lineal (sin arrastre): su grilla y sus coeficientes; spin 0 = parábola
+        self._flights: Dict[float, Optional[SpinFlight]] = {}
+        if FLIGHT.drag == 0.0:
+            for spin in SHOT_SPINS:
+                self._flights[spin] = None if ballistic(FLIGHT, spin) else SpinFlight(spin, self.k)
+
+        # zona -> lista plana [iy * nx + ix] de ticks de vuelo (el peor caso de la zona), del
+        # tiro plano; (spin, zona) -> ídem para cada efecto de _flights
+        self._ticks: Dict[object, list] = {}
+        for name in self.zones:
+            self._ticks[name] = self._build_zone(name)
+            for spin, flight in self._flights.items():
+                if flight is not None:
+                    self._ticks[(spin, name)] = self._build_zone(name, flight)
+
+    def _build_zone(self, name: str, flight: Optional[SpinFlight] = None) -> list:
+        zx, zy, zw, zh = self.zones[name]
+        targets = [(zx + u * zw, zy + v * zh) for u, v in _ZONE_SAMPLES]
+        out = []
+        for iy in range(self.ny):
+            oy = GRID_Y[0] + iy * self.step
+            for ix in range(self.nx):
+                ox = GRID_X[0] + ix * self.step
+                # Origen a ras del piso: con z0 > 0 el margen sobre la red solo aumenta
+                out.append(max(flight_ticks(ox, oy, 0.0, tx, ty, self.k, self.net_y, self.net_top,
+                                            self.radio, flight=flight)
+                               for tx, ty in targets))
+        return out
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def ticks(self, x: float, y: float, zone, spin: float = 0.0) -> float:
+        """Ticks de vuelo para un golpe desde (x, y) hacia zone (interpolación bilineal)."""
+        grid = self._ticks[zone] if self._flights.get(spin) is None else self._ticks[(spin, zone)]
+        gx = min(max((x - GRID_X[0]) / self.step, 0.0), self.nx - 1.0)
+        gy = min(max((y - GRID_Y[0]) / self.step, 0.0), self.ny - 1.0)
+        ix, iy = min(int(gx), self.nx - 2), min(int(gy), self.ny - 2)
+        fx, fy = gx - ix, gy - iy
+        row0, row1 = iy * self.nx, (iy + 1) * self.nx
+        top = _lerp(grid[row0 + ix], grid[row0 + ix + 1], fx)
+        bot = _lerp(grid[row1 + ix], grid[row1 + ix + 1], fx)
+        return _lerp(top, bot, fy)
+
+    def aim(self, x: float, y: float, z: float, tx: float, ty: float,
+            zone: Optional[str] = None, clearance: Optional[float] = None,
+            spin: float = 0.0) -> Tuple[float, float, float]:
+        """
+        (vx, vy, vz) para que el primer pique caiga en (tx, ty).
+        Con una zona de la tabla y el margen por defecto cuesta un lookup (más la
+        verificación de los pocos ticks sobre la red); si no, resuelve los ticks
+        directamente (flight_ticks). Los efectos de SHOT_SPINS salen en forma cerrada
+        (SpinFlight); otro spin, o el arrastre, simula el vuelo (refine_shot).
+        """
+        net_top = self.net_top if clearance is None else self.net_top - self.clearance + float(clearance)
+        flight = self._flights.get(spin)
+        n0 = 1
+        if zone in self.zones and (clearance is None or clearance == self.clearance):
+            n0 = int(math.ceil(self.ticks(x, y, zone, spin) - 1e-9))
+        n = flight_ticks(x, y, z, tx, ty, self.k, self.net_y, net_top, self.radio, min_ticks=n0,
+                         flight=flight)
+        if flight is not None:
+            return flight.velocity(x, y, z, tx, ty, n)
+        v = shot_velocity(x, y, z, tx, ty, n, self.k)
+        if not ballistic(FLIGHT, spin):
+            v = refine_shot(x, y, z, tx, ty, n, self.k, v, spin)
+        return v
+
+
+def shot_table_for(field, dt_ms: Optional[float] = None) -> ShotTable:
+    """ShotTable del field para el paso de simulación dado (se construye una vez)."""
+    key = round(float(dt_ms), 6) if dt_ms is not None else None
+    tables = getattr(field, "_shot_tables", None)
+    if tables is None:
+        tables = field._shot_tables = {}
+    table = tables.get(key)
+    if table is None:
+        table = tables[key] = ShotTable(field.zones, getattr(field, "net", None), dt_ms)
+    return table
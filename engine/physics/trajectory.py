@@ -0,0 +1,266 @@
+"""
+Predicción de trayectoria de la pelota.
+Diseño:
+- Trajectory(x, y, z, vx, vy, vz, ...) -> calcula UNA vez los piques del tiro
+- Trajectory.bounces                    -> lista de Bounce (tick, t_ms, x, y, inside)
+- Trajectory.position_at(t_ms)          -> (x, y, z) en cualquier instante futuro
+- Trajectory.time_to_y(y) / height_at_y -> cruce de un plano y (p.ej. la red)
+- ticks_to_ground(z, vz, k)             -> primer tick con z <= 0 (cuadrática discreta)
+
+Reproduce exactamente la integración por tick de Ball.update (no la física continua),
+con el integrador de engine.physics.integrator y el pique barrido dentro del tick:
+- Solo gravedad (sin arrastre ni spin): forma cerrada. Tras n ticks de vuelo
+  z_n = integrator.drop(z0, v0, ...), así que cada arco se resuelve con una
+  cuadrática y las consultas cuestan O(#piques) (≤ 2).
+- Con arrastre o spin: se simula el tiro tick a tick una vez (mismos pasos que
+  Ball.update) y las consultas leen la posición guardada de cada tick.
+El punto y el instante del pique son los del contacto sobre la curva del tick
+(swept.ground_contact, como engine.rules.line_calls), no los del fin del tick.
+
+Ball cachea la predicción por tiro (Ball.predict) y la invalida al ser golpeada
+o al tocar la red.
+"""
+
+import math
+from bisect import bisect_right
+from typing import List, NamedTuple, Optional, Tuple
+
+from engine.ball import GRAVEDAD, COEF_REBOTE, VZ_REPOSO, FLIGHT, COURT
+from engine.physics.integrator import DROP_SHIFT, ballistic, drop, step
+from engine.physics.swept import ground_contact, curve_at, bounce, slab_toi
+from engine.timing.fixed_step import SIM_HZ, ref_ticks
+
+# Tope de la simulación paso a paso (una pelota que rueda sin salir nunca termina)
+_MAX_TRACK_MS = 20000.0
+
+
+class Bounce(NamedTuple):
+    tick: int          # ticks desde el inicio de la predicción
+    t_ms: float        # tiempo de simulación absoluto del pique
+    x: float
+    y: float
+    vz_out: float      # velocidad vertical tras el pique (0 = queda rodando)
+    inside: bool       # dentro de las líneas del rally (COURT.inside)
+
+
+def _z_after(z0: float, v0: float, g: float, k: float, n: int) -> float:
+    return drop(z0, v0, g, k, n, FLIGHT.method)
+
+
+def ticks_to_ground(z0: float, v0: float, k: float, g: float = GRAVEDAD) -> int:
+    """Menor n >= 1 tal que z_n <= 0 partiendo de (z0, v0) con el integrador discreto."""
+    a = g * k * k * 0.5
+    b = k * v0 + a * DROP_SHIFT[FLIGHT.method]
+    disc = b * b - 4.0 * a * z0
+    root = (-b - math.sqrt(max(0.0, disc))) / (2.0 * a)
+    n = max(1, int(math.ceil(root)))
+    # Ajuste fino contra la fórmula exacta (redondeo en los bordes)
+    while n > 1 and _z_after(z0, v0, g, k, n - 1) <= 0.0:
+        n -= 1
+    while _z_after(z0, v0, g, k, n) > 0.0:
+        n += 1
+    return n
+
+
+class Trajectory:
+    def __init__(self, x: float, y: float, z: float, vx: float, vy: float, vz: float,
+                 spin: float = 0.0, bounce_count: int = 0,
+                 dt_ms: Optional[float] = None, t0_ms: float = 0.0,
+                 net=None, radio: float = 7.0):
+        self.dt_ms = float(dt_ms) if dt_ms is not None else 1000.0 / SIM_HZ
+        self.k = ref_ticks(self.dt_ms)
+        self.t0_ms = float(t0_ms)
+        self.x0, self.y0 = float(x), float(y)
+        self.vx, self.vy = float(vx), float(vy)
+        self.spin = float(spin)
+
+        self.bounces: List[Bounce] = []
+        self.end: Optional[str] = None        # "dead" (2do pique) / "out" / "net"
+        self.end_tick: Optional[int] = None
+        # Arcos de vuelo: (tick inicial, z0, vz0)
+        self._arcs: List[Tuple[int, float, float]] = []
+        self._arc_ticks: List[int] = []
+        # Con arrastre / spin: posición al final de cada tick (None = forma cerrada)
+        self._track: Optional[Tuple[List[float], List[float], List[float]]] = None
+
+        if ballistic(FLIGHT, self.spin):
+            self._solve(float(z), float(vz), int(bounce_count), net, float(radio))
+        else:
+            self._simulate(float(z), float(vz), int(bounce_count), net, float(radio))
+
+    # ---------------------------
+    # Resolución
+    # ---------------------------
+    def _solve(self, z: float, vz: float, bounce_count: int, net, radio: float) -> None:
+        k, g = self.k, GRAVEDAD
+        tick = 0
+        while self.end is None:
+            self._arcs.append((tick, z, vz))
+            self._arc_ticks.append(tick)
+            n = ticks_to_ground(z, vz, k, g)
+            hit_tick = tick + n
+
+            # Último paso del arco: de z_{n-1} a z_n (<= 0); vz en el contacto, como Ball.update
+            z_prev = _z_after(z, vz, g, k, n - 1)
+            t_ground = ground_contact(z_prev, vz + (n - 1) * g * k, _z_after(z, vz, g, k, n), vz + n * g * k, k)
+            vz_hit = vz + (n - 1 + t_ground) * g * k
+
+            # Toque de red antes del pique (mismo test barrido que Ball.update)
+            if net is not None:
+                net_tick = self._net_tick(tick, z, vz, hit_tick, t_ground, net, radio)
+                if net_tick is not None:
+                    self.end, self.end_tick = "net", net_tick
+                    break
+
+            bx, by = self._xy(hit_tick - 1 + t_ground)
+            inside = COURT.inside(bx, by)
+            z_out, vz_out = bounce(vz_hit, t_ground, k, COEF_REBOTE)
+            if inside:
+                bounce_count += 1
+                if bounce_count < 2 and abs(vz_out) < VZ_REPOSO:
+                    z_out, vz_out = 0.0, 0.0
+            t_ms = self.t0_ms + (hit_tick - 1 + t_ground) * self.dt_ms
+            self.bounces.append(Bounce(hit_tick, t_ms, bx, by, vz_out, inside))
+
+            if not inside:
+                self.end, self.end_tick = "out", hit_tick
+            elif bounce_count >= 2:
+                self.end, self.end_tick = "dead", hit_tick
+            tick, z, vz = hit_tick, z_out, vz_out
+        if self.end != "net":
+            # Estado final congelado (Ball deja de moverse tras out / segundo pique)
+            self._arcs.append((tick, z, vz))
+            self._arc_ticks.append(tick)
+
+    def _simulate(self, z: float, vz: float, bounce_count: int, net, radio: float) -> None:
+        """Tick a tick con el integrador, igual que Ball.update (arrastre / spin)."""
+        k, p = self.k, FLIGHT
+        x, y, vx, vy, spin = self.x0, self.y0, self.vx, self.vy, self.spin
+        xs, ys, zs = [x], [y], [z]
+        self._track = (xs, ys, zs)
+        max_ticks = int(ref_ticks(_MAX_TRACK_MS) / k) + 1
+        for tick in range(1, max_ticks + 1):
+            vx0, vy0 = vx, vy
+            x1, y1, z1, vx, vy, vz1, spin = step(x, y, z, vx, vy, vz, spin, k, p)
+            t_ground = ground_contact(z, vz, z1, vz1, k)
+            if net is not None:
+                t_net = slab_toi((x, y, z), (x1, y1, z1), float(net.y), radio, float(net.height))
+                if t_net is not None and (t_ground is None or t_net < t_ground):
+                    xs.append(x1), ys.append(y1), zs.append(z1)
+                    self.end, self.end_tick = "net", tick
+                    return
+
+            if t_ground is not None:
+                bx, by = curve_at(x, vx0, x1, vx, k, t_ground), curve_at(y, vy0, y1, vy, k, t_ground)
+                inside = COURT.inside(bx, by)
+                z1, vz1 = bounce(vz + (vz1 - vz) * t_ground, t_ground, k, COEF_REBOTE)
+                if inside:
+                    bounce_count += 1
+                    if bounce_count < 2 and abs(vz1) < VZ_REPOSO:
+                        z1, vz1 = 0.0, 0.0
+                t_ms = self.t0_ms + (tick - 1 + t_ground) * self.dt_ms
+                self.bounces.append(Bounce(tick, t_ms, bx, by, vz1, inside))
+                if not inside:
+                    self.end = "out"
+                elif bounce_count >= 2:
+                    self.end = "dead"
+
+            # Rodando fuera de la cancha (mismo chequeo de fin de tick que Ball.update)
+            if self.end is None and z1 == 0.0 and not COURT.inside(x1, y1):
+                self.end = "out"
+
+            xs.append(x1), ys.append(y1), zs.append(z1)
+            if self.end is not None:
+                self.end_tick = tick
+                return
+            x, y, z, vz = x1, y1, z1, vz1
+
+    def _net_tick(self, start: int, z0: float, v0: float, ground_tick: int, t_ground: float,
+                  net, radio: float) -> Optional[int]:
+        """Primer tick del arco cuyo segmento entra en la red antes de tocar el piso."""
+        lo, hi = self._ticks_in_band(float(net.y) - radio, float(net.y) + radio)
+        # Un segmento (t-1 -> t) puede cruzar la franja aunque ningún extremo quede dentro
+        lo, hi = max(lo, start + 1), min(hi + 1, ground_tick)
+        for t in range(lo, hi + 1):
+            p0 = self._xy(t - 1) + (_z_after(z0, v0, GRAVEDAD, self.k, t - 1 - start),)
+            p1 = self._xy(t) + (_z_after(z0, v0, GRAVEDAD, self.k, t - start),)
+            tn = slab_toi(p0, p1, float(net.y), radio, float(net.height))
+            if tn is not None and (t < ground_tick or tn < t_ground):
+                return t
+        return None
+
+    def _ticks_in_band(self, y_lo: float, y_hi: float) -> Tuple[int, int]:
+        step = self.vy * self.k
+        if step == 0.0:
+            return (0, 1 << 30) if y_lo <= self.y0 <= y_hi else (1, 0)
+        a, b = (y_lo - self.y0) / step, (y_hi - self.y0) / step
+        if a > b:
+            a, b = b, a
+        return int(math.ceil(a)), int(math.floor(b))
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def _xy(self, tick: float) -> Tuple[float, float]:
+        return self.x0 + tick * self.vx * self.k, self.y0 + tick * self.vy * self.k
+
+    def tick_at(self, t_ms: float) -> int:
+        return max(0, int(math.floor((t_ms - self.t0_ms) / self.dt_ms + 1e-9)))
+
+    def position_at(self, t_ms: float) -> Tuple[float, float, float]:
+        """Posición al tick que contiene t_ms (absoluto); tras el final queda en el último punto."""
+        tick = self.tick_at(t_ms)
+        if self._track is not None:
+            xs, ys, zs = self._track
+            tick = min(tick, len(xs) - 1)
+            return xs[tick], ys[tick], max(0.0, zs[tick])
+        if self.end_tick is not None:
+            tick = min(tick, self.end_tick)
+        i = bisect_right(self._arc_ticks, tick) - 1
+        start, z0, v0 = self._arcs[i]
+        x, y = self._xy(tick)
+        z = max(0.0, _z_after(z0, v0, GRAVEDAD, self.k, tick - start)) if tick > start else z0
+        return x, y, z
+
+    def time_to_y(self, y_plane: float) -> Optional[float]:
+        """Tiempo absoluto del primer tick que alcanza/cruza y_plane (None si nunca o tras el final)."""
+        if self._track is not None:
+            ys = self._track[1]
+            side = ys[0] - y_plane
+            if side == 0.0:
+                return self.t0_ms
+            for tick in range(1, len(ys)):
+                if (ys[tick] - y_plane) * side <= 0.0:
+                    return self.t0_ms + tick * self.dt_ms
+            return None
+        dy = self.vy * self.k
+        if dy == 0.0:
+            return self.t0_ms if self.y0 == y_plane else None
+        n = (y_plane - self.y0) / dy
+        if n < 0:
+            return None
+        tick = int(math.ceil(n - 1e-9))
+        if self.end_tick is not None and tick > self.end_tick:
+            return None
+        return self.t0_ms + tick * self.dt_ms
+
+    def height_at_y(self, y_plane: float) -> Optional[float]:
+        """Altura de la pelota al cruzar y_plane (p.ej. margen sobre la red)."""
+        t = self.time_to_y(y_plane)
+        return None if t is None else self.position_at(t)[2]
+
+    def net_crossing(self, net_y: float) -> Optional[Tuple[float, float]]:
+        """(t_ms, z) al cruzar el plano de la red, o None."""
+        t = self.time_to_y(net_y)
+        return None if t is None else (t, self.position_at(t)[2])
+
+    @property
+    def landing(self) -> Optional[Bounce]:
+        """Primer pique del tiro."""
+        return self.bounces[0] if self.bounces else None
+
+    def next_bounce(self, t_ms: float) -> Optional[Bounce]:
+        for b in self.bounces:
+            if b.t_ms >= t_ms:
+                return b
+        return None
@@ -1,9 +1,28 @@
 import os
 import math
-import random
 import pygame
 from engine.game_object import GameObject
 from engine.utils.screen import world_to_screen  # proyección isométrica
+from engine.utils.iso import WORLD
+from engine.timing.fixed_step import ref_ticks, lerp
+from engine.timing.clock import now_ms
+from engine.physics.swept import box_toi
+from engine.physics.hitboxes import HitboxTable, hitbox_path, local_point, RACKET, BODY
+from engine.physics.masks import RacketMasks
+from engine.utils.screen import ANCHO
+from engine.utils import rng
+
+# Direcciones al azar de golpes y saques (mismo stream en las dos instancias)
+_RNG = rng.stream("player")
+
+# Mundo del jugador = mundo de la pelota desplazado en x (ver SimpleTennisAI)
+BALL_X_OFFSET = ANCHO // 2
+
+# Dirección en pantalla de cada flecha (diagonales de mundo), proyectadas una sola vez
+_ISO_UP = world_to_screen(-1, -1)
+_ISO_DOWN = world_to_screen(1, 1)
+_ISO_LEFT = world_to_screen(-1, 1)
+_ISO_RIGHT = world_to_screen(1, -1)
 
 # ⚙️ parámetros tunables centralizados (colisiones)
 try:
@@ -14,6 +33,10 @@ try:
 except Exception:
     BODY_W_SCALE, BODY_H_SCALE, BODY_Y_OFFSET = 0.55, 0.80, 4
     RACKET_W_SCALE, RACKET_H_SCALE, RACKET_Y_OFFSET = 0.40, 0.28, -6
+try:
+    from engine.config.collisions import PRECISE_RACKET_HITS
+except Exception:
+    PRECISE_RACKET_HITS = False
 
 # ⚙️ controles de golpe
 try:
@@ -27,6 +50,9 @@ try:
 except Exception:
     SPIN_TOPSPIN, SPIN_SLICE, SPIN_FLAT = +0.9, -0.7, 0.0
 
+# Efecto de cada golpe (Ball.spin al salir de la raqueta)
+SHOT_SPIN = {"flat": SPIN_FLAT, "topspin": SPIN_TOPSPIN, "slice": SPIN_SLICE}
+
 
 def _clamp(v, lo, hi):
     return max(lo, min(hi, v))
@@ -43,13 +69,27 @@ class Player(GameObject):
 
     def __init__(self, x, y, field, jugador2=False, game=None):
         json_path = os.path.join('assets', 'sprites', 'player_animation', 'player.json')
+        self.is_human = True
+        self._screen = None   # última proyección de (world_x, world_y) (WORLD.cached)
         super().__init__(x, y, json_path=json_path)
 
+        # Volúmenes de golpe por frame (player_hitboxes.json junto a player.json)
+        self.hitboxes = HitboxTable.load(hitbox_path(json_path), self.animations) if self.animations else None
+
+        # Modo preciso: máscara de la raqueta por frame de golpe (fase fina tras las cajas)
+        self.racket_masks = None
+        precise = os.getenv("VJ2D_PRECISE_HITS", "1" if PRECISE_RACKET_HITS else "0") == "1"
+        if precise and self.sprite_sheet_path:
+            self.racket_masks = RacketMasks.load(self.sprite_sheet_path, self.sprite_sheet, self.animations)
+
         self.world_x = float(x)
         self.world_y = float(y)
         self.field = field
         self.is_player2 = jugador2
         self.game = game
+        if self._animator is not None:
+            # Animación sobre el reloj de simulación (pausa / slow-motion coherentes)
+            self._animator.time_source = lambda: now_ms(self.game)
 
         # Velocidad base + modificadores
         self.base_speed = 8.0
@@ -64,6 +104,11 @@ class Player(GameObject):
         self._last_ix = 0.0
         self._last_iy = 0.0
 
+        # Posición del tick anterior (interpolación de render) y avance de frame por paso
+        self.prev_world_x = self.world_x
+        self.prev_world_y = self.world_y
+        self._walk_frame_accum = 0.0
+
         self.swing_active = False
         self.swing_timer = 0
         self.swing_duration = 600  # milisegundos de ventana para golpear
@@ -73,6 +118,8 @@ class Player(GameObject):
         self.swing_cooldown = 600     # ms antes de poder iniciar otro golpe
         self.swing_start_time = 0     # tiempo en que se inició el swing
         self.swing_state = "ready"    # "ready", "charging", "swinging", "cooldown"
+        self._swing_end_timer = None  # timers en game.timers (tiempo de simulación)
+        self._swing_ready_timer = None
         self.pending_direction = None # dirección elegida durante el delay
 
         # Golpe actual (se setea en mover() leyendo teclas)
@@ -121,7 +168,7 @@ class Player(GameObject):
         self._hit_flash_active = False
         self._hit_flash_start = 0
         self._hit_flash_duration = 600  # ms
-        self.target_zone = random.choice(["deep_back_left", "back_left", "deep_front_left", "front_left",
+        self.target_zone = _RNG.choice(["deep_back_left", "back_left", "deep_front_left", "front_left",
                                         "deep_front_right", "front_right", "deep_back_right", "back_right"])
 
         # --- Estados de saque --- 
@@ -131,6 +178,7 @@ class Player(GameObject):
         self.serve_duration_toss = 1600 # ms (duración del lanzamiento) 
         self.serve_duration_hit = 900 # ms (duración del golpe) 
         self.can_serve = True # si puede iniciar un saque (luego lo controla el juego)
+        self._serve_timer = None
 
         self._project_to_screen()
 
@@ -175,25 +223,44 @@ class Player(GameObject):
     def _project_to_screen(self):
         if not self.rect:
             return
-        iso_x, iso_y = world_to_screen(self.world_x, self.world_y)
-        self.rect.center = (iso_x, iso_y)
+        # Proyección cacheada: se recalcula solo si el jugador se movió desde la última
+        self.rect.center = WORLD.cached(self, self.world_x, self.world_y)
         self._update_collision_boxes()
 
     def _update_collision_boxes(self):
+        """
+        Actualiza body_rect / racket_rect en el lugar (sin alocar Rects por tick).
+        Con tabla de hitboxes son la proyección en pantalla de los volúmenes del frame
+        (solo para debug: el golpe se testea en mundo).
+        """
+        table = getattr(self, "hitboxes", None)
+        if table is not None:
+            if getattr(self, "body_rect", None) is None:
+                self.body_rect = pygame.Rect(0, 0, 0, 0)
+            if getattr(self, "racket_rect", None) is None:
+                self.racket_rect = pygame.Rect(0, 0, 0, 0)
+            off = self._hitbox_record()
+            mirror, far = self._facing_left(), self.is_player2
+            cx, cy = self.rect.center
+            table.screen_rect(off, BODY, self.body_rect, cx, cy, mirror, far)
+            table.screen_rect(off, RACKET, self.racket_rect, cx, cy, mirror, far)
+            return
+
         w, h = self.rect.width, self.rect.height
 
         # cuerpo
-        body_w = max(8, int(w * BODY_W_SCALE))
-        body_h = max(8, int(h * BODY_H_SCALE))
-        body = pygame.Rect(0, 0, body_w, body_h)
+        body = getattr(self, "body_rect", None)
+        if body is None:
+            body = self.body_rect = pygame.Rect(0, 0, 0, 0)
+        body.size = (max(8, int(w * BODY_W_SCALE)), max(8, int(h * BODY_H_SCALE)))
         body.centerx = self.rect.centerx
         body.bottom  = self.rect.bottom - BODY_Y_OFFSET
-        self.body_rect = body
 
         # raqueta
-        rw = max(4, int(w * RACKET_W_SCALE))
-        rh = max(4, int(h * RACKET_H_SCALE))
-        racket = pygame.Rect(0, 0, rw, rh)
+        racket = getattr(self, "racket_rect", None)
+        if racket is None:
+            racket = self.racket_rect = pygame.Rect(0, 0, 0, 0)
+        racket.size = (max(4, int(w * RACKET_W_SCALE)), max(4, int(h * RACKET_H_SCALE)))
 
         # --- 🔁 Offset lateral dinámico según dirección ---
         if self.is_player2:
@@ -210,10 +277,14 @@ class Player(GameObject):
             racket.centerx = self.rect.centerx + offset_x
 
         racket.top = self.rect.top + RACKET_Y_OFFSET
-        self.racket_rect = racket
+
+    def snap_prev(self):
+        """Guarda la posición actual como 'tick anterior' (llamar antes de cada tick)."""
+        self.prev_world_x = self.world_x
+        self.prev_world_y = self.world_y
 
     def _play_swing(self):
-        now = pygame.time.get_ticks()
+        now = now_ms(self.game)
         if (now - self._last_swing) >= self._swing_cd_ms:
             if "swing" in self.animations:
                 self.current_animation = "swing"
@@ -239,9 +310,10 @@ class Player(GameObject):
     # ---------------------------
     # Movimiento (+ leer teclas de golpe)
     # ---------------------------
-    def mover(self, teclas):
+    def mover(self, teclas, dt_ms=None):
+        """dt_ms: duración del tick de simulación (None = un tick de referencia)."""
+        k = ref_ticks(dt_ms)
         moved = False
-        current_time = pygame.time.get_ticks()
 
         # --- BLOQUEAR movimiento y animaciones si está en modo saque ---
         if getattr(self, "is_serving", False):
@@ -250,23 +322,9 @@ class Player(GameObject):
         # =========================
         # CONTROL DE SWING / GOLPE
         # =========================
-        # 1️⃣ Si está en cooldown, verificar si terminó
-        if hasattr(self, "swing_state") and self.swing_state == "cooldown":
-            if current_time - self.swing_start_time >= self.swing_cooldown:
-                self.swing_state = "ready"
-
-        # 2️⃣ Si está golpeando, verificar si terminó la animación
-        if hasattr(self, "swing_state") and self.swing_state == "swinging":
-            if current_time - self.swing_start_time >= self.swing_duration:
-                # Fin del golpe → pasar a cooldown
-                self.swing_state = "cooldown"
-                self.estado = "idle"
-                self.racket_active = False
-                self.swing_active = False
-                self.current_animation = "idle-P2" if self.is_player2 else "idle"
-            else:
-                # Todavía golpeando → bloquear movimiento
-                return  # 🚫 no mover durante el golpe
+        # El fin del golpe y del cooldown los disparan timers (_end_swing / _swing_ready)
+        if self.swing_state == "swinging":
+            return  # 🚫 no mover durante el golpe
 
         # 3️⃣ Detectar intento de golpe (solo si está listo)
         if hasattr(self, "swing_state") and self.swing_state == "ready":
@@ -274,12 +332,19 @@ class Player(GameObject):
                 k_swing = pygame.K_f
                 k_left, k_right, k_up = pygame.K_a, pygame.K_d, pygame.K_s
             else:
-                k_swing = pygame.K_SPACE
+                k_swing = KEY_FLAT
                 k_left, k_right, k_up = pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP
 
-            if teclas[k_swing]:
+            # Efecto: P1 golpea con KEY_FLAT / KEY_TOPSPIN / KEY_SLICE; P2 (F) toma el
+            # efecto de las mismas teclas si están apretadas (config/controls.py: compartidas)
+            topspin, slice_ = teclas[KEY_TOPSPIN], teclas[KEY_SLICE]
+            if teclas[k_swing] or (not self.is_player2 and (topspin or slice_)):
+                self._shot_mode = "topspin" if topspin else "slice" if slice_ else "flat"
                 self.swing_state = "swinging"
-                self.swing_start_time = current_time
+                self.swing_start_time = now_ms(self.game)
+                timers = self.game.timers
+                self._swing_end_timer = timers.schedule(self.swing_duration, self._end_swing)
+                self._swing_ready_timer = timers.schedule(self.swing_cooldown, self._swing_ready)
                 self.racket_active = True
                 self.swing_active = True
                 self.estado = "golpeando"
@@ -291,7 +356,7 @@ class Player(GameObject):
                 # ============================
                 ball = getattr(self.game, "_ball_main", None)
                 if ball:
-                    player_x_screen, y_screen = world_to_screen(self.world_x, self.world_y)
+                    player_x_screen, y_screen = WORLD.cached(self, self.world_x, self.world_y)
                     if ball.screen_x < player_x_screen:
                         if self.is_player2:
                             self.direccion2 = "left"
@@ -320,7 +385,7 @@ class Player(GameObject):
                     elif press_right:
                         self.pending_direction = "back_right"
                     elif press_up:
-                        self.pending_direction =  random.choice(["deep_back_left", "deep_back_right"])
+                        self.pending_direction =  _RNG.choice(["deep_back_left", "deep_back_right"])
                     else:
                         self.pending_direction = "center_back"
                 else:
@@ -333,11 +398,11 @@ class Player(GameObject):
                     elif press_right:
                         self.pending_direction = "front_right"
                     elif press_up:
-                        self.pending_direction = random.choice(["deep_front_left", "deep_front_right"])
+                        self.pending_direction = _RNG.choice(["deep_front_left", "deep_front_right"])
                     else:
                         self.pending_direction = "center_front"
 
-                print(f"🎯 Dirección elegida: {self.pending_direction}")
+                print(f"🎯 Dirección elegida: {self.pending_direction} ({self._shot_mode})")
 
                 # ============================
                 # 3️⃣ Animación de golpe
@@ -382,19 +447,19 @@ class Player(GameObject):
         dir_x = 0.0
         dir_y = 0.0
         if press_up:
-            dx, dy = world_to_screen(-1, -1)
+            dx, dy = _ISO_UP
             dir_x += dx
             dir_y += dy
         if press_down:
-            dx, dy = world_to_screen(1, 1)
+            dx, dy = _ISO_DOWN
             dir_x += dx
             dir_y += dy
         if press_left:
-            dx, dy = world_to_screen(-1, 1)
+            dx, dy = _ISO_LEFT
             dir_x += dx
             dir_y += dy
         if press_right:
-            dx, dy = world_to_screen(1, -1)
+            dx, dy = _ISO_RIGHT
             dir_x += dx
             dir_y += dy
 
@@ -403,8 +468,8 @@ class Player(GameObject):
             length = math.hypot(dir_x, dir_y)
             dir_x /= length
             dir_y /= length
-            self.world_x += dir_x * speed
-            self.world_y += dir_y * speed
+            self.world_x += dir_x * speed * k
+            self.world_y += dir_y * speed * k
             moved = True
 
             # Animaciones direccionales
@@ -443,9 +508,13 @@ class Player(GameObject):
                 if self.world_y < net_y + 1:
                     self.world_y = net_y + 1
 
-        # Avance de frame por movimiento
+        # Avance de frame por movimiento (un frame por tick de referencia caminado)
         if moved and self.current_animation in self.animations:
-            self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
+            self._walk_frame_accum += k
+            if self._walk_frame_accum >= 1.0:
+                steps = int(self._walk_frame_accum)
+                self._walk_frame_accum -= steps
+                self.frame_index = (self.frame_index + steps) % len(self.animations[self.current_animation])
 
         self._project_to_screen()
 
@@ -456,8 +525,9 @@ class Player(GameObject):
         self.is_serving = True
         self.serve_stage = "toss"
         self.current_animation = "Saque-01-P2" if self.is_player2 else "Saque-01-P1"
-        self.serve_start_time = pygame.time.get_ticks()
+        self.serve_start_time = now_ms(self.game)
         self.serve_duration_toss = 600  # milisegundos aprox.
+        self._schedule_serve(self.serve_duration_toss, self._end_serve_toss)
         print("🎾 Inicia saque (toss)")
 
     def realizar_saque(self):
@@ -466,72 +536,137 @@ class Player(GameObject):
 
         self.serve_stage = "hit"
         self.current_animation = "Saque-02-P2" if self.is_player2 else "Saque-02-P1"
-        self.serve_start_time = pygame.time.get_ticks()
+        self.serve_start_time = now_ms(self.game)
         self.serve_duration_hit = 400
+        self._schedule_serve(self.serve_duration_hit, self._end_serve_hit)
         print("💥 Golpe de saque iniciado")
 
     def update(self):
         self._project_to_screen()
-        # Llamar al update de GameObject si existe
+        # Llamar al update de GameObject si existe (durante el saque la animación la fijan los timers)
         if not getattr(self, "is_serving", False):
             try:
                 super().update()
             except Exception:
                 pass
-        # hit flash timeout
-        if getattr(self, "is_serving", False):
-            current_time = pygame.time.get_ticks()
-
-            # --- Etapa 1: lanzamiento del saque ---
-            if self.serve_stage == "toss":
-                dur = getattr(self, "serve_duration_toss", 0)
-                if current_time - self.serve_start_time >= dur:
-                    self.serve_stage = "ready_for_hit"
-                    print("⏳ Listo para golpe de saque")
-                    # Quedarse en el último frame del toss
-                    frames = self.animations.get(self.current_animation, [])
-                    if frames:
-                        self.frame_index = len(frames) - 1  # último frame
-                    # Evitar que el animator la siga loopando
-                    self.anim_timer = 0
-                    return
-
-            # --- Etapa 2: golpe del saque ---
-            elif self.serve_stage == "hit":
-                dur = getattr(self, "serve_duration_hit", 0)
-                if current_time - self.serve_start_time >= dur:
-                    # Fin del golpe → volver a idle
-                    self.is_serving = False
-                    self.can_serve = False
-                    self.serve_stage = None
-                    self.current_animation = "idle-P2" if self.is_player2 else "idle"
-                    print("✅ Saque completo (una sola vez)")
-                else:
-                    # No reiniciar la animación — dejarla avanzar naturalmente
-                    pass
 
-    def draw(self, surface):
-        if not self.sprite_sheet or not self.animations or not self.rect:
+    # ---------------------------
+    # Timers (game.timers, tiempo de simulación)
+    # ---------------------------
+    def _end_swing(self):
+        """Fin de la ventana de golpe sin impacto → cooldown."""
+        self._swing_end_timer = None
+        if self.swing_state != "swinging":
+            return
+        self.swing_state = "cooldown"
+        self.estado = "idle"
+        self.racket_active = False
+        self.swing_active = False
+        self.current_animation = "idle-P2" if self.is_player2 else "idle"
+
+    def _swing_ready(self):
+        self._swing_ready_timer = None
+        if self.swing_state == "cooldown":
+            self.swing_state = "ready"
+
+    def _schedule_serve(self, delay_ms, callback):
+        self.game.timers.cancel(self._serve_timer)
+        self._serve_timer = self.game.timers.schedule(delay_ms, callback)
+
+    def _end_serve_toss(self):
+        """Etapa 1 terminada: quedarse en el último frame del toss a la espera del golpe."""
+        self._serve_timer = None
+        if self.serve_stage != "toss":
             return
+        self.serve_stage = "ready_for_hit"
+        print("⏳ Listo para golpe de saque")
         frames = self.animations.get(self.current_animation, [])
+        if frames:
+            self.frame_index = len(frames) - 1  # último frame
+        # Evitar que el animator la siga loopando
+        self.anim_timer = 0
+
+    def _end_serve_hit(self):
+        """Etapa 2 terminada: volver a idle."""
+        self._serve_timer = None
+        if self.serve_stage != "hit":
+            return
+        self.is_serving = False
+        self.can_serve = False
+        self.serve_stage = None
+        self.current_animation = "idle-P2" if self.is_player2 else "idle"
+        print("✅ Saque completo (una sola vez)")
+
+    def draw(self, surface, alpha: float = 1.0):
+        """alpha: fracción entre el tick anterior (0) y el actual (1) para interpolar."""
+        if not self.rect:
+            return
+        self.draw_frame(surface, self.current_animation, self.frame_index,
+                        self.interpolated_topleft(alpha), self._hit_flash_active)
+
+    def interpolated_topleft(self, alpha: float = 1.0):
+        """Esquina sup-izq en pantalla para la posición interpolada (mismo tamaño que rect)."""
+        cx, cy = world_to_screen(lerp(self.prev_world_x, self.world_x, alpha),
+                                 lerp(self.prev_world_y, self.world_y, alpha))
+        return (int(cx) - self.rect.width // 2, int(cy) - self.rect.height // 2)
+
+    def draw_frame(self, surface, anim: str, frame_index: int, dest, flash: bool = False):
+        """Dibuja un frame concreto de la spritesheet (solo lee assets; apto para el hilo de render)."""
+        if not self.sprite_sheet or not self.animations:
+            return
+        frames = self.animations.get(anim, [])
         if not frames:
             return
-        self.frame_index %= len(frames)
-        fx, fy, fw, fh = frames[self.frame_index]
+        fx, fy, fw, fh = frames[frame_index % len(frames)]
         frame_surf = self.sprite_sheet.subsurface(pygame.Rect(fx, fy, fw, fh))
 
-        if self._hit_flash_active:
-            flash = frame_surf.copy()
-            flash.fill((255, 255, 255, 70), special_flags=pygame.BLEND_RGBA_ADD)
-            surface.blit(flash, self.rect)
+        if flash:
+            flash_surf = frame_surf.copy()
+            flash_surf.fill((255, 255, 255, 70), special_flags=pygame.BLEND_RGBA_ADD)
+            surface.blit(flash_surf, dest)
         else:
-            surface.blit(frame_surf, self.rect)
+            surface.blit(frame_surf, dest)
 
     # ---------------------------
     # Colisiones con pelota
     # ---------------------------
+    def _facing_left(self) -> bool:
+        return getattr(self, "direccion2" if self.is_player2 else "direccion1", "right") == "left"
+
+    def _hitbox_record(self) -> int:
+        return self.hitboxes.record(getattr(self, "current_animation", None), getattr(self, "frame_index", 0))
+
+    def ball_contact(self, ball, kind=RACKET):
+        """
+        t∈[0,1] del tick en que la pelota toca el volumen (raqueta / cuerpo) del frame
+        actual, en espacio de mundo; None si no lo toca. Los volúmenes están escritos para
+        el jugador de abajo: P2 los ve invertidos en y (de cara a la red).
+        """
+        ox, oy = self.world_x - BALL_X_OFFSET, self.world_y   # pies del jugador en mundo de la pelota
+        mirror, far = self._facing_left(), self.is_player2
+        p1 = local_point(ball.x - ox, ball.y - oy, ball.z, mirror, far)
+        p0 = (local_point(ball.prev_x - ox, ball.prev_y - oy, ball.prev_z, mirror, far)
+              if hasattr(ball, "prev_x") else p1)
+        return self.hitboxes.sweep(self._hitbox_record(), kind, p0, p1, getattr(ball, "radio", 7))
+
+    def footprint(self, kind=RACKET):
+        """
+        Huella (x0, y0, x1, y1) de la raqueta / cuerpo en el piso, en el mundo de la
+        pelota (fase amplia del CollisionWorld). Sin tabla: caja amplia alrededor de los pies.
+        """
+        ox, oy = self.world_x - BALL_X_OFFSET, self.world_y
+        if self.hitboxes is None:
+            return ox - 60.0, oy - 60.0, ox + 60.0, oy + 60.0
+        x0, y0, x1, y1 = self.hitboxes.footprint(self._hitbox_record(), kind, self._facing_left(), self.is_player2)
+        return ox + x0, oy + y0, ox + x1, oy + y1
+
     def check_ball_collision(self, ball, tolerance=25):
-        """Chequea si la pelota colisiona con la raqueta activa (USANDO COORDENADAS DE PANTALLA)."""
+        """
+        Chequea si la pelota colisiona con la raqueta activa.
+        Con tabla de hitboxes el test es en mundo (x, y, z) contra el volumen del frame;
+        sin ella, barrido en pantalla contra racket_rect. En modo preciso
+        (VJ2D_PRECISE_HITS=1) el contacto se confirma con la máscara de la raqueta.
+        """
         if not self.racket_active:
             return False
 
@@ -546,7 +681,6 @@ class Player(GameObject):
             by = int(ball.rect.centery)
 
         r = getattr(ball, "radio", 10)
-        ball_2d_rect = pygame.Rect(bx - r, by - r, r*2, r*2)
 
         # Debug: ver posiciones en pantalla
         if getattr(self, "_debug_collision", False):
@@ -554,23 +688,43 @@ class Player(GameObject):
 
         # Solo durante la fase de impacto
         if self.swing_state == "swinging":
-            if ball_2d_rect.colliderect(self.racket_rect):
+            if self.hitboxes is not None and hasattr(ball, "z"):
+                t_hit = self.ball_contact(ball, RACKET)
+            else:
+                # Barrido: segmento de pantalla del tick (posición anterior -> actual) contra la raqueta
+                p0 = getattr(ball, "prev_screen", (bx, by))
+                t_hit = box_toi(p0, (bx, by), r, self.racket_rect)
+            if t_hit is not None and self.racket_masks is not None:
+                # Fase fina: solo en los casi-golpes, contra los píxeles de la raqueta del frame
+                t_hit = self.racket_masks.hit(self.current_animation, self.frame_index, self.rect.topleft,
+                                              getattr(ball, "prev_screen", (bx, by)), (bx, by), r, t_hit)
+            if t_hit is not None:
                 print("🔥 Colisión detectada entre raqueta y pelota!")
 
+                # El golpe sale desde el punto de contacto, no desde el fin del tick
+                if hasattr(ball, "prev_x") and t_hit < 1.0:
+                    ball.x = ball.prev_x + (ball.x - ball.prev_x) * t_hit
+                    ball.y = ball.prev_y + (ball.y - ball.prev_y) * t_hit
+                    ball.z = ball.prev_z + (ball.z - ball.prev_z) * t_hit
+
                 # Determinar zona final
                 if self.pending_direction:
                     zone = self.pending_direction
                 else:
-                    zone = random.choice(["deep_back_left", "back_left", "deep_front_left", "front_left",
+                    zone = _RNG.choice(["deep_back_left", "back_left", "deep_front_left", "front_left",
                                         "deep_front_right", "front_right", "deep_back_right", "back_right"])
 
                 # Pasamos la posición del jugador en MUNDO
-                ball.hit_by_player((self.world_x, self.world_y), zone=self.pending_direction, is_player2=self.is_player2)
+                ball.hit_by_player((self.world_x, self.world_y), zone=self.pending_direction, is_player2=self.is_player2,
+                                   spin=SHOT_SPIN.get(self._shot_mode, SPIN_FLAT))
                 print(f"💥 Golpe hacia zona: {zone}")
 
                 # Finalizar swing inmediatamente después del impacto
+                # (el cooldown sigue contando desde el inicio del golpe)
+                self.game.timers.cancel(self._swing_end_timer)
+                self._swing_end_timer = None
                 self.swing_state = "cooldown"
-                self._last_swing = pygame.time.get_ticks()
+                self._last_swing = now_ms(self.game)
                 self.swing_active = False
                 self.racket_active = False
                 return True
@@ -0,0 +1,115 @@
+"""
+Pipeline simulación → render en dos hilos con doble buffer de snapshots.
+Diseño:
+- RenderPipeline(render_fn, buffers) -> hilo de render: render_fn(snapshot, surface) dibuja
+                                       en una de las dos Surface fuera de pantalla de buffers
+- RenderPipeline.submit(snap)        -> publica el snapshot del frame N (no copia nada)
+- RenderPipeline.present(target)     -> hilo principal: blit del último frame terminado en
+                                       target (la pantalla); True si había uno nuevo (-> flip)
+- RenderPipeline.drain()             -> espera a que el hilo termine el frame en curso
+- RenderPipeline.stop()              -> termina el hilo
+
+Snapshots: el que el hilo está dibujando y el último publicado. Mientras se dibuja
+el frame N la simulación ya calcula el N+1; si el render se atrasa, el snapshot
+pendiente se reemplaza por el más nuevo.
+
+Imágenes: el hilo nunca toca la ventana. Dibuja en el buffer de atrás y al terminar
+lo intercambia con el de adelante; el hilo principal copia el de adelante a la
+pantalla y hace el flip (SDL solo admite llamadas de video desde el hilo principal
+en macOS y Windows). present() copia bajo el lock, así que el hilo nunca dibuja en
+la Surface que se está copiando. Latencia: se presenta el último frame terminado,
+hasta un frame detrás del snapshot recién publicado.
+
+Opcional (VJ2D_PIPELINE=1).
+"""
+
+import threading
+from typing import Callable, Optional, Sequence
+
+
+class RenderPipeline:
+    def __init__(self, render_fn: Callable[[object, object], None], buffers: Sequence[object],
+                 name: str = "vj2d-render"):
+        self._render_fn = render_fn
+        self._back, self._front = buffers    # Surface fuera de pantalla (dibujo / último terminado)
+        self._ready = False                  # _front tiene un frame que todavía no se presentó
+        self._cv = threading.Condition()
+        self._pending = None      # último snapshot publicado (buffer de escritura)
+        self._busy = False        # el hilo está dibujando (buffer de lectura)
+        self._running = True
+
+        # Estadísticas
+        self.submitted = 0
+        self.rendered = 0
+        self.replaced = 0         # snapshots descartados por uno más nuevo
+        self.presented = 0        # frames copiados a la pantalla por present()
+        self.error: Optional[BaseException] = None
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    # ---------------------------
+    # Hilo de simulación
+    # ---------------------------
+    def submit(self, snapshot) -> None:
+        with self._cv:
+            if self._pending is not None:
+                self.replaced += 1
+            self._pending = snapshot
+            self.submitted += 1
+            self._cv.notify_all()
+
+    def present(self, target) -> bool:
+        """Copia el último frame terminado a target (blit); False si no hay uno nuevo."""
+        with self._cv:
+            if not self._ready:
+                return False
+            target.blit(self._front, (0, 0))
+            self._ready = False
+            self.presented += 1
+            return True
+
+    def drain(self, timeout: float = 1.0) -> None:
+        """Bloquea hasta que no quede nada pendiente ni en curso (antes de dibujar en el hilo principal)."""
+        with self._cv:
+            self._cv.wait_for(lambda: (self._pending is None and not self._busy) or not self._running,
+                              timeout)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        with self._cv:
+            self._running = False
+            self._pending = None
+            self._cv.notify_all()
+        self._thread.join(timeout)
+
+    @property
+    def alive(self) -> bool:
+        return self._running and self._thread.is_alive()
+
+    # ---------------------------
+    # Hilo de render
+    # ---------------------------
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._pending is not None or not self._running)
+                if not self._running:
+                    return
+                snap, self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._render_fn(snap, self._back)
+                self.rendered += 1
+            except Exception as e:
+                print(f"[Render] error en el hilo de render, se desactiva el pipeline: {e}")
+                self.error = e
+                with self._cv:
+                    self._running = False
+                    self._busy = False
+                    self._cv.notify_all()
+                return
+            with self._cv:
+                self._back, self._front = self._front, self._back
+                self._ready = True
+                self._busy = False
+                self._cv.notify_all()
@@ -0,0 +1,161 @@
+"""
+Snapshots inmutables del mundo para el render.
+Diseño:
+- capture(game, alpha) -> WorldSnapshot con posiciones ya interpoladas, frames de
+                          animación, texto del marcador y overlays de depuración
+- draw(game, surface, snap) -> dibuja el snapshot (solo lee assets: sprite sheets, fuentes)
+
+El render (directo o en el hilo de RenderPipeline) no lee el estado vivo que cambia
+por tick ni por frame: posiciones, animación, marcador, piques y la revisión F4 viajan
+copiados dentro del snapshot. Sí lee objetos que no se mutan en partida (sprite sheets,
+fuentes, la geometría de la cancha y los cachés de dibujo de Field / DebugOverlays,
+que solo toca quien dibuja).
+"""
+
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+from engine.ball import Ball
+from engine.ecs.store import BALL, live_ids, sync
+from engine.perf.governor import QualityFlags
+from engine.timing.fixed_step import lerp
+
+try:
+    from engine.config.collisions import COLOR_BODY, COLOR_RACKET
+except Exception:
+    COLOR_BODY, COLOR_RACKET = (50, 220, 60), (240, 200, 40)
+
+
+class BallState(NamedTuple):
+    x: float
+    y: float
+    z: float
+    radio: int
+
+
+class PlayerState(NamedTuple):
+    sprite: object              # Player: solo se usa para leer su spritesheet
+    anim: str
+    frame: int
+    dest: Tuple[int, int]       # esquina sup-izq interpolada
+    flash: bool
+    body_rect: Optional[Tuple[int, int, int, int]]
+    racket_rect: Optional[Tuple[int, int, int, int]]
+
+
+class WorldSnapshot(NamedTuple):
+    seq: int
+    balls: Tuple[BallState, ...]
+    players: Tuple[PlayerState, ...]   # en orden de dibujo (P2 detrás de P1)
+    bg_anim: str
+    bg_frame: int
+    score_text: Optional[str]
+    debug_bounds: bool
+    bounces: tuple                     # BounceMarker copiados (o vacío)
+    challenge: tuple                   # revisión F4 (DebugOverlays.challenge_snapshot) o ()
+    countdown_ms: int                  # 0 = sin cuenta regresiva
+    banner: Optional[tuple]            # (texto, color) de Banners o None
+    quality: QualityFlags              # nivel de calidad del governor al capturar
+    net: object = None                 # deformación de la red (Net.snapshot) o None = quieta
+
+
+_seq = 0
+
+
+def _player_state(p, alpha: float, debug: bool) -> PlayerState:
+    body = racket = None
+    if debug:
+        if getattr(p, "body_rect", None) is not None:
+            body = tuple(p.body_rect)
+        if getattr(p, "racket_rect", None) is not None:
+            racket = tuple(p.racket_rect)
+    dest = p.interpolated_topleft(alpha) if p.rect else (0, 0)
+    return PlayerState(p, p.current_animation, p.frame_index, dest,
+                       bool(p._hit_flash_active), body, racket)
+
+
+def _score_text(game) -> Optional[str]:
+    drill = getattr(game, "drill", None)
+    if drill is not None:
+        return drill.hud_text()
+    return game.score.get_score_str() if game.score else None
+
+
+def capture(game, alpha: float = 1.0) -> WorldSnapshot:
+    """Copia el estado visible de 'game' (llamar desde el hilo de simulación)."""
+    global _seq
+    _seq += 1
+
+    # Pelotas: un sync por frame dibujado y después se recorren las columnas de game.entities
+    st = game.entities
+    sync(st, game.balls)
+    x, y, z, px, py, pz, radius = st.x, st.y, st.z, st.px, st.py, st.pz, st.radius
+    balls = tuple(
+        BallState(lerp(px[e], x[e], alpha), lerp(py[e], y[e], alpha), lerp(pz[e], z[e], alpha), radius[e])
+        for e in live_ids(st, BALL)
+    )
+    debug = bool(game._debug_bounds)
+    players = (_player_state(game.jugador2, alpha, debug),
+               _player_state(game.jugador1, alpha, debug))
+
+    bounces = challenge = ()
+    if game.debug_overlays:
+        challenge = game.debug_overlays.challenge_snapshot()
+        if game.show_bounce_debug:
+            bounces = game.debug_overlays.snapshot()
+    cd = game._restart_cd
+    countdown_ms = int(cd.remaining) if (cd and cd.active) else 0
+
+    bg = game.background
+    return WorldSnapshot(
+        seq=_seq,
+        balls=balls,
+        players=players,
+        bg_anim=bg.current_animation,
+        bg_frame=bg.frame_index,
+        score_text=_score_text(game),
+        debug_bounds=debug,
+        bounces=bounces,
+        challenge=challenge,
+        countdown_ms=countdown_ms,
+        banner=game.banners.snapshot() if getattr(game, "banners", None) else None,
+        quality=game.quality,
+        net=game.field.net.snapshot(),
+    )
+
+
+def draw(game, surface: pygame.Surface, snap: WorldSnapshot) -> None:
+    """Escena ingame a partir de un snapshot (sin overlays)."""
+    game.field.draw(surface, snap.net)
+    game.background.draw_frame(surface, snap.bg_anim, snap.bg_frame)
+
+    if snap.debug_bounds:
+        game.field.draw_debug_bounds(surface)
+        game.field.net.draw_debug(surface)
+
+    for b in snap.balls:
+        Ball.draw_state(surface, b.x, b.y, b.z, b.radio, snap.quality.shadows)
+
+    for p in snap.players:
+        p.sprite.draw_frame(surface, p.anim, p.frame, p.dest, p.flash)
+
+    if snap.debug_bounds:
+        for p in snap.players:
+            if p.body_rect:
+                pygame.draw.rect(surface, COLOR_BODY, p.body_rect, width=2)
+            if p.racket_rect:
+                pygame.draw.rect(surface, COLOR_RACKET, p.racket_rect, width=2)
+
+    if snap.score_text is not None and game.score:
+        game.score.draw_hud(surface, game.font_hud, snap.score_text, snap.quality.hud_outline)
+
+
+def draw_overlays(game, surface: pygame.Surface, snap: WorldSnapshot) -> None:
+    """Overlays temporales capturados en el snapshot (piques, cuenta regresiva, carteles)."""
+    if game.debug_overlays:
+        game.debug_overlays.draw(surface, snap.bounces, snap.challenge)
+    if snap.countdown_ms > 0 and game._restart_cd:
+        game._restart_cd.draw(surface, "Reiniciando partida", snap.countdown_ms)
+    if snap.banner is not None:
+        game.banners.draw(surface, snap.banner)
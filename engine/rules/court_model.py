@@ -0,0 +1,279 @@
+"""
+Modelo de la cancha en unidades de mundo: líneas, cuadros de saque y pasillos.
+Diseño:
+- CourtModel(...)                         -> geometría compilada a una grilla de regiones
+- CourtModel.region(x, y)                 -> bits de región (BOTTOM, SINGLES, DEUCE_BOX, LONG, ...)
+- CourtModel.inside(x, y)                 -> dentro de las líneas que valen en el rally
+- CourtModel.call(x, y, hitter, serve_box, touched_net) -> LineCall del pique
+- CourtModel.margin(x, y, hitter, serve_box) -> distancia con signo a las líneas juzgadas
+- CourtModel.side(y)                      -> "top" / "bottom" (mitad de cada jugador)
+- CourtModel.service_box(half, box)       -> (x0, y0, x1, y1) de un cuadro de saque
+- CourtModel.target_zones(inset, net_gap) -> zonas de puntería (x, y, w, h) dentro de la cancha
+- CourtModel.lines()                      -> segmentos de todas las líneas (debug)
+- default_court()                         -> modelo de la config, compartido
+
+La grilla guarda por celda el código de región si la celda no toca ninguna línea,
+o _EDGE si la toca; en ese caso (y fuera de la grilla) se hace el test exacto
+contra los bordes. Cualquier consulta es O(1): una celda y a lo sumo ~10 comparaciones.
+
+Los bordes se corren medio grosor de línea hacia afuera: la pelota que pica sobre
+la línea es buena. Mitades como en la IA: "top" (y < red, jugador 2) y "bottom"
+(jugador 1). El cuadro "deuce" es el de la derecha de quien recibe mirando la red.
+"""
+
+import math
+import os
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from engine.config.court import (
+        COURT_DOUBLES, COURT_ALLEY, COURT_SERVICE_DEPTH, COURT_LINE_WIDTH,
+        COURT_LINES, COURT_CELL, COURT_GRID_MARGIN, ZONE_INSET, ZONE_NET_GAP,
+    )
+except Exception:
+    COURT_DOUBLES = (-50.0, -150.0, 250.0, 350.0)
+    COURT_ALLEY, COURT_SERVICE_DEPTH, COURT_LINE_WIDTH = 37.5, 134.6, 2.0
+    COURT_LINES, COURT_CELL, COURT_GRID_MARGIN = "doubles", 10.0, 150.0
+    ZONE_INSET, ZONE_NET_GAP = 5.0, 15.0
+
+# Bits de región
+BOTTOM = 1 << 0          # mitad de abajo (y > red)
+SINGLES = 1 << 1         # dentro de la cancha de singles
+DOUBLES = 1 << 2         # dentro de la cancha de dobles
+DEUCE_BOX = 1 << 3       # cuadro de saque deuce de esa mitad
+AD_BOX = 1 << 4          # cuadro de saque ad de esa mitad
+LONG = 1 << 5            # pasado el fondo
+WIDE = 1 << 6            # afuera de la lateral de singles
+WIDE_DOUBLES = 1 << 7    # afuera de la lateral de dobles
+PAST_SERVICE = 1 << 8    # más allá de la línea de saque (saque largo)
+_EDGE = 0xFFFF
+
+
+class LineCall(NamedTuple):
+    verdict: str   # "in" | "out" | "let"
+    label: str     # "in", "long", "wide", "long wide", "own court", "deuce service box", "let", ...
+    code: int      # bits de región del pique
+
+
+class CourtModel:
+    def __init__(self, doubles: Tuple[float, float, float, float] = COURT_DOUBLES,
+                 alley: float = COURT_ALLEY, service_depth: float = COURT_SERVICE_DEPTH,
+                 line_width: float = COURT_LINE_WIDTH, lines: Optional[str] = None,
+                 cell: float = COURT_CELL, margin: float = COURT_GRID_MARGIN):
+        x0, y0, x1, y1 = (float(v) for v in doubles)
+        self.doubles = (x0, y0, x1, y1)
+        self.alley = float(alley)
+        self.service_depth = float(service_depth)
+        self.line_width = float(line_width)
+        self.net_y = (y0 + y1) * 0.5
+        self.center_x = (x0 + x1) * 0.5
+
+        hw = self.line_width * 0.5
+        self._dx = (x0 - hw, x1 + hw)                                  # laterales de dobles
+        self._sx = (x0 + self.alley - hw, x1 - self.alley + hw)        # laterales de singles
+        self._by = (y0 - hw, y1 + hw)                                  # fondos
+        self._sy = (self.net_y - self.service_depth - hw, self.net_y + self.service_depth + hw)
+        self._cx = (self.center_x - hw, self.center_x + hw)            # línea central de saque
+
+        lines = (lines or os.environ.get("VJ2D_COURT_LINES") or COURT_LINES).strip().lower()
+        self.singles = lines == "singles"
+        self._play_bit = SINGLES if self.singles else DOUBLES
+        self._wide_bit = WIDE if self.singles else WIDE_DOUBLES
+        side_x = self._sx if self.singles else self._dx
+        # Borde exterior de las líneas que valen (lo que antes era FIELD_LEFT..FIELD_BOTTOM)
+        self.bounds = (side_x[0], self._by[0], side_x[1], self._by[1])
+
+        self._compile(float(cell), float(margin))
+
+    # ---------------------------
+    # Compilación
+    # ---------------------------
+    def _compile(self, cell: float, margin: float) -> None:
+        x0, y0, x1, y1 = self.doubles
+        self.cell = cell
+        self._inv = 1.0 / cell
+        self._gx, self._gy = x0 - margin, y0 - margin
+        self.nx = int((x1 - x0 + 2 * margin) / cell) + 1
+        self.ny = int((y1 - y0 + 2 * margin) / cell) + 1
+
+        xs = self._dx + self._sx + self._cx
+        ys = self._by + self._sy + (self.net_y,)
+        grid = array("H", bytes(2 * self.nx * self.ny))
+        edges = 0
+        for iy in range(self.ny):
+            cy0 = self._gy + iy * cell
+            y_edge = any(cy0 <= b <= cy0 + cell for b in ys)
+            for ix in range(self.nx):
+                cx0 = self._gx + ix * cell
+                if y_edge or any(cx0 <= b <= cx0 + cell for b in xs):
+                    grid[iy * self.nx + ix] = _EDGE
+                    edges += 1
+                else:
+                    grid[iy * self.nx + ix] = self._exact(cx0 + cell * 0.5, cy0 + cell * 0.5)
+        self._grid = grid
+        self.edge_cells = edges
+
+    def _exact(self, x: float, y: float) -> int:
+        code = BOTTOM if y > self.net_y else 0
+        in_y = self._by[0] <= y <= self._by[1]
+        in_s = self._sx[0] <= x <= self._sx[1]
+        if not in_y:
+            code |= LONG
+        if not in_s:
+            code |= WIDE
+        if not (self._dx[0] <= x <= self._dx[1]):
+            code |= WIDE_DOUBLES
+        elif in_y:
+            code |= DOUBLES | (SINGLES if in_s else 0)
+
+        if not (self._sy[0] <= y <= self._sy[1]):
+            code |= PAST_SERVICE
+        elif in_s:
+            # La línea central pertenece a los dos cuadros
+            left, right = x <= self._cx[1], x >= self._cx[0]
+            deuce, ad = (right, left) if code & BOTTOM else (left, right)
+            code |= (DEUCE_BOX if deuce else 0) | (AD_BOX if ad else 0)
+        return code
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def region(self, x: float, y: float) -> int:
+        fx, fy = (x - self._gx) * self._inv, (y - self._gy) * self._inv
+        if fx >= 0.0 and fy >= 0.0:
+            ix, iy = int(fx), int(fy)
+            if ix < self.nx and iy < self.ny:
+                code = self._grid[iy * self.nx + ix]
+                if code != _EDGE:
+                    return code
+        return self._exact(x, y)
+
+    def inside(self, x: float, y: float) -> bool:
+        """Dentro de las líneas del rally (singles o dobles según COURT_LINES)."""
+        return bool(self.region(x, y) & self._play_bit)
+
+    def inside_many(self, xs, ys):
+        """inside() sobre arrays de NumPy (BallBatch): solo depende del rectángulo de juego."""
+        bx0, by0, bx1, by1 = self.bounds
+        return (xs >= bx0) & (xs <= bx1) & (ys >= by0) & (ys <= by1)
+
+    def side(self, y: float) -> str:
+        return "bottom" if y > self.net_y else "top"
+
+    def call(self, x: float, y: float, hitter: Optional[str] = None,
+             serve_box: Optional[str] = None, touched_net: bool = False) -> LineCall:
+        """
+        Fallo del pique en (x, y).
+        hitter:      mitad de quien pegó ("top" / "bottom"); None = no se mira la mitad.
+        serve_box:   "deuce" / "ad" si es el primer pique de un saque (cuadro de la mitad
+                     contraria a hitter); None = pique de rally.
+        touched_net: el saque tocó la red antes de picar (dentro del cuadro = let).
+        """
+        code = self.region(x, y)
+        if hitter is not None and bool(code & BOTTOM) == (hitter == "bottom"):
+            return LineCall("out", "own court", code)
+
+        if serve_box is not None:
+            want = DEUCE_BOX if serve_box == "deuce" else AD_BOX
+            if code & want:
+                if touched_net:
+                    return LineCall("let", "let", code)
+                return LineCall("in", serve_box + " service box", code)
+            if code & (LONG | PAST_SERVICE):
+                return LineCall("out", "long", code)
+            return LineCall("out", "wide" if code & WIDE else "wrong box", code)
+
+        if code & self._play_bit:
+            return LineCall("in", "in", code)
+        long, wide = code & LONG, code & self._wide_bit
+        return LineCall("out", "long wide" if long and wide else "long" if long else "wide", code)
+
+    def margin(self, x: float, y: float, hitter: Optional[str] = None,
+               serve_box: Optional[str] = None) -> float:
+        """
+        Distancia con signo del pique al borde exterior de las líneas que juzga call():
+        > 0 adentro (a cuánto quedó de la línea más cercana), < 0 afuera (cuánto se pasó).
+        Con serve_box es el cuadro de saque de la mitad contraria a hitter.
+        """
+        if serve_box is not None and hitter is not None:
+            hw = self.line_width * 0.5
+            x0, y0, x1, y1 = self.service_box("top" if hitter == "bottom" else "bottom", serve_box)
+            x0, y0, x1, y1 = x0 - hw, y0 - hw, x1 + hw, y1 + hw
+        else:
+            x0, y0, x1, y1 = self.bounds
+        dx, dy = max(x0 - x, x - x1), max(y0 - y, y - y1)
+        if dx <= 0.0 and dy <= 0.0:
+            return -max(dx, dy)
+        return -math.hypot(max(dx, 0.0), max(dy, 0.0))
+
+    def service_box(self, half: str, box: str) -> Tuple[float, float, float, float]:
+        """(x0, y0, x1, y1) del cuadro de saque box ("deuce"/"ad") de la mitad half, sin líneas."""
+        sx0, sx1 = self.doubles[0] + self.alley, self.doubles[2] - self.alley
+        if half == "bottom":
+            y0, y1 = self.net_y, self.net_y + self.service_depth
+            right = box == "deuce"
+        else:
+            y0, y1 = self.net_y - self.service_depth, self.net_y
+            right = box != "deuce"
+        return (self.center_x, y0, sx1, y1) if right else (sx0, y0, self.center_x, y1)
+
+    def target_zones(self, inset: float = ZONE_INSET,
+                     net_gap: float = ZONE_NET_GAP) -> Dict[str, Tuple[float, float, float, float]]:
+        """
+        Zonas de puntería de Field.zones como (x, y, w, h), todas dentro de las líneas que
+        valen (inset hacia adentro) y a net_gap de la red. "front" es la mitad de arriba
+        (la que ataca P1) y "back" la de abajo; las "deep" van de la línea de saque al
+        fondo. left / right parten en la línea central y center cubre la mitad del ancho.
+        """
+        x0, y0, x1, y1 = self.doubles
+        if self.singles:
+            x0, x1 = x0 + self.alley, x1 - self.alley
+        x0, x1, y0, y1 = x0 + inset, x1 - inset, y0 + inset, y1 - inset
+        cx, quarter = self.center_x, (x1 - x0) * 0.25
+        top_net, bottom_net = self.net_y - net_gap, self.net_y + net_gap
+        top_service = self.net_y - self.service_depth
+        bottom_service = self.net_y + self.service_depth
+
+        def rect(xa, ya, xb, yb):
+            return (xa, ya, xb - xa, yb - ya)
+
+        return {
+            "deep_back_left":   rect(x0, bottom_service, cx, y1),
+            "back_left":        rect(x0, bottom_net, cx, bottom_service),
+            "deep_front_left":  rect(x0, y0, cx, top_service),
+            "front_left":       rect(x0, top_service, cx, top_net),
+
+            "deep_front_right": rect(cx, y0, x1, top_service),
+            "front_right":      rect(cx, top_service, x1, top_net),
+            "deep_back_right":  rect(cx, bottom_service, x1, y1),
+            "back_right":       rect(cx, bottom_net, x1, bottom_service),
+
+            "center_back":      rect(cx - quarter, bottom_net, cx + quarter, y1),
+            "center_front":     rect(cx - quarter, y0, cx + quarter, top_net),
+        }
+
+    def lines(self) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+        """Ejes de todas las líneas (y la red) como segmentos de mundo."""
+        x0, y0, x1, y1 = self.doubles
+        sx0, sx1 = x0 + self.alley, x1 - self.alley
+        s0, s1 = self.net_y - self.service_depth, self.net_y + self.service_depth
+        return [
+            ((x0, y0), (x1, y0)), ((x0, y1), (x1, y1)),           # fondos
+            ((x0, y0), (x0, y1)), ((x1, y0), (x1, y1)),           # laterales de dobles
+            ((sx0, y0), (sx0, y1)), ((sx1, y0), (sx1, y1)),       # laterales de singles
+            ((sx0, s0), (sx1, s0)), ((sx0, s1), (sx1, s1)),       # líneas de saque
+            ((self.center_x, s0), (self.center_x, s1)),           # línea central de saque
+            ((x0, self.net_y), (x1, self.net_y)),                 # red
+        ]
+
+
+_DEFAULT: Optional[CourtModel] = None
+
+
+def default_court() -> CourtModel:
+    """CourtModel de engine.config.court (se compila una vez)."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = CourtModel()
+    return _DEFAULT
@@ -0,0 +1,169 @@
+"""
+Fallos de línea: pique sub-tick, registro con margen y revisión ("challenge").
+Diseño:
+- solve_contact(s0, s1, k)              -> Contact(t, x, y, vz) del pique dentro del tick, o None
+- LineJudge(court, size)                -> últimos `size` fallos en un ring buffer de arrays planos
+- LineJudge.call(contact, p0, t_ms, hitter, serve_box, touched_net) -> LineCall, ya registrado
+- LineJudge.last(i)                     -> CallRecord del i-ésimo fallo más reciente (0 = último)
+- LineJudge.review(i)                   -> Review en pantalla para DebugOverlays.show_challenge
+
+s0 / s1 son los estados (x, y, z, vx, vy, vz) antes y después del paso del integrador.
+El contacto sale de swept.ground_contact (la curva del tick con su aceleración), así
+que el punto fallado es el del arco también a 15 Hz: no hace falta subir SIM_HZ para
+fallar bien una pelota que pica sobre la línea.
+
+Cada fallo guarda el margen con signo a las líneas juzgadas (CourtModel.margin:
+> 0 adentro, < 0 afuera) y la posición al inicio del tick, que es lo que la revisión
+vuelve a dibujar. El buffer no aloca por pique: 8 doubles + 3 enteros por entrada.
+"""
+
+from array import array
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from engine.physics.swept import ground_contact, curve_at
+from engine.rules.court_model import CourtModel, LineCall
+from engine.utils.iso import BALL as CAMERA
+
+try:
+    from engine.config.court import CALL_LOG_SIZE, CLOSE_CALL
+except Exception:
+    CALL_LOG_SIZE, CLOSE_CALL = 256, 1.0
+
+VERDICTS = ("in", "out", "let")
+# Por entrada: t_ms, x, y, margen, x0, y0, z0 (inicio del tick), t (fracción del tick)
+_NF = 8
+# Alcance (mundo) de las líneas que se mandan a la revisión alrededor del pique
+_REVIEW_REACH = 60.0
+
+
+class Contact(NamedTuple):
+    t: float    # fracción del tick en que toca el piso
+    x: float
+    y: float
+    vz: float   # velocidad vertical en el contacto
+
+
+class CallRecord(NamedTuple):
+    t_ms: float
+    x: float
+    y: float
+    margin: float          # > 0 adentro, < 0 afuera (unidades de mundo)
+    verdict: str
+    label: str
+    code: int
+    start: Tuple[float, float, float]   # (x, y, z) al inicio del tick del pique
+    t: float
+
+
+class Review(NamedTuple):
+    """Fallo proyectado a pantalla (lo que dibuja DebugOverlays.show_challenge)."""
+    verdict: str
+    label: str
+    margin: float
+    spot: Tuple[float, float]                          # pique
+    path: Tuple[Tuple[float, float], ...]              # pelota: inicio del tick -> pique
+    shadow: Tuple[Tuple[float, float], ...]            # su sombra en el piso
+    lines: Tuple[Tuple[Tuple[float, float], ...], ...]  # líneas cercanas (polígonos)
+
+
+def solve_contact(s0: Sequence[float], s1: Sequence[float], k: float) -> Optional[Contact]:
+    """Pique dentro del tick s0 -> s1 (ticks de referencia k), o None si sigue en el aire."""
+    t = ground_contact(s0[2], s0[5], s1[2], s1[5], k)
+    if t is None:
+        return None
+    return Contact(t, curve_at(s0[0], s0[3], s1[0], s1[3], k, t),
+                   curve_at(s0[1], s0[4], s1[1], s1[4], k, t), s0[5] + (s1[5] - s0[5]) * t)
+
+
+class LineJudge:
+    def __init__(self, court: CourtModel, size: int = CALL_LOG_SIZE):
+        self.court = court
+        self.size = max(1, int(size))
+        self._f = array("d", bytes(8 * _NF * self.size))
+        self._code = array("H", bytes(2 * self.size))
+        self._verdict = array("B", bytes(self.size))
+        self._label = array("B", bytes(self.size))
+        self._labels: List[str] = []
+        self.head = 0        # próxima ranura a escribir
+        self.total = 0       # fallos registrados desde el arranque
+        self.close = 0       # de esos, con |margen| < CLOSE_CALL
+
+    def __len__(self) -> int:
+        return min(self.total, self.size)
+
+    # ---------------------------
+    # Fallo
+    # ---------------------------
+    def call(self, contact: Contact, p0: Sequence[float], t_ms: float,
+             hitter: Optional[str] = None, serve_box: Optional[str] = None,
+             touched_net: bool = False) -> LineCall:
+        """Falla el pique (CourtModel.call) y lo registra con su margen."""
+        court = self.court
+        result = court.call(contact.x, contact.y, hitter=hitter, serve_box=serve_box, touched_net=touched_net)
+        margin = court.margin(contact.x, contact.y, hitter=hitter, serve_box=serve_box)
+        self._record(t_ms, contact, margin, p0, result)
+        return result
+
+    def _record(self, t_ms: float, c: Contact, margin: float, p0: Sequence[float], call: LineCall) -> None:
+        i = self.head
+        b = i * _NF
+        f = self._f
+        f[b], f[b + 1], f[b + 2], f[b + 3] = t_ms, c.x, c.y, margin
+        f[b + 4], f[b + 5], f[b + 6], f[b + 7] = p0[0], p0[1], p0[2], c.t
+        self._code[i] = call.code
+        self._verdict[i] = VERDICTS.index(call.verdict)
+        self._label[i] = self._label_id(call.label)
+        self.head = (i + 1) % self.size
+        self.total += 1
+        if abs(margin) < CLOSE_CALL:
+            self.close += 1
+
+    def _label_id(self, label: str) -> int:
+        # Pocos textos distintos ("long", "wide", "deuce service box", ...): se internan
+        try:
+            return self._labels.index(label)
+        except ValueError:
+            self._labels.append(label)
+            return len(self._labels) - 1
+
+    # ---------------------------
+    # Consultas
+    # ---------------------------
+    def last(self, i: int = 0) -> Optional[CallRecord]:
+        """i-ésimo fallo más reciente (0 = el último); None si no hay tantos."""
+        if not 0 <= i < len(self):
+            return None
+        slot = (self.head - 1 - i) % self.size
+        b = slot * _NF
+        f = self._f
+        return CallRecord(f[b], f[b + 1], f[b + 2], f[b + 3], VERDICTS[self._verdict[slot]],
+                          self._labels[self._label[slot]], self._code[slot],
+                          (f[b + 4], f[b + 5], f[b + 6]), f[b + 7])
+
+    def review(self, i: int = 0, samples: int = 8) -> Optional[Review]:
+        """Fallo i proyectado a pantalla: tramo del tick hasta el pique y líneas cercanas."""
+        rec = self.last(i)
+        if rec is None:
+            return None
+        (x0, y0, z0), x, y = rec.start, rec.x, rec.y
+        pts = []
+        for j in range(samples + 1):
+            u = j / samples
+            pts.append((x0 + (x - x0) * u, y0 + (y - y0) * u, z0 * (1.0 - u)))
+        path = CAMERA.project_many(pts)
+        shadow = CAMERA.project_many([(px, py) for px, py, _ in pts])
+
+        court = self.court
+        hw = court.line_width * 0.5
+        lines = []
+        for (ax, ay), (bx, by) in court.lines():
+            if ay == by == court.net_y:
+                continue   # la red no es línea
+            lx0, lx1 = min(ax, bx) - hw, max(ax, bx) + hw
+            ly0, ly1 = min(ay, by) - hw, max(ay, by) + hw
+            if lx0 - _REVIEW_REACH > x or x > lx1 + _REVIEW_REACH or \
+               ly0 - _REVIEW_REACH > y or y > ly1 + _REVIEW_REACH:
+                continue
+            lines.append(tuple(CAMERA.project_many(((lx0, ly0), (lx1, ly0), (lx1, ly1), (lx0, ly1)))))
+
+        return Review(rec.verdict, rec.label, rec.margin, CAMERA.project(x, y), tuple(path), tuple(shadow), tuple(lines))
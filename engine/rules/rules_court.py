@@ -1,6 +1,8 @@
 """
 Reglas puras relacionadas al "court" (sin dependencias del juego).
 Útil para decidir si un pique fue dentro o fuera, con tolerancia al grosor de líneas.
+Trabaja en pantalla; el fallo de los piques de la pelota (mundo) está en
+engine/rules/court_model.py.
 """
 
 from typing import Tuple
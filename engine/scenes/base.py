@@ -0,0 +1,100 @@
+"""
+Pila de escenas (reemplaza el string estado_juego).
+Diseño:
+- Scene: handle_event(evento) / update(dt) -> alpha / draw(surface)
+- Scene.overlay = True  -> se dibuja sobre la escena de abajo congelada
+- Scene.idle = True     -> nada se anima solo: el loop puede esperar eventos
+- SceneStack.set(*s) / push(s) / pop() -> transiciones (on_enter / on_exit)
+
+Freeze-frame: la primera vez que se dibuja una escena overlay, la de abajo se
+renderiza UNA vez y se guarda en un Surface; los frames siguientes solo lo
+copian (pausa, victoria y game over no vuelven a dibujar la cancha).
+"""
+
+from typing import List, Optional
+
+import pygame
+
+
+class Scene:
+    name = ""
+    overlay = False
+    idle = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def on_enter(self) -> None:
+        pass
+
+    def on_exit(self) -> None:
+        pass
+
+    def handle_event(self, evento) -> None:
+        pass
+
+    def update(self, dt: float) -> float:
+        """Devuelve alpha de interpolación para el render (1.0 = sin interpolar)."""
+        return 1.0
+
+    def draw(self, surface: pygame.Surface) -> None:
+        pass
+
+
+class SceneStack:
+    def __init__(self):
+        self._stack: List[Scene] = []
+        self._frozen: Optional[pygame.Surface] = None
+        self.freeze_renders = 0   # veces que se re-capturó la escena de abajo
+
+    # ---------- Consulta ----------
+    @property
+    def top(self) -> Optional[Scene]:
+        return self._stack[-1] if self._stack else None
+
+    @property
+    def name(self) -> str:
+        return self._stack[-1].name if self._stack else ""
+
+    def __contains__(self, scene) -> bool:
+        return scene in self._stack
+
+    # ---------- Transiciones ----------
+    def set(self, *scenes: Scene) -> None:
+        """Vacía la pila y apila scenes (la última queda arriba)."""
+        while self._stack:
+            self._stack.pop().on_exit()
+        self._frozen = None
+        for s in scenes:
+            self.push(s)
+
+    def push(self, scene: Scene) -> None:
+        self._stack.append(scene)
+        self._frozen = None
+        scene.on_enter()
+
+    def pop(self) -> Optional[Scene]:
+        if not self._stack:
+            return None
+        scene = self._stack.pop()
+        self._frozen = None
+        scene.on_exit()
+        return scene
+
+    def invalidate(self) -> None:
+        """Fuerza re-capturar el freeze-frame (p.ej. al togglear overlays de debug)."""
+        self._frozen = None
+
+    # ---------- Render ----------
+    def draw(self, surface: pygame.Surface) -> None:
+        top = self.top
+        if top is None:
+            return
+        if top.overlay and len(self._stack) > 1:
+            if self._frozen is None or self._frozen.get_size() != surface.get_size():
+                self._stack[-2].draw(surface)
+                self._frozen = surface.copy()
+                self.freeze_renders += 1
+            else:
+                surface.blit(self._frozen, (0, 0))
+        top.draw(surface)
@@ -0,0 +1,195 @@
+"""
+Escenas del juego: menú, opciones, partida, pausa y resultado (victoria / game over).
+Las escenas son controladores finos: el estado y los helpers de dibujo siguen en Game.
+"""
+
+import pygame
+
+from engine.scenes.base import Scene
+from engine.utils.colors import AZUL_OSCURO, BLANCO
+from engine.utils.screen import ANCHO, ALTO
+
+
+class MenuScene(Scene):
+    name = "menu"
+
+    def handle_event(self, evento):
+        g = self.game
+        # Click de mouse en botones del menú
+        if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+            for btn in g._menu_buttons:
+                if btn.rect.collidepoint(evento.pos):
+                    g.audio.play_sound("ui_select")
+                    if btn.action == "start":
+                        g._start_match()
+                    elif btn.action == "drill":
+                        g._start_drill()
+                    elif btn.action == "options":
+                        g._enter_options()
+                    elif btn.action == "quit":
+                        pygame.event.post(pygame.event.Event(pygame.QUIT))
+                    break
+
+        # Navegación con teclado
+        elif evento.type == pygame.KEYDOWN:
+            # Atajos de modo 1P/2P
+            if evento.key == pygame.K_1:
+                g._set_mode("1P")
+            elif evento.key == pygame.K_2:
+                g._set_mode("2P")
+
+            elif evento.key in (pygame.K_UP, pygame.K_w):
+                g.menu_index = (g.menu_index - 1) % len(g.menu_items)
+                g.audio.play_sound("ui_move")
+            elif evento.key in (pygame.K_DOWN, pygame.K_s):
+                g.menu_index = (g.menu_index + 1) % len(g.menu_items)
+                g.audio.play_sound("ui_move")
+            elif evento.key in (pygame.K_RETURN, pygame.K_SPACE):
+                g.audio.play_sound("ui_select")
+                g._menu_select()
+            elif evento.key == pygame.K_ESCAPE:
+                g.audio.play_sound("ui_back")
+                g.running = False
+
+    def draw(self, surface):
+        surface.fill(AZUL_OSCURO)
+        self.game._draw_menu()
+
+
+class OptionsScene(Scene):
+    name = "opciones"
+
+    def handle_event(self, evento):
+        g = self.game
+        if evento.type == pygame.KEYDOWN:
+            handled = g._handle_options_input(evento.key)
+            if not handled and evento.key == pygame.K_ESCAPE:
+                g._cancel_options()
+
+        # --- Mouse: click en botones / sliders ---
+        elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+            # Botones
+            for btn in g._opt_buttons:
+                if btn.rect.collidepoint(evento.pos):
+                    g.audio.play_sound("ui_select")
+                    if btn.action == "opts_apply":
+                        g._apply_options()
+                        g._back_to_menu()
+                    elif btn.action == "opts_back":
+                        g._cancel_options()  # descarta cambios
+                    break
+
+            # Sliders: seleccionar fila y modificar SOLO valores locales
+            for name, rect in g._opt_bars.items():
+                if rect.collidepoint(evento.pos):
+                    g._opts_index = {"music": 1, "sfx": 2, "ui": 3}[name]
+                    rel = max(0.0, min(1.0, (evento.pos[0] - rect.left) / rect.width))
+                    g._opts_values[g._opts_index] = round(rel, 2)
+                    g._dragging_bar = name
+                    break
+
+        elif evento.type == pygame.MOUSEMOTION and g._dragging_bar:
+            rect = g._opt_bars[g._dragging_bar]
+            rel = max(0.0, min(1.0, (evento.pos[0] - rect.left) / rect.width))
+            idx = {"music": 1, "sfx": 2, "ui": 3}[g._dragging_bar]
+            g._opts_values[idx] = round(rel, 2)
+
+        elif evento.type == pygame.MOUSEBUTTONUP and evento.button == 1:
+            g._dragging_bar = None
+
+    def draw(self, surface):
+        surface.fill(AZUL_OSCURO)
+        self.game._draw_options()
+
+
+class IngameScene(Scene):
+    name = "jugando"
+    idle = False
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.alpha = 1.0
+
+    def handle_event(self, evento):
+        g = self.game
+        if evento.type != pygame.KEYDOWN:
+            return
+        # No aceptar entradas de gameplay durante el 3-2-1
+        if g._restart_block_input:
+            if evento.key == pygame.K_ESCAPE:
+                g._pause()
+            return
+
+        if evento.key == pygame.K_ESCAPE:
+            g._pause()
+
+        # DEBUG SFX (opcional)
+        if g.debug_audio:
+            g._handle_debug_sfx(evento.key)
+
+    def update(self, dt):
+        """Ticks fijos de simulación; el render interpola entre los dos últimos."""
+        g = self.game
+        teclas = pygame.key.get_pressed()
+        self.alpha = 1.0
+        for step_ms in g.sim.steps(dt):
+            g._sim_step(teclas, step_ms)
+            if g.scenes.top is not self:
+                return 1.0
+        self.alpha = g.sim.alpha
+        return self.alpha
+
+    def draw(self, surface):
+        surface.fill(AZUL_OSCURO)
+        self.game._render_ingame(self.alpha)
+
+
+class PauseScene(Scene):
+    name = "pausa"
+    overlay = True
+
+    def handle_event(self, evento):
+        g = self.game
+        if evento.type != pygame.KEYDOWN:
+            return
+        if evento.key in (pygame.K_ESCAPE, pygame.K_p):
+            if "ui_whoosh" in g.audio.sounds: g.audio.play_sound("ui_whoosh")
+            g.audio.play_sound("ui_back")
+            g.scenes.pop()
+            g.audio.unduck_music()
+        elif evento.key in (pygame.K_RETURN, pygame.K_BACKSPACE):
+            # Volver al menú desde PAUSA
+            if "ui_whoosh" in g.audio.sounds: g.audio.play_sound("ui_whoosh")
+            g.audio.play_sound("ui_back")
+            g._volver_al_menu()
+
+    def draw(self, surface):
+        self.game._draw_center_text("PAUSA (Esc/P: continuar, Enter: menú)")
+
+
+class ResultScene(Scene):
+    """Cartel final sobre la partida congelada (victoria o game over)."""
+    overlay = True
+
+    def __init__(self, game, victory: bool):
+        super().__init__(game)
+        self.victory = victory
+        self.name = "victoria" if victory else "gameover"
+
+    def handle_event(self, evento):
+        g = self.game
+        if evento.type == pygame.KEYDOWN:
+            if evento.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                g._reiniciar_partida()
+            elif evento.key == pygame.K_ESCAPE:
+                g._volver_al_menu()
+
+    def draw(self, surface):
+        g = self.game
+        overlay = pygame.Surface((ANCHO, ALTO), pygame.SRCALPHA)
+        overlay.fill((10, 40, 10, 180) if self.victory else (40, 10, 10, 180))
+        surface.blit(overlay, (0, 0))
+        t1 = g.font_title.render("¡VICTORIA!" if self.victory else "GAME OVER", True, BLANCO)
+        t2 = g.font_small.render("Enter: Reintentar   |   Esc: Volver al menú", True, BLANCO)
+        surface.blit(t1, t1.get_rect(center=(ANCHO // 2, ALTO // 2 - 20)))
+        surface.blit(t2, t2.get_rect(center=(ANCHO // 2, ALTO // 2 + 40)))
@@ -8,10 +8,11 @@ class ScoreManager:
     SCORES = {0: "0", 1: "15", 2: "30", 3: "40"}
     
 
-    def __init__(self, player1_name="P1", player2_name="P2", screen=None):
+    def __init__(self, player1_name="P1", player2_name="P2", screen=None, banners=None):
         self.player1_name = player1_name
         self.player2_name = player2_name
         self.screen = screen
+        self.banners = banners  # engine.ui.banner.Banners (cartel no bloqueante)
 
         self.reset_game()
         
@@ -38,9 +39,7 @@ class ScoreManager:
     def _check_game_end(self):
         p1 = self.p1_points
         p2 = self.p2_points
-        winner = None  
 
-        
         # Lógica de Deuce/Ventaja
         if p1 >= 3 and p2 >= 3:
             diff = abs(p1 - p2)
@@ -55,30 +54,15 @@ class ScoreManager:
         elif p2 >= 4:
             self.game_winner = self.player2_name
 
-            
-        if winner:
-            self.game_winner = winner
-            self._show_winner_message(winner)
+
+        if self.game_winner:
+            self._show_winner_message(self.game_winner)
 
     def _show_winner_message(self, winner: str):
-        """Muestra un mensaje en pantalla cuando alguien gana el game."""
+        """Anuncia el ganador del game: cartel temporal (no bloquea el loop) o consola."""
         print(f"🏆 ¡Game para {winner}!")
-
-        if not self.screen:
-            return  # Si no hay pantalla, solo muestra en consola
-
-        font = pygame.font.Font(None, 72)
-        text = font.render(f"🏆 ¡Game para {winner}!", True, (255, 255, 0))
-        rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
-
-        # Fondo semitransparente para resaltar el mensaje
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        self.screen.blit(text, rect)
-        pygame.display.flip()
-        pygame.time.delay(2000)  # Esperar 2 segundos antes de continuar
+        if self.banners is not None:
+            self.banners.show(f"¡Game para {winner}!", 2000)
 
 
     def get_score_str(self) -> str:
@@ -105,9 +89,13 @@ class ScoreManager:
         return f"{score1}-{score2}"
 
         
-    def draw_hud(self, screen, font):
-        """Dibuja la puntuación actual en pantalla con borde negro."""
-        score_text = self.get_score_str()
+    def draw_hud(self, screen, font, score_text=None, outline="full"):
+        """
+        Dibuja la puntuación en pantalla con borde negro (score_text: texto ya capturado).
+        outline: "full" = borde en 8 direcciones, "simple" = una sola sombra (governor de calidad).
+        """
+        if score_text is None:
+            score_text = self.get_score_str()
 
         # --- Colores ---
         text_color = (255, 255, 255)  # Blanco
@@ -120,8 +108,11 @@ class ScoreManager:
         rect = surf.get_rect(center=(screen.get_width() // 2, 40))
 
         # --- Dibujar borde (8 direcciones alrededor del texto) ---
-        for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2), (-2, -2), (-2, 2), (2, -2), (2, 2)]:
-            screen.blit(outline_surf, rect.move(dx, dy))
+        if outline == "simple":
+            screen.blit(outline_surf, rect.move(2, 2))
+        else:
+            for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2), (-2, -2), (-2, 2), (2, -2), (2, 2)]:
+                screen.blit(outline_surf, rect.move(dx, dy))
 
         # --- Dibujar texto principal ---
         screen.blit(surf, rect)
@@ -0,0 +1,19 @@
+"""
+Reloj de juego.
+Las ventanas de tiempo de la jugabilidad (swing, saque, cooldown de red, reacción
+de la IA) se miden en tiempo de SIMULACIÓN, no de pared: así la pausa las congela
+y el runner headless puede avanzar más rápido que el tiempo real.
+"""
+
+import pygame
+
+
+def now_ms(game=None) -> float:
+    """
+    Tiempo de simulación en ms del 'game' (FixedTimestep en game.sim).
+    Sin game/sim cae a pygame.time.get_ticks() (tiempo de pared).
+    """
+    sim = getattr(game, "sim", None)
+    if sim is not None:
+        return sim.time_ms
+    return pygame.time.get_ticks()
@@ -0,0 +1,79 @@
+"""
+Acumulador de paso fijo para la simulación.
+Diseño:
+- FixedTimestep.steps(dt_ms) -> itera una vez por cada tick de simulación pendiente
+- FixedTimestep.alpha        -> fracción [0..1] hacia el próximo tick (interpolación de render)
+- ref_ticks(dt_ms)           -> convierte ms a "ticks de referencia" (escala de velocidades)
+- FixedTimestep.time_scale   -> <1 slow-motion, >1 fast-forward (escala el tiempo real que entra)
+
+No tiene dependencias de pygame.
+"""
+
+from typing import Iterator, Optional
+
+try:
+    from engine.config.timing import SIM_REF_HZ, SIM_HZ, MAX_SIM_STEPS
+except Exception:
+    SIM_REF_HZ, SIM_HZ, MAX_SIM_STEPS = 15, 120, 8
+
+
+def ref_ticks(dt_ms: Optional[float]) -> float:
+    """
+    Cantidad de ticks de referencia (SIM_REF_HZ) que representan dt_ms.
+    None = exactamente un tick de referencia (comportamiento histórico por frame).
+    """
+    if dt_ms is None:
+        return 1.0
+    return float(dt_ms) * SIM_REF_HZ / 1000.0
+
+
+def lerp(a: float, b: float, t: float) -> float:
+    return a + (b - a) * t
+
+
+class FixedTimestep:
+    def __init__(self, hz: float = SIM_HZ, max_steps: int = MAX_SIM_STEPS):
+        self.hz = max(1.0, float(hz))
+        self.step_ms = 1000.0 / self.hz
+        self.max_steps = max(1, int(max_steps))
+
+        self.accum_ms = 0.0    # tiempo real pendiente de simular
+        self.time_ms = 0.0     # tiempo de simulación acumulado
+        self.ticks = 0         # ticks de simulación ejecutados
+        self.dropped_ms = 0.0  # atraso descartado por superar max_steps
+        self.time_scale = 1.0  # ms de simulación por ms real
+
+    def steps(self, dt_ms: float) -> Iterator[float]:
+        """
+        Suma dt_ms al acumulador y produce step_ms por cada tick a simular.
+        Si el atraso supera max_steps ticks, se descarta el resto: la simulación
+        se ralentiza en vez de bloquear el render (costo por frame acotado).
+        """
+        self.accum_ms += max(0.0, float(dt_ms)) * self.time_scale
+        n = 0
+        while self.accum_ms >= self.step_ms:
+            if n >= self.max_steps:
+                rest = self.accum_ms % self.step_ms
+                self.dropped_ms += self.accum_ms - rest
+                self.accum_ms = rest
+                return
+            self.accum_ms -= self.step_ms
+            self.time_ms += self.step_ms
+            self.ticks += 1
+            n += 1
+            yield self.step_ms
+
+    def advance(self) -> float:
+        """Un tick sin pasar por el acumulador (headless / fast-forward)."""
+        self.time_ms += self.step_ms
+        self.ticks += 1
+        return self.step_ms
+
+    @property
+    def alpha(self) -> float:
+        """Fracción del tick en curso ya transcurrida (0 = último tick, 1 = próximo)."""
+        return max(0.0, min(1.0, self.accum_ms / self.step_ms))
+
+    def reset(self) -> None:
+        """Descarta el tiempo pendiente (p.ej. al salir de pausa o del menú)."""
+        self.accum_ms = 0.0
@@ -0,0 +1,111 @@
+"""
+Ritmo de frames (frame pacing) seleccionable.
+Modos:
+- "tick"            -> Clock.tick(fps): duerme hasta el próximo frame (bajo CPU, más jitter)
+- "tick_busy_loop"  -> Clock.tick_busy_loop(fps): espera activa, jitter muy bajo
+- "uncapped"        -> sin límite (benchmark de throughput máximo)
+- "vsync"           -> set_mode(..., vsync=1); el flip sincroniza con el monitor
+
+FramePacer.tick() devuelve el dt real del frame (ms, float) medido con perf_counter
+y acumula estadísticas de jitter para comparar modos en cada máquina.
+"""
+
+import statistics
+import time
+from collections import deque
+from typing import Dict, Tuple
+
+import pygame
+
+PACING_MODES = ("tick", "tick_busy_loop", "uncapped", "vsync")
+
+
+def open_display(size: Tuple[int, int], mode: str = "tick") -> Tuple[pygame.Surface, str]:
+    """
+    Crea la ventana según el modo de pacing. Si vsync no está disponible
+    (driver, versión de pygame), cae a una ventana normal con modo "tick".
+    Devuelve (surface, modo_efectivo).
+    """
+    if mode == "vsync":
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1), "vsync"
+        except (pygame.error, TypeError) as e:
+            print(f"[Pacing] vsync no disponible ({e}), usando 'tick'")
+            mode = "tick"
+    return pygame.display.set_mode(size), mode
+
+
+class FramePacer:
+    def __init__(self, mode: str = "tick", fps: int = 60, window: int = 240, report_every_ms: int = 0):
+        if mode not in PACING_MODES:
+            print(f"[Pacing] modo inválido '{mode}', usando 'tick'")
+            mode = "tick"
+        self.mode = mode
+        self.fps = max(0, int(fps))
+        self.clock = pygame.time.Clock()
+
+        self._samples: deque = deque(maxlen=max(8, int(window)))
+        self._last = time.perf_counter()
+        self.report_every_ms = int(report_every_ms)
+        self._since_report_ms = 0.0
+
+    def tick(self, record: bool = True) -> float:
+        """
+        Espera según el modo y devuelve el dt real del frame en ms.
+        record=False no suma el frame a las estadísticas (frames idle).
+        """
+        if self.mode == "tick":
+            self.clock.tick(self.fps)
+        elif self.mode == "tick_busy_loop":
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            # uncapped: sin espera; vsync: la espera ocurre en display.flip()
+            self.clock.tick()
+
+        now = time.perf_counter()
+        dt_ms = (now - self._last) * 1000.0
+        self._last = now
+        if not record:
+            return dt_ms
+        self._samples.append(dt_ms)
+
+        if self.report_every_ms > 0:
+            self._since_report_ms += dt_ms
+            if self._since_report_ms >= self.report_every_ms:
+                self._since_report_ms = 0.0
+                self.report()
+        return dt_ms
+
+    def resync(self) -> None:
+        """Reinicia la referencia de tiempo (p.ej. tras una espera larga fuera del loop)."""
+        self._last = time.perf_counter()
+
+    # ---------------------------
+    # Estadísticas
+    # ---------------------------
+    def stats(self) -> Dict[str, float]:
+        """
+        frame_ms: media, jitter_ms: desvío estándar, p50/p99 en ms, fps medidos.
+        """
+        s = list(self._samples)
+        if len(s) < 2:
+            return {"frame_ms": 0.0, "jitter_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "fps": 0.0}
+        mean = statistics.fmean(s)
+        ordered = sorted(s)
+        p50 = ordered[len(ordered) // 2]
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return {
+            "frame_ms": mean,
+            "jitter_ms": statistics.pstdev(s),
+            "p50_ms": p50,
+            "p99_ms": p99,
+            "fps": 1000.0 / mean if mean > 0 else 0.0,
+        }
+
+    def report(self) -> None:
+        if len(self._samples) < 2:
+            print(f"[Pacing] modo={self.mode} sin muestras (solo frames idle)")
+            return
+        st = self.stats()
+        print(f"[Pacing] modo={self.mode} fps={st['fps']:.1f} frame={st['frame_ms']:.2f}ms "
+              f"jitter(σ)={st['jitter_ms']:.2f}ms p50={st['p50_ms']:.2f}ms p99={st['p99_ms']:.2f}ms")
@@ -0,0 +1,101 @@
+"""
+Temporizadores centralizados sobre un reloj de juego (heap de vencimientos).
+Diseño:
+- Scheduler.schedule(delay_ms, cb, *args) -> TimerHandle (cb(*args) al vencer)
+- Scheduler.cancel(handle)                -> lo anula (borrado perezoso, O(1))
+- Scheduler.advance(dt_ms) / advance_to(t) -> dispara los vencidos en orden
+
+Cada avance cuesta O(vencidos · log n), no O(objetos): nadie consulta el reloj
+por frame. El reloj lo maneja quien avanza el scheduler: Game.timers sigue el
+tiempo de simulación (se congela en pausa, escala con time_scale) y
+Game.ui_timers el tiempo de frame (audio, overlays, cuenta regresiva).
+
+No tiene dependencias de pygame.
+"""
+
+import heapq
+from typing import Callable, List
+
+
+class TimerHandle:
+    __slots__ = ("due_ms", "seq", "callback", "args", "active")
+
+    def __init__(self, due_ms: float, seq: int, callback: Callable, args: tuple):
+        self.due_ms = due_ms
+        self.seq = seq
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def __lt__(self, other: "TimerHandle") -> bool:
+        # Mismo vencimiento → orden de alta (FIFO)
+        return (self.due_ms, self.seq) < (other.due_ms, other.seq)
+
+
+class Scheduler:
+    def __init__(self, now_ms: float = 0.0):
+        self.now_ms = float(now_ms)
+        self._heap: List[TimerHandle] = []
+        self._seq = 0
+        self._cancelled = 0
+
+    # ---------- API ----------
+    def schedule(self, delay_ms: float, callback: Callable, *args) -> TimerHandle:
+        """Ejecuta callback(*args) dentro de delay_ms (tiempo de este scheduler)."""
+        return self.schedule_at(self.now_ms + max(0.0, float(delay_ms)), callback, *args)
+
+    def schedule_at(self, due_ms: float, callback: Callable, *args) -> TimerHandle:
+        self._seq += 1
+        h = TimerHandle(float(due_ms), self._seq, callback, args)
+        heapq.heappush(self._heap, h)
+        return h
+
+    def cancel(self, handle) -> None:
+        """Anula un timer pendiente (None o ya vencido: no hace nada)."""
+        if handle is None or not handle.active:
+            return
+        handle.active = False
+        self._cancelled += 1
+        # Compactar si la mitad del heap son timers anulados
+        if self._cancelled > 32 and self._cancelled * 2 > len(self._heap):
+            self._heap = [h for h in self._heap if h.active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def remaining(self, handle) -> float:
+        """ms hasta que venza handle (0 si ya venció o fue anulado)."""
+        if handle is None or not handle.active:
+            return 0.0
+        return max(0.0, handle.due_ms - self.now_ms)
+
+    def advance(self, dt_ms: float) -> int:
+        return self.advance_to(self.now_ms + max(0.0, float(dt_ms)))
+
+    def advance_to(self, t_ms: float) -> int:
+        """
+        Mueve el reloj a t_ms y dispara los vencidos. Un callback puede
+        reprogramar timers: si vencen dentro de este mismo avance, también corren.
+        Devuelve la cantidad de callbacks ejecutados.
+        """
+        if t_ms > self.now_ms:
+            self.now_ms = float(t_ms)
+        heap = self._heap
+        fired = 0
+        while heap and heap[0].due_ms <= self.now_ms:
+            h = heapq.heappop(heap)
+            if not h.active:
+                self._cancelled -= 1
+                continue
+            h.active = False
+            h.callback(*h.args)
+            fired += 1
+        return fired
+
+    def clear(self) -> None:
+        for h in self._heap:
+            h.active = False
+        self._heap.clear()
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
@@ -0,0 +1,70 @@
+import pygame
+
+
+class Banners:
+    """
+    Carteles temporales no bloqueantes ("¡Game para P1!").
+    show(texto, ms) lo muestra encima de todo durante ms; nunca detiene el loop.
+    Con un scheduler (timers) el vencimiento es un timer; sin él, update(dt) lo descuenta.
+    """
+    def __init__(self, timers=None, on_change=None):
+        self.timers = timers
+        self.on_change = on_change   # p.ej. pedir redraw en modo idle
+        self.text = None
+        self.color = (255, 255, 0)
+        self._remaining = 0
+        self._timer = None
+        self._font = None
+
+    @property
+    def active(self):
+        return self.text is not None
+
+    def show(self, text, ms=2000, color=(255, 255, 0)):
+        self.text = str(text)
+        self.color = color
+        self._remaining = int(ms)
+        if self.timers is not None:
+            self.timers.cancel(self._timer)
+            self._timer = self.timers.schedule(ms, self.hide)
+        if self.on_change:
+            self.on_change()
+
+    def hide(self):
+        if self.timers is not None:
+            self.timers.cancel(self._timer)
+        self._timer = None
+        self.text = None
+        self._remaining = 0
+        if self.on_change:
+            self.on_change()
+
+    def update(self, dt_ms):
+        if not self.active or self.timers is not None:
+            return
+        self._remaining = max(0, self._remaining - int(dt_ms))
+        if self._remaining == 0:
+            self.hide()
+
+    def snapshot(self):
+        """(texto, color) o None, para el hilo de render."""
+        return (self.text, self.color) if self.active else None
+
+    def draw(self, surface: pygame.Surface, banner=None):
+        """banner: snapshot() previo; None = estado actual."""
+        if banner is None:
+            banner = self.snapshot()
+        if banner is None:
+            return
+        text, color = banner
+        if self._font is None:
+            self._font = pygame.font.Font(None, 72)
+        W, H = surface.get_width(), surface.get_height()
+
+        t = self._font.render(text, True, color)
+        rect = t.get_rect(center=(W // 2, H // 3))
+        # Franja semitransparente para resaltar el mensaje
+        band = pygame.Surface((W, rect.height + 24), pygame.SRCALPHA)
+        band.fill((0, 0, 0, 150))
+        surface.blit(band, (0, rect.top - 12))
+        surface.blit(t, rect)
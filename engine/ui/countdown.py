@@ -5,39 +5,66 @@ class RestartCountdown:
     Overlay de cuenta regresiva simple (3-2-1) en ms.
     Llamar a start() para iniciar. update(dt) y draw(surface) en cada frame.
     Cuando termina, dispara el callback on_finished().
+    Con un scheduler (timers) el fin es un timer programado y update() no hace nada.
     """
-    def __init__(self, on_finished, total_ms=3000):
+    def __init__(self, on_finished, total_ms=3000, timers=None):
         self.on_finished = on_finished
         self.total_ms = int(total_ms)
-        self.remaining = 0
+        self._remaining = 0
         self.active = False
+        self.timers = timers
+        self._timer = None
         self._font_big = pygame.font.Font(None, 140)
         self._font_small = pygame.font.Font(None, 36)
 
     def start(self, total_ms=None):
         if total_ms is not None:
             self.total_ms = int(total_ms)
-        self.remaining = self.total_ms
+        self._remaining = self.total_ms
         self.active = True
+        if self.timers is not None:
+            self.timers.cancel(self._timer)
+            self._timer = self.timers.schedule(self.total_ms, self._finish)
 
     def cancel(self):
         self.active = False
-        self.remaining = 0
+        self._remaining = 0
+        if self.timers is not None:
+            self.timers.cancel(self._timer)
+            self._timer = None
 
-    def update(self, dt_ms):
+    @property
+    def remaining(self):
         if not self.active:
+            return 0
+        if self.timers is not None:
+            return int(self.timers.remaining(self._timer))
+        return self._remaining
+
+    def update(self, dt_ms):
+        if not self.active or self.timers is not None:
             return
-        self.remaining = max(0, self.remaining - int(dt_ms))
-        if self.remaining == 0:
-            self.active = False
-            if self.on_finished:
-                self.on_finished()
+        self._remaining = max(0, self._remaining - int(dt_ms))
+        if self._remaining == 0:
+            self._finish()
 
-    def draw(self, surface: pygame.Surface, msg_top="Reiniciando partida"):
-        if not self.active:
+    def _finish(self):
+        self._timer = None
+        self.active = False
+        self._remaining = 0
+        if self.on_finished:
+            self.on_finished()
+
+    def draw(self, surface: pygame.Surface, msg_top="Reiniciando partida", remaining=None):
+        """remaining: ms a mostrar (snapshot del hilo de render); None = estado actual."""
+        if remaining is None:
+            if not self.active:
+                return
+            remaining = self.remaining
+        elif remaining <= 0:
             return
         # número actual (ceil de segundos restantes)
-        secs = max(1, (self.remaining + 999) // 1000)
+        secs = max(1, (int(remaining) + 999) // 1000)
         W, H = surface.get_width(), surface.get_height()
 
         # oscurecer fondo sutil
@@ -0,0 +1,123 @@
+"""
+Proyección isométrica del motor: una sola transformación mundo -> pantalla.
+Diseño:
+- Camera(ox, oy)                   -> afín 2×3 precalculada + elevación por z
+- Camera.project(x, y, z=0)        -> (sx, sy) de un punto
+- Camera.project_many(points)      -> [(sx, sy), ...] para tuplas (x, y) o (x, y, z)
+- Camera.project_arrays(x, y, z)   -> (sx, sy) con arrays de NumPy (broadcast)
+- Camera.unproject(sx, sy)         -> (x, y) en el piso (z = 0)
+- Camera.cached(entity, x, y, z)   -> posición en pantalla de una entidad (Ball, Player),
+                                      recalculada solo si (x, y, z) cambió desde la última
+- WORLD / BALL                     -> cámara sin offset (jugadores) y con el anclaje de la pelota
+- world_to_screen / screen_to_world / to_pixels / ANCHO / ALTO  (lo que reexporta utils/screen.py)
+
+La transformación es
+    sx = a·x + b·y + ox
+    sy = c·x + d·y - lift·z + oy
+con (a, b, c, d) = (1, -1, 0.5, 0.5): la misma cuenta que hacían a mano Ball, Field
+y los fallos de línea, con los mismos redondeos (a·x + b·y da exactamente x - y).
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # project_arrays necesita NumPy; el resto no
+    np = None
+
+ANCHO, ALTO = 800, 600
+
+# Ejes isométricos: +x de mundo va abajo a la derecha, +y abajo a la izquierda
+ISO_A, ISO_B, ISO_C, ISO_D = 1.0, -1.0, 0.5, 0.5
+
+
+class Camera:
+    __slots__ = ("a", "b", "c", "d", "ox", "oy", "lift", "_ia", "_ib")
+
+    def __init__(self, ox: float = 0.0, oy: float = 0.0, lift: float = 1.0,
+                 a: float = ISO_A, b: float = ISO_B, c: float = ISO_C, d: float = ISO_D):
+        self.a, self.b, self.c, self.d = a, b, c, d
+        self.ox, self.oy, self.lift = ox, oy, lift
+        # Fila x de la inversa de la parte lineal (para el piso); y sale de x, ver unproject
+        det = a * d - b * c
+        self._ia, self._ib = d / det, -b / det
+
+    def matrix(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+        """Afín 2×3 (fila sx, fila sy) sin la elevación."""
+        return (self.a, self.b, self.ox), (self.c, self.d, self.oy)
+
+    def shifted(self, dx: float, dy: float) -> "Camera":
+        """Misma proyección con el origen corrido (dx, dy) píxeles."""
+        return Camera(self.ox + dx, self.oy + dy, self.lift, self.a, self.b, self.c, self.d)
+
+    # ---------------------------
+    # Escalar / lotes
+    # ---------------------------
+    def project(self, x: float, y: float, z: float = 0.0) -> Tuple[float, float]:
+        return (self.a * x + self.b * y + self.ox,
+                self.c * x + self.d * y - self.lift * z + self.oy)
+
+    def project_many(self, points: Iterable[Sequence[float]]) -> List[Tuple[float, float]]:
+        a, b, c, d, ox, oy, lift = self.a, self.b, self.c, self.d, self.ox, self.oy, self.lift
+        out = []
+        for p in points:
+            x, y = p[0], p[1]
+            z = p[2] if len(p) > 2 else 0.0
+            out.append((a * x + b * y + ox, c * x + d * y - lift * z + oy))
+        return out
+
+    def project_arrays(self, x, y, z=0.0):
+        """x, y, z: arrays (o escalares) de NumPy que se puedan combinar por broadcast."""
+        if np is None:
+            raise RuntimeError("project_arrays necesita NumPy")
+        x, y, z = np.asarray(x, dtype=float), np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+        return (self.a * x + self.b * y + self.ox,
+                self.c * x + self.d * y - self.lift * z + self.oy)
+
+    def unproject(self, sx: float, sy: float) -> Tuple[float, float]:
+        u, v = sx - self.ox, sy - self.oy
+        x = self._ia * u + self._ib * v
+        # y despejada de la fila sx (la cuenta de siempre: y = x - iso_x), no de la inversa:
+        # así el saque cae exactamente donde caía
+        if self.b != 0.0:
+            return x, (u - self.a * x) / self.b
+        return x, (v - self.c * x) / self.d
+
+    # ---------------------------
+    # Cache por entidad
+    # ---------------------------
+    def cached(self, entity, x: float, y: float, z: float = 0.0) -> Tuple[float, float]:
+        """
+        (sx, sy) de la entidad en (x, y, z). entity._screen guarda la última proyección
+        con la posición que la generó (empieza en None): si la entidad no se movió desde
+        entonces (la posición es la clave: no hace falta marcar dirty en cada escritura)
+        no se vuelve a proyectar. Cada entidad se proyecta siempre con la misma cámara.
+        """
+        c = entity._screen
+        if c is not None and c[0] == x and c[1] == y and c[2] == z:
+            return c[3]
+        s = self.project(x, y, z)
+        entity._screen = (x, y, z, s)
+        return s
+
+
+# Jugadores / utilidades: proyección pura. Pelota, líneas y red: anclada en (ANCHO/2, ALTO/3)
+WORLD = Camera()
+BALL = Camera(ANCHO // 2, ALTO // 3)
+
+
+# ---------------------------
+# API histórica (utils/screen.py)
+# ---------------------------
+def world_to_screen(x: float, y: float) -> Tuple[float, float]:
+    return WORLD.project(x, y)
+
+
+def screen_to_world(iso_x: float, iso_y: float) -> Tuple[float, float]:
+    return WORLD.unproject(iso_x, iso_y)
+
+
+def to_pixels(iso_x: float, iso_y: float, scale: float,
+              offset_x: int = ANCHO // 2, offset_y: int = ALTO // 2) -> Tuple[int, int]:
+    """Convierte coordenadas isométricas a coordenadas de pantalla (píxeles)."""
+    return int(offset_x + iso_x * scale), int(offset_y + iso_y * scale)
@@ -0,0 +1,85 @@
+"""
+Streams de números aleatorios por subsistema, con semilla.
+Diseño:
+- stream(name)      -> Stream (random.Random) del subsistema: "ball", "player", "drill", "audio", ...
+- seed_all(seed)    -> resiembra todos los streams desde una semilla maestra
+- positions(names)  -> cuántos números sacó cada stream (para el hash del mundo)
+- master_seed()     -> semilla maestra en uso
+
+Cada stream se siembra con (semilla maestra, nombre), así que agregar un stream o
+sacar más números en uno (p.ej. variaciones de audio) no corre la secuencia de los
+demás. Sin seed_all la semilla sale de VJ2D_SEED o, si no está, del sistema
+(partidas distintas cada vez, como antes).
+
+Reemplaza al módulo global `random` en la jugabilidad: dos corridas con la misma
+semilla y las mismas entradas sacan exactamente los mismos números.
+"""
+
+import os
+import random
+import zlib
+from typing import Dict, Iterable, Tuple
+
+
+class Stream(random.Random):
+    """random.Random que cuenta los números que entregó (su "posición")."""
+
+    def __init__(self, name: str, seed: int):
+        self.name = name
+        self.draws = 0
+        super().__init__(seed)
+
+    def seed(self, a=None, version=2):
+        self.draws = 0
+        super().seed(a, version)
+
+    def random(self) -> float:
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        return super().getrandbits(k)
+
+
+def _env_seed() -> int:
+    raw = os.environ.get("VJ2D_SEED")
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            return zlib.crc32(raw.encode("utf-8"))
+    return random.SystemRandom().getrandbits(32)
+
+
+_MASTER = _env_seed()
+_STREAMS: Dict[str, Stream] = {}
+
+
+def _derive(name: str) -> int:
+    return (_MASTER * 0x9E3779B1 + zlib.crc32(name.encode("utf-8"))) & 0xFFFFFFFFFFFF
+
+
+def stream(name: str) -> Stream:
+    """Stream del subsistema (se crea la primera vez, ya sembrado)."""
+    s = _STREAMS.get(name)
+    if s is None:
+        s = _STREAMS[name] = Stream(name, _derive(name))
+    return s
+
+
+def seed_all(seed: int) -> None:
+    """Nueva semilla maestra: todos los streams (los que existen y los futuros) vuelven al inicio."""
+    global _MASTER
+    _MASTER = int(seed)
+    for name, s in _STREAMS.items():
+        s.seed(_derive(name))
+
+
+def master_seed() -> int:
+    return _MASTER
+
+
+def positions(names: Iterable[str]) -> Tuple[int, ...]:
+    """Números sacados por cada stream (0 si todavía no existe)."""
+    return tuple(_STREAMS[n].draws if n in _STREAMS else 0 for n in names)
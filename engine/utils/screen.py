@@ -1,9 +1,8 @@
 ANCHO, ALTO = 800, 600
 SCALE = 50
 
-# Intentamos reutilizar la proyección centralizada del motor.
-# Si todavía no existe engine/utils/iso.py o falla el import por paths,
-# usamos las funciones locales (no se rompe nada).
+# La proyección del motor vive en engine/utils/iso.py (Camera WORLD / BALL).
+# Si falla el import por paths, usamos las funciones locales (no se rompe nada).
 try:
     from engine.utils.iso import world_to_screen, screen_to_world, to_pixels, ANCHO, ALTO  # reexport
 except Exception: